@@ -6,19 +6,55 @@ Génère des jeux de données synthétiques avec 3 niveaux de difficulté:
 - FACILE: Beaucoup de marge (slack élevé)
 - MOYEN: Marge modérée
 - DIFFICILE: Très peu de marge (contraintes serrées)
+
+Grandes instances (stream_to_csv, generate_instances): les projets sont tirés
+par blocs avec NumPy et écrits directement dans le CSV, la mémoire reste bornée
+par la taille d'un bloc quel que soit le nombre de tâches. Plusieurs instances
+(une par graine) sont générées en parallèle, une par processus:
+
+    python generator.py --projects 500000 --machines 200 --output big.csv
+    python generator.py --projects 1000 --chain-length 5 --seeds 0 1 2 3 --output-dir instances/
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
 import random
 import csv
+import sys
+import time
 from collections import namedtuple
 from typing import List, Dict, Tuple
 from datetime import datetime
 
+import numpy as np
+
+
+# Nombre de tâches tirées et écrites par bloc (stream_to_csv)
+CHUNK_TASKS = 131072
+
+CSV_FIELDS = ['task_name', 'duration', 'successors', 'release_date', 'due_date']
+
+
+def project_label(index: int) -> str:
+    """
+    Identifiant d'un projet à la manière des colonnes d'un tableur
+    
+    0 -> 'a', 25 -> 'z', 26 -> 'aa', 701 -> 'zz', 702 -> 'aaa'...
+    """
+    label = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(97 + remainder) + label
+    return label
+
 
 class SchedulingDatasetGenerator:
     """
     Générateur de jeux de données pour l'ordonnancement sur machines parallèles.
-    Chaque projet consiste en une paire de tâches (task_X_1 -> task_X_2).
+    Chaque projet consiste en une paire de tâches (task_X_1 -> task_X_2), ou en
+    une chaîne de chain_length tâches pour les grandes instances (stream_to_csv).
     """
     
     # Niveaux de difficulté prédéfinis
@@ -57,7 +93,9 @@ class SchedulingDatasetGenerator:
         if seed is None:
             seed = int(datetime.now().timestamp() * 1000) % (2**32)
         
-        random.seed(seed)
+        # Générateur privé: la graine ne modifie pas l'état global du module random
+        # (même suite de tirages que random.seed(seed), les jeux existants sont reproduits)
+        self.rng = random.Random(seed)
         self.current_seed = seed
         
         # Structure des données de tâche
@@ -88,16 +126,16 @@ class SchedulingDatasetGenerator:
         """
         tasks = {}
         
-        # Générer les identifiants de projets: a, b, c, d, ...
-        project_ids = [chr(97 + i) for i in range(num_pairs)]
+        # Générer les identifiants de projets: a, b, ..., z, aa, ab, ...
+        project_ids = [project_label(i) for i in range(num_pairs)]
         
         for project_id in project_ids:
             # Générer les durées des deux tâches du projet
-            duration_1 = random.randint(min_duration, max_duration)
-            duration_2 = random.randint(min_duration, max_duration)
+            duration_1 = self.rng.randint(min_duration, max_duration)
+            duration_2 = self.rng.randint(min_duration, max_duration)
             
             # Date de disponibilité de la première tâche
-            release_1 = random.randint(0, time_horizon // 4)
+            release_1 = self.rng.randint(0, time_horizon // 4)
             
             # La deuxième tâche peut commencer après la fin de la première
             min_start_2 = release_1 + duration_1
@@ -154,6 +192,91 @@ class SchedulingDatasetGenerator:
         print("[DIFFICILE] Generation d'un jeu de donnees DIFFICILE...")
         return self.generate_dataset(**self.DIFFICILE)
     
+    def stream_to_csv(
+        self,
+        filename: str,
+        num_projects: int,
+        num_machines: int,
+        chain_length: int = 2,
+        min_duration: int = 20,
+        max_duration: int = 100,
+        slack_factor: float = 0.3,
+        time_horizon: int = 1000,
+        chunk_tasks: int = CHUNK_TASKS
+    ) -> int:
+        """
+        Génère une grande instance directement dans un fichier CSV.
+        
+        Chaque projet est une chaîne task_X_1 -> ... -> task_X_<chain_length>, avec
+        les règles de generate_dataset: première tâche disponible dans
+        [0, time_horizon / 4], chaque tâche disponible à la fin au plus tôt de la
+        précédente, échéance = disponibilité + durée restante de la chaîne + marge
+        (slack_factor × durée totale), bornée par time_horizon.
+        
+        Les tirages sont vectorisés (NumPy, générateur privé initialisé par la
+        graine) et faits par blocs d'environ chunk_tasks tâches: la mémoire utilisée
+        ne dépend pas de la taille de l'instance. Pour une même graine, l'instance
+        diffère de celle de generate_dataset (autre générateur aléatoire).
+        
+        Args:
+            filename: Fichier CSV de sortie (format de save_to_csv)
+            num_projects: Nombre de projets (chaînes)
+            num_machines: Nombre de machines disponibles
+            chain_length: Nombre de tâches par projet
+            min_duration, max_duration, slack_factor, time_horizon: cf. generate_dataset
+            chunk_tasks: Nombre de tâches tirées et écrites à la fois (projets entiers)
+            
+        Returns:
+            int: nombre de tâches écrites
+        """
+        if chain_length < 1:
+            raise ValueError("chain_length must be at least 1")
+        rng = np.random.default_rng(self.current_seed)
+        ranks = [str(k) for k in range(1, chain_length + 1)]
+        chunk_projects = max(1, chunk_tasks // chain_length)
+        
+        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDS)
+            
+            for first in range(0, num_projects, chunk_projects):
+                count = min(chunk_projects, num_projects - first)
+                durations = rng.integers(min_duration, max_duration + 1, size=(count, chain_length))
+                first_release = rng.integers(0, time_horizon // 4 + 1, size=count)
+                
+                # Disponibilité: fin au plus tôt de la tâche précédente de la chaîne
+                ends = np.cumsum(durations, axis=1)
+                releases = first_release[:, None] + ends - durations
+                # Durée restante de la chaîne (tâche comprise) et marge du projet
+                remaining = ends[:, -1:] - ends + durations
+                slack = (ends[:, -1] * slack_factor).astype(np.int64)
+                dues = np.minimum(releases + remaining + slack[:, None], time_horizon)
+                
+                writer.writerows(self._chain_rows(
+                    first, ranks, durations.tolist(), releases.tolist(), dues.tolist()
+                ))
+            
+            writer.writerow([''] * len(CSV_FIELDS))
+            writer.writerow(['MACHINES', ','.join(f"m_{i+1}" for i in range(num_machines)), '', '', ''])
+        
+        return num_projects * chain_length
+    
+    @staticmethod
+    def _chain_rows(first, ranks, durations, releases, dues):
+        """Lignes CSV d'un bloc de projets (cf. stream_to_csv)"""
+        last = len(ranks) - 1
+        for offset, (project_durations, project_releases, project_dues) in enumerate(
+                zip(durations, releases, dues)):
+            prefix = f"task_{project_label(first + offset)}_"
+            for k, rank in enumerate(ranks):
+                yield (
+                    prefix + rank,
+                    project_durations[k],
+                    prefix + ranks[k + 1] if k < last else "none",
+                    project_releases[k],
+                    project_dues[k],
+                )
+    
     def save_to_csv(
         self,
         tasks: Dict,
@@ -169,8 +292,7 @@ class SchedulingDatasetGenerator:
             filename: Nom du fichier CSV de sortie
         """
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['task_name', 'duration', 'successors', 'release_date', 'due_date']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDS)
             
             writer.writeheader()
             
@@ -244,7 +366,7 @@ class SchedulingDatasetGenerator:
         
         print(f"\nTaches:")
         print(f"   - Nombre total de taches: {len(tasks)}")
-        print(f"   - Nombre de projets (paires): {len(tasks) // 2}")
+        print(f"   - Nombre de projets: {sum(1 for name in tasks if name.endswith('_1'))}")
         
         durations = [task.duration for task in tasks.values()]
         print(f"\nDurees:")
@@ -280,6 +402,80 @@ class SchedulingDatasetGenerator:
         print("\n" + "="*60 + "\n")
 
 
+def generate_instance_file(seed: int, filename: str, **params) -> Tuple[int, str, int, float]:
+    """
+    Génère une instance (cf. stream_to_csv) avec sa propre graine.
+    
+    Returns:
+        (graine, fichier, nombre de tâches, durée en secondes)
+    """
+    started = time.perf_counter()
+    count = SchedulingDatasetGenerator(seed).stream_to_csv(filename, **params)
+    return seed, filename, count, time.perf_counter() - started
+
+
+def generate_instances(seeds, directory: str, jobs: int = None, prefix: str = 'instance', **params):
+    """
+    Génère une instance par graine en parallèle (un processus par instance).
+    
+    Chaque fichier <prefix>_<graine>.csv ne dépend que de sa graine et des
+    paramètres: le résultat est le même quel que soit le nombre de processus.
+    
+    Args:
+        seeds: Graines des instances
+        directory: Répertoire de sortie (créé au besoin)
+        jobs: Nombre de processus (None = nombre de cœurs)
+        prefix: Préfixe des noms de fichiers
+        **params: Paramètres de stream_to_csv (num_projects, num_machines, chain_length...)
+        
+    Returns:
+        list: (graine, fichier, nombre de tâches, durée) dans l'ordre des graines
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    seeds = list(seeds)
+    filenames = [str(Path(directory) / f"{prefix}_{seed}.csv") for seed in seeds]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(generate_instance_file, seed, filename, **params)
+            for seed, filename in zip(seeds, filenames)
+        ]
+        return [future.result() for future in futures]
+
+
+def cli(argv=None):
+    """
+    Génération de grandes instances en ligne de commande (cf. docstring du module).
+    """
+    parser = argparse.ArgumentParser(description="Large-scale instance generation (streamed CSV).")
+    parser.add_argument('--projects', type=int, required=True, help="nombre de projets (chaînes)")
+    parser.add_argument('--machines', type=int, required=True)
+    parser.add_argument('--chain-length', type=int, default=2, help="tâches par projet")
+    parser.add_argument('--min-duration', type=int, default=20)
+    parser.add_argument('--max-duration', type=int, default=100)
+    parser.add_argument('--slack', type=float, default=0.3, help="facteur de marge")
+    parser.add_argument('--horizon', type=int, default=1000, help="horizon de temps")
+    parser.add_argument('--seeds', type=int, nargs='+', default=[0], help="une instance par graine")
+    parser.add_argument('--jobs', type=int, default=None, help="processus parallèles (défaut: cœurs)")
+    parser.add_argument('--output', default=None, help="fichier CSV (une seule graine)")
+    parser.add_argument('--output-dir', default='.', help="répertoire des instances <prefix>_<graine>.csv")
+    parser.add_argument('--prefix', default='instance')
+    args = parser.parse_args(argv)
+    
+    params = dict(
+        num_projects=args.projects, num_machines=args.machines, chain_length=args.chain_length,
+        min_duration=args.min_duration, max_duration=args.max_duration,
+        slack_factor=args.slack, time_horizon=args.horizon,
+    )
+    if args.output:
+        if len(args.seeds) > 1:
+            parser.error("--output takes a single seed; use --output-dir for several")
+        results = [generate_instance_file(args.seeds[0], args.output, **params)]
+    else:
+        results = generate_instances(args.seeds, args.output_dir, jobs=args.jobs, prefix=args.prefix, **params)
+    for seed, filename, count, seconds in results:
+        print(f"seed {seed}: {count} tasks written to {filename} in {seconds:.2f} s")
+
+
 def main():
     """
     Démonstration du générateur de jeux de données.
@@ -336,4 +532,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Sans argument: démonstration (3 niveaux de difficulté); sinon grandes instances
+    if len(sys.argv) > 1:
+        cli()
+    else:
+        main()
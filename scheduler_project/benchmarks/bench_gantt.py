@@ -0,0 +1,114 @@
+"""
+Benchmark - Rendu des diagrammes de Gantt
+
+Compare le rendu par lignes de machines (scheduler/gantt.py: une collection
+broken_barh par machine, étiquettes filtrées, taille et résolution adaptées)
+au rendu historique (un barh et un texte encadré par tâche, figure fixe),
+sur des ordonnancements synthétiques de taille croissante.
+
+Usage:
+    python benchmarks/bench_gantt.py [--sizes 50 500 2000 10000] [--legacy-max 5000] [--svg]
+"""
+from pathlib import Path
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+django.setup()
+
+import matplotlib.patches as mpatches
+from matplotlib import colormaps
+from matplotlib.figure import Figure
+
+from scheduler.gantt import project_name, render_gantt
+
+
+def synthetic_schedule(task_count, seed=0):
+    """
+    Ordonnancement compact: projets de deux tâches, ~25 tâches par machine
+    """
+    rng = random.Random(seed)
+    machines = [f"M{i + 1}" for i in range(max(2, task_count // 25))]
+    free_at = {machine: 0 for machine in machines}
+    schedule = {}
+    for i in range(task_count):
+        machine = min(machines, key=free_at.get)
+        start = free_at[machine] + rng.randint(0, 10)
+        duration = rng.randint(20, 100)
+        free_at[machine] = start + duration
+        schedule[f"task_p{i // 2}_{i % 2 + 1}"] = {
+            'start': start, 'end': start + duration, 'duration': duration, 'machine': machine,
+        }
+    return schedule, machines
+
+
+def legacy_render(schedule, machines):
+    """Rendu historique: un barh et un texte encadré par tâche (référence)"""
+    colors = colormaps['tab20'](range(20))
+    projects = sorted({project_name(task) for task in schedule})
+    project_colors = {project: colors[i % 20] for i, project in enumerate(projects)}
+
+    fig = Figure(figsize=(14, max(6, len(machines) * 1.5)))
+    ax = fig.subplots()
+    for y_pos, machine in enumerate(machines):
+        tasks = sorted(((name, info) for name, info in schedule.items() if info['machine'] == machine),
+                       key=lambda x: x[1]['start'])
+        for task_name, info in tasks:
+            ax.barh(y_pos, info['duration'], left=info['start'], height=0.6,
+                    color=project_colors[project_name(task_name)], edgecolor='black', linewidth=1.5, alpha=0.85)
+            ax.text(info['start'] + info['duration'] / 2, y_pos, task_name, ha='center', va='center',
+                    fontsize=9, fontweight='bold', color='white',
+                    bbox=dict(boxstyle='round,pad=0.3', facecolor='black', alpha=0.3, edgecolor='none'))
+    ax.set_yticks(range(len(machines)))
+    ax.set_yticklabels(machines, fontsize=11, fontweight='bold')
+    ax.set_xlim(0, max(info['end'] for info in schedule.values()) * 1.05)
+    ax.legend(handles=[mpatches.Patch(color=project_colors[p], label=p, alpha=0.85) for p in projects],
+              loc='upper right', fontsize=9, title='Projects')
+    fig.tight_layout()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def timed(render, *args):
+    start = time.perf_counter()
+    image = render(*args)
+    return time.perf_counter() - start, len(image)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 500, 2000, 10000])
+    parser.add_argument('--legacy-max', type=int, default=5000,
+                        help="taille maximale rendue avec l'ancien moteur (il devient très lent)")
+    parser.add_argument('--svg', action='store_true', help="mesurer aussi la sortie SVG")
+    args = parser.parse_args()
+
+    print(f"{'tasks':>7}{'machines':>10}{'legacy (s)':>12}{'legacy (KB)':>13}"
+          f"{'lanes (s)':>11}{'lanes (KB)':>12}{'speedup':>9}" + (f"{'svg (s)':>9}{'svg (KB)':>10}" if args.svg else ''))
+    for size in args.sizes:
+        schedule, machines = synthetic_schedule(size)
+        new_time, new_size = timed(render_gantt, schedule, machines, 'png')
+        if size <= args.legacy_max:
+            old_time, old_size = timed(legacy_render, schedule, machines)
+            legacy = f"{old_time:>12.2f}{old_size / 1024:>13.0f}"
+            speedup = f"{old_time / new_time:>8.1f}x"
+        else:
+            legacy, speedup = f"{'-':>12}{'-':>13}", f"{'-':>9}"
+        line = f"{size:>7}{len(machines):>10}{legacy}{new_time:>11.2f}{new_size / 1024:>12.0f}{speedup}"
+        if args.svg:
+            svg_time, svg_size = timed(render_gantt, schedule, machines, 'svg')
+            line += f"{svg_time:>9.2f}{svg_size / 1024:>10.0f}"
+        print(line, flush=True)
+
+
+if __name__ == '__main__':
+    main()
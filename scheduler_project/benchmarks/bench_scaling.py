@@ -0,0 +1,241 @@
+"""
+Benchmark - Passage à l'échelle de Machine_Parallele
+
+Balaye num_pairs × num_machines × slack_factor × graine avec le générateur
+et chronomètre chaque phase séparément:
+
+    build      construction du modèle CP-SAT (présolve compris)
+    solve      recherche CP-SAT
+    extract    reconstruction de l'ordonnancement (get_schedule)
+    gantt      rendu du diagramme PNG
+    write_back écriture de la solution en base (persist_solution, base de test
+               en mémoire et MEDIA_ROOT temporaire: rien n'est écrit dans le projet)
+
+Les résultats (avec l'environnement: versions, cœurs) sont écrits en JSON.
+Le mode comparaison rapproche chaque exécution de celle de même clé
+(paires, machines, marge, graine) dans une référence et signale les
+régressions: phase plus lente au-delà du seuil, statut ou objectif dégradé.
+Le code de sortie vaut 1 en cas de régression.
+
+Usage:
+    python benchmarks/bench_scaling.py --output baseline.json
+    python benchmarks/bench_scaling.py --output current.json --compare baseline.json
+    python benchmarks/bench_scaling.py --pairs 5 10 --machines 3 --slack 0.3 --seeds 2 --time-limit 5
+"""
+from pathlib import Path
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+sys.path.insert(0, str(PROJECT_DIR.parent))  # generator.py
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+django.setup()
+
+import ortools
+from django.conf import settings
+from django.db import connection
+from generator import SchedulingDatasetGenerator
+from scheduler.models import Schedule, Task, Machine
+from scheduler.gantt import render_gantt_png
+from scheduler.presets import preset_parameters
+from scheduler.solver import Machine_Parallele, taskInfo, instance_fingerprint, persist_solution
+
+
+PHASES = ('build', 'solve', 'extract', 'gantt', 'write_back')
+
+# Statuts par qualité décroissante (un recul est une régression, cf. status_regression)
+STATUS_RANK = {'OPTIMAL': 0, 'INFEASIBLE': 0, 'FEASIBLE': 1, 'UNKNOWN': 2, 'MODEL_INVALID': 3}
+
+# Statuts prouvés: une nouvelle exécution doit retrouver exactement le même
+PROVEN_STATUSES = ('OPTIMAL', 'INFEASIBLE')
+
+
+def run_key(run):
+    return (run['pairs'], run['machines'], run['slack'], run['seed'])
+
+
+def generate(pairs, machines, slack, seed):
+    """Instance du générateur (sa sortie console est masquée)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tasks, machines_list = SchedulingDatasetGenerator(seed=seed).generate_dataset(
+            num_pairs=pairs, num_machines=machines, slack_factor=slack
+        )
+    return {name: taskInfo(*info) for name, info in tasks.items()}, machines_list
+
+
+def write_back(tasks, machines_list, solution, solver):
+    """Crée le planning en base puis chronomètre persist_solution"""
+    schedule = Schedule.objects.create(name='bench')
+    Machine.objects.bulk_create(Machine(schedule=schedule, name=name) for name in machines_list)
+    Task.objects.bulk_create(
+        Task(schedule=schedule, name=name, duration=info.duration, successors=info.successors,
+             release_date=info.release_date, due_date=info.due_date)
+        for name, info in tasks.items()
+    )
+    started = time.perf_counter()
+    persist_solution(
+        schedule, instance_fingerprint(tasks, machines_list), machines_list, solution,
+        solver_status=solver.solver.status_name(solver.status),
+        objective_value=solver.solver.objective_value,
+        best_bound=solver.solver.best_objective_bound,
+        progress=[], time_limit=None, parameters={}, wall_time=solver.solver.wall_time,
+    )
+    return time.perf_counter() - started
+
+
+def run(pairs, machines, slack, seed, time_limit, workers):
+    tasks, machines_list = generate(pairs, machines, slack, seed)
+    phases = dict.fromkeys(PHASES)
+
+    started = time.perf_counter()
+    solver = Machine_Parallele(taskInfo, tasks, machines_list, solve=False)
+    phases['build'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    solver.solve(time_limit=time_limit, parameters=preset_parameters(random_seed=0, num_workers=workers))
+    phases['solve'] = time.perf_counter() - started
+    status = solver.solver.status_name(solver.status)
+
+    started = time.perf_counter()
+    solution = solver.get_schedule()
+    phases['extract'] = time.perf_counter() - started
+
+    if solution:
+        started = time.perf_counter()
+        render_gantt_png(solution, machines_list)
+        phases['gantt'] = time.perf_counter() - started
+        phases['write_back'] = write_back(tasks, machines_list, solution, solver)
+
+    proto = solver.model.proto
+    return {
+        'pairs': pairs, 'machines': machines, 'slack': slack, 'seed': seed,
+        'tasks': len(tasks),
+        'status': status,
+        'objective': solver.solver.objective_value if solution else None,
+        'best_bound': solver.solver.best_objective_bound if solution else None,
+        'variables': len(proto.variables),
+        'constraints': len(proto.constraints),
+        'branches': solver.solver.num_branches,
+        'conflicts': solver.solver.num_conflicts,
+        'phases': {phase: None if value is None else round(value, 4) for phase, value in phases.items()},
+    }
+
+
+def status_regression(before, after):
+    """
+    Indique si le statut d'une instance a régressé par rapport à la référence
+
+    Un statut prouvé doit être retrouvé à l'identique (OPTIMAL -> INFEASIBLE,
+    OPTIMAL -> FEASIBLE...); une instance dont une solution était connue ne peut
+    pas devenir INFEASIBLE. Sinon, seul un recul dans STATUS_RANK compte.
+    """
+    if before in PROVEN_STATUSES:
+        return after != before
+    if before == 'FEASIBLE' and after == 'INFEASIBLE':
+        return True
+    return STATUS_RANK.get(after, 9) > STATUS_RANK.get(before, 9)
+
+
+def compare(results, baseline, threshold, min_delta):
+    """
+    Régressions par rapport à une référence
+
+    Returns:
+        list: messages de régression
+    """
+    reference = {run_key(run): run for run in baseline['results']}
+    regressions = []
+    for run in results:
+        old = reference.get(run_key(run))
+        if old is None:
+            continue
+        label = "pairs={} machines={} slack={} seed={}".format(*run_key(run))
+        for phase in PHASES:
+            before, after = old['phases'].get(phase), run['phases'].get(phase)
+            if before is not None and after is not None and after - before > max(min_delta, threshold * before):
+                regressions.append(f"{label}: {phase} {before:.3f}s -> {after:.3f}s")
+        if status_regression(old['status'], run['status']):
+            regressions.append(f"{label}: status {old['status']} -> {run['status']}")
+        elif run['objective'] is not None and old['objective'] is not None and run['objective'] > old['objective']:
+            regressions.append(f"{label}: objective {old['objective']:g} -> {run['objective']:g}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pairs', type=int, nargs='+', default=[5, 10, 20])
+    parser.add_argument('--machines', type=int, nargs='+', default=[2, 4, 8])
+    parser.add_argument('--slack', type=float, nargs='+', default=[0.3, 0.6])
+    parser.add_argument('--seeds', type=int, default=3)
+    parser.add_argument('--time-limit', type=float, default=10.0)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--output', default='bench_scaling.json')
+    parser.add_argument('--compare', default=None, help="fichier de résultats de référence")
+    parser.add_argument('--threshold', type=float, default=0.25, help="ralentissement relatif toléré par phase")
+    parser.add_argument('--min-delta', type=float, default=0.1, help="ralentissement absolu ignoré (secondes)")
+    args = parser.parse_args()
+
+    # Base de test en mémoire et répertoire média temporaire: le projet n'est pas modifié
+    settings.MEDIA_ROOT = tempfile.mkdtemp(prefix='bench_media_')
+    test_db = connection.creation.create_test_db(verbosity=0)
+
+    # Premier rendu hors mesure: l'import de matplotlib ne doit pas être compté dans une exécution
+    render_gantt_png({'warmup_1': {'start': 0, 'end': 1, 'machine': 'M1'}}, ['M1'])
+    
+    results = []
+    try:
+        print(f"{'pairs':>6}{'mach':>6}{'slack':>7}{'seed':>5}{'status':>11}{'objective':>11}"
+              + ''.join(f"{phase:>11}" for phase in PHASES))
+        for pairs in args.pairs:
+            for machines in args.machines:
+                for slack in args.slack:
+                    for seed in range(args.seeds):
+                        result = run(pairs, machines, slack, seed, args.time_limit, args.workers)
+                        results.append(result)
+                        objective = '-' if result['objective'] is None else f"{result['objective']:g}"
+                        print(f"{pairs:>6}{machines:>6}{slack:>7}{seed:>5}{result['status']:>11}{objective:>11}"
+                              + ''.join('{:>11}'.format('-' if result['phases'][phase] is None
+                                                        else f"{result['phases'][phase]:.3f}") for phase in PHASES),
+                              flush=True)
+    finally:
+        connection.creation.destroy_test_db(test_db, verbosity=0)
+        shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+    document = {
+        'environment': {
+            'python': platform.python_version(),
+            'ortools': ortools.__version__,
+            'django': django.get_version(),
+            'cpu_count': os.cpu_count(),
+            'machine': platform.machine(),
+            'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'parameters': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(document, indent=2), encoding='utf-8')
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        regressions = compare(results, baseline, args.threshold, args.min_delta)
+        for message in regressions:
+            print(f"   !! {message}")
+        print(f"{len(regressions)} regression(s) against {args.compare}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark - Élimination des symétries entre machines identiques
+
+Compare les modes d'élimination des symétries de Machine_Parallele
+(aucun, charges ordonnées, premières tâches lexicographiques) sur les niveaux
+de difficulté du générateur, pour plusieurs graines.
+
+Usage:
+    python benchmarks/bench_symmetry.py [--seeds 5] [--time-limit 20] [--workers 1]
+"""
+from pathlib import Path
+import argparse
+import os
+import statistics
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+sys.path.insert(0, str(PROJECT_DIR.parent))  # generator.py
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+django.setup()
+
+from generator import SchedulingDatasetGenerator
+from scheduler.solver import Machine_Parallele, taskInfo
+
+
+MODES = [None, 'loads', 'first_tasks']
+
+# Niveaux du générateur, plus une variante DIFFICILE avec davantage de machines
+LEVELS = {
+    'facile': SchedulingDatasetGenerator.FACILE,
+    'moyen': SchedulingDatasetGenerator.MOYEN,
+    'difficile': SchedulingDatasetGenerator.DIFFICILE,
+    'difficile_x2': dict(SchedulingDatasetGenerator.DIFFICILE, num_pairs=16, num_machines=20),
+}
+
+
+def run(level, params, seed, mode, time_limit, workers):
+    tasks, machines = SchedulingDatasetGenerator(seed=seed).generate_dataset(**params)
+    tasks = {name: taskInfo(*info) for name, info in tasks.items()}
+
+    start = time.perf_counter()
+    solver = Machine_Parallele(
+        taskInfo, tasks, machines,
+        time_limit=time_limit,
+        parameters={'num_workers': workers, 'random_seed': 0},
+        symmetry_breaking=mode
+    )
+    elapsed = time.perf_counter() - start
+
+    return {
+        'status': solver.solver.status_name(solver.status),
+        'time': elapsed,
+        'branches': solver.solver.num_branches,
+        'objective': solver.solver.objective_value if solver.get_schedule() else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seeds', type=int, default=5)
+    parser.add_argument('--time-limit', type=float, default=20.0)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'level':<18}{'mode':<13}{'solved':>8}{'mean time (s)':>15}{'max time (s)':>14}{'mean branches':>15}")
+    for level, params in LEVELS.items():
+        for mode in MODES:
+            runs = [run(level, params, seed, mode, args.time_limit, args.workers) for seed in range(args.seeds)]
+            proven = sum(r['status'] in ('OPTIMAL', 'INFEASIBLE') for r in runs)
+            print(f"{level:<18}{str(mode):<13}{proven:>5}/{len(runs):<2}"
+                  f"{statistics.mean(r['time'] for r in runs):>15.3f}"
+                  f"{max(r['time'] for r in runs):>14.3f}"
+                  f"{statistics.mean(r['branches'] for r in runs):>15.0f}")
+
+            # Les modes doivent trouver le même optimum
+            if mode is None:
+                reference = [r['objective'] for r in runs]
+            else:
+                for r, ref in zip(runs, reference):
+                    if r['status'] == 'OPTIMAL' and ref is not None and r['objective'] != ref:
+                        print(f"   !! objective mismatch: {r['objective']} != {ref}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Vérification - Formulation disjonctive vs formulation cumulative
+
+Résout chaque jeu de données avec les deux formulations de Machine_Parallele,
+vérifie que les objectifs optimaux sont égaux et que l'affectation reconstruite
+par coloration d'intervalles est réalisable (pas de chevauchement sur une machine,
+fenêtres de temps et précédences respectées).
+
+Usage:
+    python benchmarks/check_formulations.py [fichiers CSV...] [--time-limit 60]
+    (par défaut: media/samples/*.csv)
+"""
+from pathlib import Path
+import argparse
+import os
+import sys
+import time
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django
+django.setup()
+
+from scheduler.precedence import parse_successors
+from scheduler.solver import Machine_Parallele, taskInfo, parse_csv_file, FORMULATIONS
+
+
+def check_schedule(schedule, tasks, machines):
+    """Retourne la liste des violations de contraintes d'un ordonnancement"""
+    errors = []
+    for task_name, info in schedule.items():
+        task_info = tasks[task_name]
+        if info['machine'] not in machines:
+            errors.append(f"{task_name}: unknown machine {info['machine']}")
+        if info['start'] < task_info.release_date or info['end'] > task_info.due_date:
+            errors.append(f"{task_name}: outside its time window")
+        for successor in parse_successors(task_info.successors):
+            if successor in schedule and info['end'] > schedule[successor]['start']:
+                errors.append(f"{task_name}: ends after its successor {successor} starts")
+
+    for machine in machines:
+        intervals = sorted((info['start'], info['end'], name) for name, info in schedule.items()
+                           if info['machine'] == machine)
+        for (_, end, name), (start, _, other) in zip(intervals, intervals[1:]):
+            if start < end:
+                errors.append(f"{machine}: {name} overlaps {other}")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('files', nargs='*')
+    parser.add_argument('--time-limit', type=float, default=60.0)
+    args = parser.parse_args()
+
+    files = args.files or sorted(str(path) for path in (PROJECT_DIR / 'media' / 'samples').glob('*.csv'))
+    failures = 0
+
+    print(f"{'dataset':<26}{'formulation':<14}{'vars':>7}{'constraints':>13}{'status':>10}{'objective':>11}{'time (s)':>10}")
+    for file_path in files:
+        raw_tasks, machines = parse_csv_file(file_path)
+        tasks = {
+            name: taskInfo(row['duration'], row['successors'], row['release_date'], row['due_date'])
+            for name, row in raw_tasks.items()
+        }
+
+        objectives = {}
+        for formulation in FORMULATIONS:
+            start = time.perf_counter()
+            solver = Machine_Parallele(
+                taskInfo, tasks, machines, time_limit=args.time_limit,
+                parameters={'relative_gap_limit': 0.0}, formulation=formulation
+            )
+            elapsed = time.perf_counter() - start
+            status = solver.solver.status_name(solver.status)
+            proto = solver.model.proto
+            schedule = solver.get_schedule()
+            objectives[formulation] = (status, solver.solver.objective_value if schedule else None)
+
+            print(f"{Path(file_path).name:<26}{formulation:<14}{len(proto.variables):>7}{len(proto.constraints):>13}"
+                  f"{status:>10}{str(objectives[formulation][1]):>11}{elapsed:>10.3f}")
+
+            for error in check_schedule(schedule or {}, tasks, machines):
+                failures += 1
+                print(f"   !! {error}")
+
+        if len(set(objectives.values())) > 1:
+            failures += 1
+            print(f"   !! formulations disagree: {objectives}")
+
+    print("OK" if not failures else f"{failures} problem(s) found")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -97,3 +97,40 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Background solve jobs: number of CP-SAT solves run concurrently by the local worker pool
+SCHEDULER_SOLVE_WORKERS = 2
+
+# Background solve jobs: interval (seconds) at which each process refreshes the heartbeat of its jobs;
+# an active job without a heartbeat for 3 intervals (or whose process has exited) is marked as failed
+SCHEDULER_JOB_HEARTBEAT = 30.0
+
+# Anytime solving: default time budget (seconds) when a schedule has no time_limit (None = until optimal),
+# and minimum delay between two persisted intermediate solutions
+SCHEDULER_DEFAULT_TIME_LIMIT = 60.0
+SCHEDULER_PROGRESS_INTERVAL = 1.0
+
+# CPU cores shared by concurrent CP-SAT solves (None = all cores of the machine)
+SCHEDULER_SOLVER_CORES = None
+
+# Content-addressed solution cache: total size of cached assignments before LRU eviction (bytes)
+SCHEDULER_SOLUTION_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+# Home page: schedules per page (keyset pagination)
+SCHEDULER_INDEX_PAGE_SIZE = 50
+
+# Solve telemetry: one JSON line per solve on the 'scheduler.solve' logger (per-phase timings,
+# model size, CP-SAT statistics), written bare on stderr for the metrics collector
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'metrics': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'metrics': {'class': 'logging.StreamHandler', 'formatter': 'metrics'},
+    },
+    'loggers': {
+        'scheduler.solve': {'handlers': ['metrics'], 'level': 'INFO', 'propagate': False},
+    },
+}
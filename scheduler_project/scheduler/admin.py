@@ -2,7 +2,7 @@
 Configuration du panneau d'administration Django
 """
 from django.contrib import admin
-from .models import Schedule, Machine, Task, UploadedFile
+from .models import Schedule, Machine, Task, Solution, SolveJob, CachedSolution, UploadedFile
 
 
 @admin.register(Schedule)
@@ -30,6 +30,30 @@ class TaskAdmin(admin.ModelAdmin):
     search_fields = ['name']
 
 
+@admin.register(Solution)
+class SolutionAdmin(admin.ModelAdmin):
+    """Configuration de l'administration des solutions persistées"""
+    list_display = ['schedule', 'solver_status', 'objective_value', 'makespan', 'wall_time', 'solved_at']
+    list_filter = ['solver_status']
+    readonly_fields = ['instance_fingerprint', 'timings', 'statistics', 'solved_at']
+
+
+@admin.register(SolveJob)
+class SolveJobAdmin(admin.ModelAdmin):
+    """Configuration de l'administration des jobs de résolution"""
+    list_display = ['id', 'schedule', 'status', 'created_at', 'started_at', 'finished_at']
+    list_filter = ['status', 'created_at']
+    readonly_fields = ['created_at', 'started_at', 'finished_at']
+
+
+@admin.register(CachedSolution)
+class CachedSolutionAdmin(admin.ModelAdmin):
+    """Configuration de l'administration du cache de solutions"""
+    list_display = ['fingerprint', 'solver_status', 'num_machines', 'objective_value', 'size_bytes', 'hit_count', 'last_used_at']
+    list_filter = ['solver_status']
+    readonly_fields = ['fingerprint', 'created_at', 'last_used_at']
+
+
 @admin.register(UploadedFile)
 class UploadedFileAdmin(admin.ModelAdmin):
     """Configuration de l'administration des fichiers téléchargés"""
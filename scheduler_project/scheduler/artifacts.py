@@ -0,0 +1,177 @@
+"""
+Artifact Store - Stockage sur disque des diagrammes de Gantt et rapports PDF
+
+Chaque artefact est produit une seule fois puis écrit sous MEDIA_ROOT,
+dans un fichier nommé d'après l'empreinte de la solution:
+
+    MEDIA_ROOT/gantt/<schedule_id>/<solution_fingerprint>.png (ou .svg)
+    MEDIA_ROOT/reports/<schedule_id>/<solution_fingerprint>.pdf
+
+Le contenu d'un fichier ne change donc jamais pour un nom donné, ce qui permet
+de le servir avec un cache HTTP long. Les anciennes versions sont supprimées
+lors d'une nouvelle résolution ou de la suppression du planning.
+"""
+from pathlib import Path
+from django.conf import settings
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+
+GANTT_DIR = 'gantt'
+REPORT_DIR = 'reports'
+
+# Suffixe des fichiers en cours d'écriture (cf. store_artifact), jamais évincés
+TMP_SUFFIX = '.tmp'
+
+
+def solution_fingerprint(instance_fingerprint, assignments):
+    """
+    Calcule l'empreinte d'une solution (instance + affectations)
+
+    Args:
+        instance_fingerprint: empreinte de l'instance résolue
+        assignments: dictionnaire {tâche: {start, end, machine, slack}}
+
+    Returns:
+        str: empreinte SHA-256 hexadécimale
+    """
+    payload = json.dumps([instance_fingerprint, assignments], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def gantt_relative_path(schedule_id, fingerprint, extension='png'):
+    """Chemin du diagramme relatif à MEDIA_ROOT"""
+    return f"{GANTT_DIR}/{schedule_id}/{fingerprint}.{extension}"
+
+
+def report_relative_path(schedule_id, fingerprint):
+    """Chemin du rapport PDF relatif à MEDIA_ROOT"""
+    return f"{REPORT_DIR}/{schedule_id}/{fingerprint}.pdf"
+
+
+def gantt_path(relative_path):
+    """Chemin absolu d'un artefact (diagramme, rapport) à partir de son chemin relatif"""
+    return Path(settings.MEDIA_ROOT) / relative_path
+
+
+def store_gantt(schedule_id, fingerprint, render, extension='png'):
+    """
+    Écrit le diagramme d'une solution sur disque s'il n'existe pas encore
+
+    Args:
+        schedule_id: ID du Schedule
+        fingerprint: empreinte de la solution
+        render: fonction sans argument retournant les octets de l'image (appelée seulement si nécessaire)
+        extension: format de l'image ('png' ou 'svg')
+
+    Returns:
+        str: chemin relatif à MEDIA_ROOT, ou '' si le rendu n'a rien produit
+    """
+    def write(tmp_file):
+        image = render()
+        tmp_file.write(image or b'')
+        return bool(image)
+
+    relative_path = store_artifact(gantt_relative_path(schedule_id, fingerprint, extension), write)
+    evict_gantt(schedule_id, keep=fingerprint)
+    return relative_path
+
+
+def store_report(schedule_id, fingerprint, write):
+    """
+    Écrit le rapport PDF d'une solution sur disque s'il n'existe pas encore
+
+    Args:
+        schedule_id: ID du Schedule
+        fingerprint: empreinte de la solution
+        write: fonction(fichier) écrivant le PDF au fil de l'eau (appelée seulement si nécessaire)
+
+    Returns:
+        str: chemin relatif à MEDIA_ROOT
+    """
+    relative_path = store_artifact(report_relative_path(schedule_id, fingerprint), write)
+    evict_directory(Path(settings.MEDIA_ROOT) / REPORT_DIR / str(schedule_id), keep=fingerprint)
+    return relative_path
+
+
+def store_artifact(relative_path, write):
+    """
+    Produit un artefact dans un fichier temporaire puis le publie atomiquement
+
+    Args:
+        relative_path: chemin de l'artefact relatif à MEDIA_ROOT
+        write: fonction(fichier binaire) écrivant le contenu; retourner False annule l'écriture
+
+    Returns:
+        str: chemin relatif à MEDIA_ROOT, ou '' si rien n'a été produit
+    """
+    path = gantt_path(relative_path)
+    if path.exists():
+        return relative_path
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Écriture atomique: un lecteur concurrent ne voit jamais un fichier partiel
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=TMP_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            produced = write(tmp_file) is not False
+        if not produced:
+            return ''
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+    return relative_path
+
+
+def evict_gantt(schedule_id, keep=None):
+    """
+    Supprime les diagrammes d'un planning
+
+    Args:
+        schedule_id: ID du Schedule
+        keep: empreinte de la version à conserver (None = tout supprimer)
+    """
+    evict_directory(Path(settings.MEDIA_ROOT) / GANTT_DIR / str(schedule_id), keep=keep)
+
+
+def evict_artifacts(schedule_id, keep=None):
+    """
+    Supprime les artefacts d'un planning (diagrammes et rapports)
+
+    Args:
+        schedule_id: ID du Schedule
+        keep: empreinte de la version à conserver (None = tout supprimer)
+    """
+    for directory in (GANTT_DIR, REPORT_DIR):
+        evict_directory(Path(settings.MEDIA_ROOT) / directory / str(schedule_id), keep=keep)
+
+
+def evict_directory(directory, keep=None):
+    """
+    Supprime les fichiers d'un répertoire d'artefacts
+
+    Les fichiers temporaires d'une écriture concurrente (store_artifact) sont
+    conservés: les supprimer ferait échouer la publication de l'artefact.
+
+    Args:
+        directory: répertoire d'un planning (ex. MEDIA_ROOT/gantt/<schedule_id>)
+        keep: empreinte de la version à conserver (None = tout supprimer)
+    """
+    if not directory.is_dir():
+        return
+
+    if keep is None:
+        shutil.rmtree(directory, ignore_errors=True)
+        return
+
+    for entry in directory.iterdir():
+        if entry.stem != keep and entry.suffix != TMP_SUFFIX:
+            try:
+                entry.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,306 @@
+"""
+Batch Service - Résolution en lot de fichiers d'instances CSV, sans Django
+
+Utilisé par la commande `manage.py batch_solve` et directement comme
+bibliothèque (run_batch) ou en ligne de commande (`python -m scheduler.batch`)
+pour les balayages de scénarios nocturnes. Seuls les modules de calcul sont
+importés (lecture CSV, filtrage, heuristique, CP-SAT): ni configuration Django
+ni base de données ne sont nécessaires.
+
+Chaque instance est résolue dans un processus neuf (un pool d'un processus par
+instance: max_tasks_per_child n'existe qu'à partir de Python 3.11):
+le pic mémoire mesuré est celui de l'instance, et un plantage ou une fuite ne
+touche qu'elle. CP-SAT reçoit un seul worker par défaut: le débit croît avec
+le nombre de processus, donc avec le nombre de cœurs.
+
+Usage:
+    python manage.py batch_solve datasets/ --time-limit 30 --output summary.csv
+    python -m scheduler.batch "datasets/*.csv" --jobs 8 --output summary.json
+"""
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+import argparse
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from ortools.sat.python import cp_model
+
+from .heuristic import Ordonnancement_Liste
+from .ingest import CSVStream, CSVIngestError
+from .presets import SOLVER_PRESETS, DEFAULT_PRESET, preset_parameters
+from .screening import Screening
+from .solver import Machine_Parallele, taskInfo
+
+try:
+    import resource
+except ImportError:  # Windows: pas de mesure du pic mémoire
+    resource = None
+
+
+# Colonnes du résumé (CSV) et clés de chaque résultat (JSON)
+SUMMARY_FIELDS = (
+    'instance', 'tasks', 'machines', 'status', 'objective', 'best_bound',
+    'makespan', 'wall_time', 'peak_memory_mb', 'message',
+)
+
+
+def instance_files(sources):
+    """
+    Liste des fichiers d'instances à résoudre
+
+    Args:
+        sources: répertoires (tous leurs *.csv), motifs glob ou fichiers
+
+    Returns:
+        list: chemins (Path) sans doublons, dans l'ordre des sources puis des noms
+    """
+    files = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            files.extend(sorted(path.glob('*.csv')))
+        elif glob.has_magic(source):
+            files.extend(sorted(Path(match) for match in glob.glob(source, recursive=True)))
+        else:
+            files.append(path)
+    return list(dict.fromkeys(files))
+
+
+def load_instance_file(path):
+    """
+    Lit un fichier d'instance CSV (format de generator.py et de l'import web)
+
+    Returns:
+        tuple: (tasks_dict {nom: taskInfo}, machines_list)
+
+    Raises:
+        CSVIngestError: fichier invalide (ligne en cause)
+    """
+    with open(path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+        stream = CSVStream(csvfile)
+        tasks = {
+            name: taskInfo(duration=duration, successors=successors, release_date=release_date, due_date=due_date)
+            for _, name, duration, successors, release_date, due_date in stream
+        }
+    return tasks, stream.machines
+
+
+def peak_memory_mb():
+    """Pic de mémoire résidente du processus courant (Mo), ou None si non mesurable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss est en octets sous macOS, en kilo-octets ailleurs
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def solve_instance(path, time_limit=None, preset=DEFAULT_PRESET, num_workers=1, random_seed=None):
+    """
+    Résout une instance comme la résolution web (filtrage, heuristique, CP-SAT à chaud)
+
+    Args:
+        path: fichier d'instance CSV
+        time_limit: budget CP-SAT en secondes (None = jusqu'à l'optimalité)
+        preset: préréglage CP-SAT (cf. presets.py)
+        num_workers: threads CP-SAT pour cette instance
+        random_seed: graine de la recherche (None = celle de CP-SAT)
+
+    Returns:
+        dict: résultat {instance, tasks, machines, status, objective, best_bound,
+              makespan, wall_time, peak_memory_mb, message} (cf. SUMMARY_FIELDS)
+    """
+    started = time.perf_counter()
+    result = dict.fromkeys(SUMMARY_FIELDS)
+    result.update(instance=str(path), message='')
+
+    try:
+        tasks, machines = load_instance_file(path)
+        result.update(tasks=len(tasks), machines=len(machines))
+
+        screening = Screening(taskInfo, tasks, machines)
+        if screening.is_infeasible():
+            result.update(status='INFEASIBLE', message=screening.diagnosis())
+            return result
+
+        # Point de départ et borne supérieure: ordonnancement par liste
+        hints, upper_bound, heuristic = None, None, None
+        try:
+            heuristic = Ordonnancement_Liste(taskInfo, tasks, machines)
+            hints = heuristic.get_hints()
+            if heuristic.is_feasible():
+                upper_bound = heuristic.objective_value
+        except ValueError:
+            heuristic = None  # précédences cycliques: CP-SAT conclura à l'infaisabilité
+
+        solver = Machine_Parallele(
+            taskInfo, tasks, machines,
+            time_limit=time_limit,
+            parameters=preset_parameters(preset, random_seed=random_seed, num_workers=num_workers),
+            hints=hints, upper_bound=upper_bound
+        )
+        result.update(status=solver.solver.status_name(solver.status))
+
+        if solver.status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            result.update(
+                objective=solver.solver.objective_value,
+                best_bound=solver.solver.best_objective_bound,
+                makespan=solver.get_makespan(),
+            )
+        elif solver.status == cp_model.UNKNOWN and upper_bound is not None:
+            # Budget épuisé sans solution CP-SAT: la solution heuristique est conservée
+            result.update(
+                status='FEASIBLE',
+                objective=upper_bound,
+                makespan=max(info['end'] for info in heuristic.get_schedule().values()),
+                message=f"list-scheduling solution ({heuristic.rule})",
+            )
+    except (OSError, CSVIngestError) as e:
+        result.update(status='ERROR', message=str(e))
+    finally:
+        result.update(wall_time=round(time.perf_counter() - started, 3), peak_memory_mb=peak_memory_mb())
+
+    return result
+
+
+def run_batch(files, time_limit=None, preset=DEFAULT_PRESET, jobs=None, num_workers=1,
+              random_seed=None, on_result=None):
+    """
+    Résout des instances en parallèle, une par processus
+
+    Args:
+        files: fichiers d'instances (cf. instance_files)
+        time_limit: budget CP-SAT par instance en secondes
+        preset: préréglage CP-SAT
+        jobs: nombre de processus (None = cœurs disponibles / num_workers)
+        num_workers: threads CP-SAT par instance
+        random_seed: graine de la recherche
+        on_result: fonction appelée avec chaque résultat, dans l'ordre de fin
+
+    Returns:
+        list: résultats (cf. solve_instance) dans l'ordre de files
+    """
+    files = list(files)
+    if jobs is None:
+        jobs = max(1, (os.cpu_count() or 1) // max(1, num_workers))
+    jobs = max(1, min(jobs, len(files) or 1))
+
+    # Un pool d'un seul processus par instance, au plus jobs à la fois; démarrage 'spawn':
+    # les processus n'héritent de rien du parent, y compris d'un éventuel état Django
+    context = multiprocessing.get_context('spawn')
+    pending = iter(enumerate(files))
+    running = {}
+
+    def start_next():
+        item = next(pending, None)
+        if item is not None:
+            i, path = item
+            executor = ProcessPoolExecutor(max_workers=1, mp_context=context)
+            future = executor.submit(solve_instance, path, time_limit, preset, num_workers, random_seed)
+            running[future] = (i, executor)
+
+    results = [None] * len(files)
+    try:
+        for _ in range(jobs):
+            start_next()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                i, executor = running.pop(future)
+                executor.shutdown()
+                start_next()
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Processus interrompu (mémoire épuisée, plantage du solveur...)
+                    result = dict.fromkeys(SUMMARY_FIELDS)
+                    result.update(instance=str(files[i]), status='ERROR', message=f"{type(e).__name__}: {e}")
+                results[i] = result
+                if on_result is not None:
+                    on_result(result)
+    finally:
+        # Interruption (Ctrl-C...): ne pas attendre les instances en cours
+        for _, executor in running.values():
+            executor.shutdown(wait=False)
+    return results
+
+
+def write_summary(results, path):
+    """Écrit le résumé au format JSON (extension .json) ou CSV"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == '.json':
+        path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        return
+    with open(path, 'w', encoding='utf-8', newline='') as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def add_arguments(parser):
+    """Options de la ligne de commande (partagées avec manage.py batch_solve)"""
+    parser.add_argument('sources', nargs='+', help="répertoires, motifs glob ou fichiers CSV d'instances")
+    parser.add_argument('--time-limit', type=float, default=None, help="budget CP-SAT par instance (secondes)")
+    parser.add_argument('--preset', choices=sorted(SOLVER_PRESETS), default=DEFAULT_PRESET)
+    parser.add_argument('--jobs', type=int, default=None, help="processus parallèles (défaut: cœurs / workers)")
+    parser.add_argument('--workers', type=int, default=1, help="threads CP-SAT par instance")
+    parser.add_argument('--seed', type=int, default=None, help="graine de la recherche CP-SAT")
+    parser.add_argument('--output', default=None, help="fichier de résumé (.csv ou .json)")
+
+
+def run(options, write=print):
+    """
+    Exécute un lot à partir des options de add_arguments
+
+    Args:
+        options: dictionnaire des options (argparse ou commande Django)
+        write: fonction d'affichage d'une ligne
+
+    Returns:
+        list: résultats (cf. solve_instance)
+
+    Raises:
+        FileNotFoundError: aucune instance trouvée
+    """
+    files = instance_files(options['sources'])
+    missing = [path for path in files if not path.is_file()]
+    if not files or missing:
+        raise FileNotFoundError(f"no instance file: {', '.join(map(str, missing or options['sources']))}")
+
+    def report(result):
+        objective = '-' if result['objective'] is None else f"{result['objective']:g}"
+        write(f"{result['status']:<11} {objective:>12} {result['wall_time'] or 0:>8.2f}s"
+              f" {result['peak_memory_mb'] or 0:>7.1f} MB  {result['instance']}")
+
+    started = time.perf_counter()
+    results = run_batch(
+        files, time_limit=options['time_limit'], preset=options['preset'], jobs=options['jobs'],
+        num_workers=options['workers'], random_seed=options['seed'], on_result=report
+    )
+    elapsed = time.perf_counter() - started
+
+    solved = sum(result['status'] in ('OPTIMAL', 'FEASIBLE') for result in results)
+    write(f"{len(results)} instance(s), {solved} solved, {elapsed:.1f} s"
+          f" ({len(results) / elapsed * 60:.1f} instances/min)")
+    if options['output']:
+        write_summary(results, options['output'])
+        write(f"Summary written to {options['output']}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    try:
+        run(vars(parser.parse_args(argv)))
+    except FileNotFoundError as e:
+        parser.error(str(e))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Solution Cache - Cache persistant des résolutions, adressé par le contenu de l'instance
+
+Deux instances identiques (même CSV téléchargé deux fois, planning reconstruit à la
+main...) partagent la même empreinte canonique: la seconde résolution réutilise
+l'affectation déjà calculée au lieu de relancer CP-SAT.
+
+L'empreinte canonique ignore:
+- l'ordre des lignes (les tâches sont triées par nom);
+- l'ordre et le séparateur des successeurs ("b,c", "c;b" et "c, b" sont équivalents);
+- le nom des machines: elles sont identiques, seul leur nombre compte. Les
+  affectations sont stockées par indice de machine puis re-projetées sur les
+  machines du nouveau planning.
+
+Le nom des tâches est conservé: il porte les relations de précédence.
+"""
+from django.conf import settings
+from django.db.models import F, Sum
+from django.utils import timezone
+from .models import CachedSolution
+from .precedence import parse_successors
+import hashlib
+import json
+
+
+def canonical_fingerprint(tasks_dict, machines_list):
+    """
+    Calcule l'empreinte canonique d'une instance
+
+    Args:
+        tasks_dict: dictionnaire {nom: taskInfo}
+        machines_list: liste des noms de machines
+
+    Returns:
+        str: empreinte SHA-256 hexadécimale
+    """
+    payload = {
+        'tasks': sorted(
+            [name, info.duration, sorted(parse_successors(info.successors)), info.release_date, info.due_date]
+            for name, info in tasks_dict.items()
+        ),
+        'num_machines': len(machines_list),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def lookup(fingerprint, tasks_dict, machines_list, max_gap=0.0):
+    """
+    Cherche une solution en cache et la projette sur les machines de l'instance
+
+    Args:
+        fingerprint: empreinte canonique (cf. canonical_fingerprint)
+        tasks_dict: dictionnaire {nom: taskInfo} de l'instance à résoudre
+        machines_list: liste des machines de l'instance à résoudre
+        max_gap: écart relatif maximal accepté pour la solution en cache
+                 (une solution obtenue avec une tolérance plus large est ignorée)
+
+    Returns:
+        tuple: (CachedSolution, ordonnancement {tâche: {...}} ou None si infaisable)
+               ou (None, None) si absent du cache
+    """
+    entry = CachedSolution.objects.filter(fingerprint=fingerprint).first()
+    if entry is None or entry.relative_gap > max_gap:
+        return None, None
+
+    CachedSolution.objects.filter(id=entry.id).update(
+        hit_count=F('hit_count') + 1, last_used_at=timezone.now()
+    )
+
+    if entry.solver_status == 'INFEASIBLE':
+        return entry, None
+
+    schedule = {}
+    for task_name, (start, machine_index) in entry.assignments.items():
+        task_info = tasks_dict[task_name]
+        end = start + task_info.duration
+        schedule[task_name] = {
+            'start': start,
+            'end': end,
+            'duration': task_info.duration,
+            'machine': machines_list[machine_index],
+            'release_date': task_info.release_date,
+            'due_date': task_info.due_date,
+            'slack': task_info.due_date - end,
+            'successor': task_info.successors
+        }
+
+    return entry, schedule
+
+
+def store(fingerprint, machines_list, solution, solver_status, objective_value,
+          best_bound, relative_gap):
+    """
+    Enregistre une solution prouvée (optimale ou infaisable) dans le cache
+
+    Args:
+        fingerprint: empreinte canonique de l'instance
+        machines_list: liste des machines de l'instance résolue
+        solution: ordonnancement {tâche: {start, machine, ...}} (None si infaisable)
+        solver_status: statut CP-SAT ('OPTIMAL' ou 'INFEASIBLE')
+        objective_value: valeur de l'objectif
+        best_bound: meilleure borne prouvée
+        relative_gap: tolérance relative utilisée pour la résolution
+    """
+    machine_index = {machine: i for i, machine in enumerate(machines_list)}
+    assignments = {
+        task_name: [info['start'], machine_index[info['machine']]]
+        for task_name, info in (solution or {}).items()
+    }
+    size_bytes = len(json.dumps(assignments))
+
+    CachedSolution.objects.update_or_create(fingerprint=fingerprint, defaults={
+        'num_machines': len(machines_list),
+        'solver_status': solver_status,
+        'objective_value': objective_value,
+        'best_bound': best_bound,
+        'relative_gap': relative_gap,
+        'assignments': assignments,
+        'size_bytes': size_bytes,
+        'last_used_at': timezone.now(),
+    })
+    evict()
+
+
+def evict(max_bytes=None):
+    """
+    Supprime les entrées les moins récemment utilisées au-delà de la taille maximale
+
+    Args:
+        max_bytes: taille maximale du cache (None = SCHEDULER_SOLUTION_CACHE_MAX_BYTES)
+    """
+    if max_bytes is None:
+        max_bytes = getattr(settings, 'SCHEDULER_SOLUTION_CACHE_MAX_BYTES', 50 * 1024 * 1024)
+
+    total = CachedSolution.objects.aggregate(total=Sum('size_bytes'))['total'] or 0
+    if total <= max_bytes:
+        return
+
+    stale_ids = []
+    for entry_id, size_bytes in CachedSolution.objects.order_by('last_used_at').values_list('id', 'size_bytes'):
+        if total <= max_bytes:
+            break
+        stale_ids.append(entry_id)
+        total -= size_bytes
+
+    CachedSolution.objects.filter(id__in=stale_ids).delete()
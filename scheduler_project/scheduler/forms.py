@@ -2,7 +2,8 @@
 Formulaires pour le planificateur de tâches
 """
 from django import forms
-from .models import Task, Machine, UploadedFile
+from .models import Schedule, Task, Machine, UploadedFile
+from .precedence import parse_successors, format_successors
 
 
 class CSVUploadForm(forms.ModelForm):
@@ -50,7 +51,7 @@ class TaskForm(forms.ModelForm):
     """
     class Meta:
         model = Task
-        fields = ['name', 'duration', 'successor_name', 'release_date', 'due_date']
+        fields = ['name', 'duration', 'successors', 'release_date', 'due_date']
         widgets = {
             'name': forms.TextInput(attrs={
                 'class': 'form-control',
@@ -61,9 +62,9 @@ class TaskForm(forms.ModelForm):
                 'min': '1',
                 'placeholder': 'Durée de la tâche'
             }),
-            'successor_name': forms.TextInput(attrs={
+            'successors': forms.TextInput(attrs={
                 'class': 'form-control',
-                'placeholder': 'none ou nom de la tâche successeur'
+                'placeholder': 'none, ou noms des successeurs séparés par des virgules'
             }),
             'release_date': forms.NumberInput(attrs={
                 'class': 'form-control',
@@ -78,10 +79,17 @@ class TaskForm(forms.ModelForm):
             }),
         }
     
-    def clean_successor_name(self):
-        """Nettoie et valide le nom du successeur"""
-        successor = self.cleaned_data.get('successor_name', '').strip()
-        return successor if successor else 'none'
+    def clean_successors(self):
+        """Normalise la liste des successeurs ("a, b;c" -> "a,b,c", vide -> "none")"""
+        return format_successors(parse_successors(self.cleaned_data.get('successors', '')))
+    
+    def clean(self):
+        """Une tâche ne peut pas être son propre successeur"""
+        cleaned_data = super().clean()
+        name = (cleaned_data.get('name') or '').strip()
+        if name and name in parse_successors(cleaned_data.get('successors')):
+            self.add_error('successors', "Une tâche ne peut pas être son propre successeur.")
+        return cleaned_data
 
 
 class ScheduleNameForm(forms.Form):
@@ -95,3 +103,48 @@ class ScheduleNameForm(forms.Form):
             'placeholder': 'Entrez le nom du planning'
         })
     )
+
+
+class SolveOptionsForm(forms.ModelForm):
+    """
+    Options de résolution d'un planning (budget de temps, préréglage CP-SAT)
+    """
+    class Meta:
+        model = Schedule
+        fields = ['engine', 'time_limit', 'solver_preset', 'formulation', 'random_seed']
+        labels = {
+            'engine': 'Moteur',
+            'time_limit': 'Budget de temps (s)',
+            'solver_preset': 'Préréglage du solveur',
+            'formulation': 'Formulation',
+            'random_seed': 'Graine aléatoire'
+        }
+        widgets = {
+            'engine': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'time_limit': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': '0.1',
+                'step': '0.1',
+                'placeholder': 'Par défaut'
+            }),
+            'solver_preset': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'formulation': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'random_seed': forms.NumberInput(attrs={
+                'class': 'form-control',
+                'min': '0',
+                'placeholder': 'Par défaut'
+            })
+        }
+    
+    def clean_time_limit(self):
+        """Le budget de temps doit être strictement positif"""
+        time_limit = self.cleaned_data.get('time_limit')
+        if time_limit is not None and time_limit <= 0:
+            raise forms.ValidationError("Le budget de temps doit être positif.")
+        return time_limit
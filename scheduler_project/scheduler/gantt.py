@@ -0,0 +1,222 @@
+"""
+Gantt Service - Rendu des diagrammes de Gantt
+
+Chaque ligne de machine est dessinée par un seul appel broken_barh (une
+collection de rectangles) au lieu d'un barh par tâche, et seules les barres
+assez larges pour contenir leur nom reçoivent une étiquette. La taille de la
+figure et la résolution suivent l'instance:
+
+- hauteur proportionnelle au nombre de machines, largeur au nombre de tâches
+  par machine (bornées);
+- résolution PNG réduite au-delà de MAX_PIXELS pixels (image sous-échantillonnée);
+- sortie SVG (vectorielle, texte non converti en chemins) pour zoomer sans perte.
+
+Au-delà de 20 projets la palette tab20 est complétée par des teintes réparties
+selon le nombre d'or, et la légende n'affiche que les LEGEND_PROJECTS premiers.
+
+Matplotlib n'est importé qu'au premier rendu: les processus qui ne dessinent
+rien (résolution en lot, cf. batch.py) ne paient pas son temps d'import.
+"""
+import colorsys
+import io
+import math
+
+
+# Formats de sortie supportés
+FORMATS = ('png', 'svg')
+
+# Géométrie de la figure (pouces)
+FIGURE_WIDTH = 14
+MAX_FIGURE_WIDTH = 40
+MIN_FIGURE_HEIGHT = 6
+MAX_FIGURE_HEIGHT = 60
+LANE_HEIGHT = 1.5       # hauteur d'une ligne de machine sur les petites instances
+MIN_LANE_HEIGHT = 0.25  # hauteur minimale d'une ligne sur les grandes instances
+TASKS_PER_INCH = 4      # densité de barres au-delà de laquelle la figure s'élargit
+
+# Résolution PNG: DPI par défaut, réduit pour rester sous MAX_PIXELS pixels
+DPI = 150
+MIN_DPI = 50
+MAX_PIXELS = 24_000_000
+
+# Étiquettes: taille de police et nombre maximal de noms affichés
+LABEL_FONT_SIZE = 9
+MIN_LABEL_FONT_SIZE = 6
+MAX_LABELS = 3000
+
+# Nombre de projets listés dans la légende
+LEGEND_PROJECTS = 20
+
+
+def project_name(task_name):
+    """Projet d'une tâche (préfixe avant le dernier '_<numéro>')"""
+    parts = task_name.rsplit('_', 1)
+    if len(parts) == 2 and parts[1].isdigit():
+        return parts[0]
+    return task_name
+
+
+def project_palette(projects):
+    """
+    Couleur de chaque projet
+
+    Les 20 premiers projets reprennent la palette tab20; les suivants reçoivent
+    des teintes espacées selon le nombre d'or (jamais deux fois la même couleur).
+
+    Args:
+        projects: liste triée des noms de projets
+
+    Returns:
+        dict: {projet: (r, g, b, a)}
+    """
+    import matplotlib
+    base = matplotlib.colormaps['tab20'].colors
+    palette = {}
+    for i, project in enumerate(projects):
+        if i < len(base):
+            palette[project] = (*base[i], 1.0)
+        else:
+            k = i - len(base)
+            hue = (k * 0.618033988749895) % 1.0
+            lightness = (0.45, 0.6, 0.35)[k % 3]
+            palette[project] = (*colorsys.hls_to_rgb(hue, lightness, 0.65), 1.0)
+    return palette
+
+
+def figure_geometry(machine_count, task_count, image_format='png'):
+    """
+    Taille de la figure et résolution adaptées à l'instance
+
+    Args:
+        machine_count: nombre de lignes (machines)
+        task_count: nombre de tâches
+        image_format: 'png' ou 'svg'
+
+    Returns:
+        tuple: (largeur en pouces, hauteur en pouces, dpi)
+    """
+    lane_height = max(MIN_LANE_HEIGHT, min(LANE_HEIGHT, 12 / max(1, machine_count)))
+    height = min(MAX_FIGURE_HEIGHT, max(MIN_FIGURE_HEIGHT, machine_count * lane_height + 2))
+
+    tasks_per_lane = task_count / max(1, machine_count)
+    width = min(MAX_FIGURE_WIDTH, max(FIGURE_WIDTH, tasks_per_lane / TASKS_PER_INCH))
+
+    dpi = DPI
+    if image_format == 'png':
+        dpi = max(MIN_DPI, min(DPI, int(math.sqrt(MAX_PIXELS / (width * height)))))
+    return width, height, dpi
+
+
+def text_color(color):
+    """Noir ou blanc selon la luminance de la couleur de fond"""
+    r, g, b = color[:3]
+    return 'black' if 0.299 * r + 0.587 * g + 0.114 * b > 0.6 else 'white'
+
+
+def render_gantt(schedule, machines, image_format='png'):
+    """
+    Rend un diagramme de Gantt
+
+    Args:
+        schedule: dictionnaire {tâche: {start, end, machine, ...}} (cf. get_schedule)
+        machines: liste des machines, dans l'ordre des lignes du diagramme
+        image_format: 'png' ou 'svg'
+
+    Returns:
+        bytes: image au format demandé, ou None si l'ordonnancement est vide
+    """
+    if image_format not in FORMATS:
+        raise ValueError(f"Unsupported Gantt format: {image_format}")
+    if not schedule:
+        return None
+
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-GUI backend
+    import matplotlib.patches as mpatches
+    from matplotlib.figure import Figure
+
+    projects = sorted({project_name(task_name) for task_name in schedule})
+    palette = project_palette(projects)
+
+    # Grouper par machine: (début, durée, nom) triés par date de début
+    lanes = {machine: [] for machine in machines}
+    for task_name, info in schedule.items():
+        lane = lanes.get(info['machine'])
+        if lane is not None:
+            lane.append((info['start'], info['end'] - info['start'], task_name))
+
+    max_time = max(info['end'] for info in schedule.values()) or 1
+    width, height, dpi = figure_geometry(len(machines), len(schedule), image_format)
+
+    # Créer la figure (API objet: pyplot n'est pas sûr entre les threads du pool de jobs)
+    fig = Figure(figsize=(width, height))
+    ax = fig.subplots()
+    ax.set_xlim(0, max_time * 1.05)
+    ax.set_ylim(len(machines) - 0.5, -0.5)
+
+    # Largeur d'une unité de temps en points, pour savoir si un nom tient dans sa barre
+    points_per_unit = 0.8 * width * 72 / (max_time * 1.05)
+    font_size = max(MIN_LABEL_FONT_SIZE, min(LABEL_FONT_SIZE, 0.45 * height * 72 / max(1, len(machines))))
+    bar_height = 0.6 if len(machines) <= 40 else 0.8
+    edge_width = 1.5 if len(schedule) <= 200 else 0.3
+
+    labels = []
+    for y_pos, machine in enumerate(machines):
+        tasks = sorted(lanes[machine])
+        if not tasks:
+            continue
+        colors = [palette[project_name(task_name)] for _, _, task_name in tasks]
+        ax.broken_barh(
+            [(start, duration) for start, duration, _ in tasks],
+            (y_pos - bar_height / 2, bar_height),
+            facecolors=colors, edgecolor='black', linewidth=edge_width, alpha=0.85
+        )
+
+        for (start, duration, task_name), color in zip(tasks, colors):
+            # ~0.6 em par caractère en gras, plus une marge
+            if duration * points_per_unit >= (len(task_name) * 0.6 + 1) * font_size:
+                labels.append((start + duration / 2, y_pos, task_name, color))
+
+    # Au-delà de MAX_LABELS, les noms ne sont plus lisibles: on n'étiquette que les plus longues barres
+    if len(labels) > MAX_LABELS:
+        labels = sorted(labels, key=lambda label: schedule[label[2]]['start'] - schedule[label[2]]['end'])[:MAX_LABELS]
+    for x, y, task_name, color in labels:
+        ax.text(x, y, task_name, ha='center', va='center', fontsize=font_size,
+                fontweight='bold', color=text_color(color), clip_on=True)
+
+    ax.set_yticks(range(len(machines)))
+    ax.set_yticklabels(machines, fontsize=min(11, font_size + 2), fontweight='bold')
+    ax.set_ylabel('Machines', fontsize=12, fontweight='bold')
+    ax.set_xlabel('Time', fontsize=12, fontweight='bold')
+    ax.set_title('Gantt Chart - Parallel Machine Scheduling',
+                 fontsize=14, fontweight='bold')
+
+    ax.grid(axis='x', alpha=0.4, linestyle='--')
+    ax.set_axisbelow(True)
+
+    # Légende (hors du tracé pour ne pas masquer les barres)
+    legend_patches = [
+        mpatches.Patch(color=palette[project], label=project, alpha=0.85)
+        for project in projects[:LEGEND_PROJECTS]
+    ]
+    if len(projects) > LEGEND_PROJECTS:
+        legend_patches.append(mpatches.Patch(
+            color='none', label=f"+{len(projects) - LEGEND_PROJECTS} more"
+        ))
+    ax.legend(handles=legend_patches, loc='upper left', bbox_to_anchor=(1.01, 1),
+              fontsize=9, title='Projects')
+
+    buffer = io.BytesIO()
+    with matplotlib.rc_context({'svg.fonttype': 'none'}):
+        fig.savefig(buffer, format=image_format, dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+
+def render_gantt_png(schedule, machines):
+    """Rend un diagramme de Gantt au format PNG (cf. render_gantt)"""
+    return render_gantt(schedule, machines, 'png')
+
+
+def render_gantt_svg(schedule, machines):
+    """Rend un diagramme de Gantt au format SVG (cf. render_gantt)"""
+    return render_gantt(schedule, machines, 'svg')
@@ -0,0 +1,324 @@
+"""
+Heuristic Service - Ordonnancement par liste pour les très grandes instances
+
+Alternative rapide à Machine_Parallele (CP-SAT) pour des milliers de tâches:
+aperçu immédiat d'un planning, ou solution de départ (indice et borne supérieure)
+pour CP-SAT.
+
+Principe (ordonnancement par liste sur machines identiques):
+1. Propagation des fenêtres de temps le long des précédences (ordre topologique):
+   date de disponibilité au plus tôt et date d'échéance au plus tard de chaque tâche.
+2. Priorité des tâches: EDD (échéance propagée la plus proche) ou marge minimale
+   (date de début au plus tard la plus proche). Les deux ordres sont compatibles
+   avec les précédences: un prédécesseur passe toujours avant son successeur.
+3. Placement des tâches dans l'ordre de priorité, chacune au plus tôt sur la
+   machine libre qui laisse le moins de temps mort.
+
+Les échéances ne sont pas garanties: l'heuristique peut produire des tâches en
+retard (marge négative) là où CP-SAT prouverait l'infaisabilité.
+"""
+from bisect import bisect_right, insort
+import time
+import numpy as np
+
+from .precedence import PrecedenceGraph
+
+
+# Règles de priorité disponibles
+PRIORITIES = ('edd', 'least_slack')
+
+
+class FreeList:
+    """
+    Multiensemble trié d'entiers découpé en blocs (insertion et retrait en O(√n)).
+
+    Une liste triée unique imposerait un déplacement mémoire proportionnel au
+    nombre de machines à chaque insertion.
+    """
+
+    BLOCK = 512
+
+    def __init__(self):
+        self.blocks = []  # blocs triés, concaténés dans l'ordre
+        self.maxes = []   # dernier élément de chaque bloc
+
+    def pop_floor(self, key):
+        """Retire et retourne le plus grand élément <= key (None s'il n'existe pas)"""
+        maxes = self.maxes
+        b = bisect_right(maxes, key)
+        i = bisect_right(self.blocks[b], key) - 1 if b < len(maxes) else -1
+        if i < 0:
+            # Tous les éléments du bloc b dépassent key: le plancher est la fin du bloc précédent
+            if b == 0:
+                return None
+            b -= 1
+            i = len(self.blocks[b]) - 1
+        block = self.blocks[b]
+        value = block.pop(i)
+        if not block:
+            del self.blocks[b]
+            del maxes[b]
+        elif i == len(block):
+            maxes[b] = block[-1]
+        return value
+
+    def pop_min(self):
+        """Retire et retourne le plus petit élément"""
+        block = self.blocks[0]
+        value = block.pop(0)
+        if not block:
+            del self.blocks[0]
+            del self.maxes[0]
+        return value
+
+    def add(self, value):
+        """Insère un élément"""
+        maxes = self.maxes
+        if not maxes:
+            self.blocks.append([value])
+            maxes.append(value)
+            return
+        b = bisect_right(maxes, value)
+        if b == len(maxes):
+            b -= 1
+            block = self.blocks[b]
+            block.append(value)
+            maxes[b] = value
+        else:
+            block = self.blocks[b]
+            insort(block, value)
+        if len(block) > 2 * self.BLOCK:
+            half = len(block) // 2
+            self.blocks[b:b + 1] = [block[:half], block[half:]]
+            maxes[b:b + 1] = [block[half - 1], block[-1]]
+
+
+class Ordonnancement_Liste:
+    """
+    Heuristique d'ordonnancement par liste (mêmes entrées et même format de
+    sortie que Machine_Parallele).
+    """
+
+    def __init__(self, taskInfo, tasks, machines, priority='auto', solve=True):
+        """
+        Initialise l'heuristique.
+
+        Paramètres:
+            taskInfo: namedtuple définissant la structure des tâches
+            tasks: dictionnaire des tâches {nom: taskInfo(duration, successors, release_date, due_date)}
+            machines: liste des machines disponibles
+            priority: règle de priorité ('edd', 'least_slack', ou 'auto' pour garder
+                      le meilleur des deux ordonnancements)
+            solve: calculer immédiatement l'ordonnancement (cf. solve())
+        """
+        if priority != 'auto' and priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority rule: {priority}")
+
+        self.taskInfo = taskInfo
+        self.tasks = tasks
+        self.machines = machines
+        self.priority = priority
+
+        # Représentation vectorielle des tâches (indices dans self.names)
+        self.names = list(self.tasks)
+        self.duration = np.fromiter((info.duration for info in self.tasks.values()), dtype=np.int64, count=len(self.names))
+        self.release = np.fromiter((info.release_date for info in self.tasks.values()), dtype=np.int64, count=len(self.names))
+        self.due = np.fromiter((info.due_date for info in self.tasks.values()), dtype=np.int64, count=len(self.names))
+        self.graph = PrecedenceGraph(self.tasks)
+
+        self.start = None
+        self.assigned = None
+        self.objective_value = None
+        self.wall_time = 0.0
+
+        if solve:
+            self.solve()
+
+    def propagate_windows(self):
+        """
+        Propage les fenêtres de temps le long des précédences.
+
+        Une passe avant sur les arcs du graphe (réduit) dans l'ordre topologique,
+        puis une passe arrière dans l'ordre inverse, en O(n + e) (hors tri des arcs):
+            release[succ] >= release[i] + duration[i]   (passe avant)
+            due[i] <= due[succ] - duration[succ]        (passe arrière)
+
+        Retour:
+            tuple: (release, due) propagés (tableaux NumPy)
+
+        Exception:
+            ValueError si les précédences forment un cycle
+        """
+        if not self.graph.is_acyclic():
+            raise ValueError("Precedence constraints contain a cycle")
+
+        # Arcs triés par position topologique de leur origine: en passe avant, toutes les
+        # précédences entrant dans une tâche sont traitées avant celles qui en sortent
+        position = np.empty(len(self.names), dtype=np.int64)
+        position[self.graph.order] = np.arange(len(self.names))
+        by_position = np.argsort(position[self.graph.sources], kind='stable')
+        sources = self.graph.sources[by_position].tolist()
+        targets = self.graph.targets[by_position].tolist()
+
+        release = self.release.tolist()
+        due = self.due.tolist()
+        duration = self.duration.tolist()
+
+        for i, j in zip(sources, targets):
+            end = release[i] + duration[i]
+            if release[j] < end:
+                release[j] = end
+
+        for i, j in zip(reversed(sources), reversed(targets)):
+            latest_start = due[j] - duration[j]
+            if due[i] > latest_start:
+                due[i] = latest_start
+
+        return np.array(release, dtype=np.int64), np.array(due, dtype=np.int64)
+
+    def priority_order(self, rule, release, due):
+        """
+        Ordre de placement des tâches pour une règle de priorité.
+
+        Les égalités sont départagées par date de disponibilité puis par indice,
+        ce qui rend l'ordre déterministe.
+        """
+        if rule == 'edd':
+            key = due
+        else:
+            key = due - self.duration  # date de début au plus tard
+        return np.lexsort((np.arange(len(self.names)), release, key))
+
+    def dispatch(self, order, release):
+        """
+        Place les tâches dans l'ordre donné (schéma sériel).
+
+        Chaque tâche démarre au plus tôt (disponibilité, fin de ses prédécesseurs)
+        sur la machine libre qui a terminé le plus tard (moins de temps mort);
+        si aucune n'est libre, sur celle qui se libère la première.
+
+        Les machines encore inutilisées sont interchangeables: elles restent dans
+        une simple pile; les machines utilisées sont rangées dans une FreeList
+        par clé date_de_libération * nombre_de_machines + indice.
+
+        Retour:
+            tuple: (start, machine_index) (tableaux NumPy)
+        """
+        ready = release.tolist()
+        duration = self.duration.tolist()
+        successors = self.graph.successor_lists()
+        start = [0] * len(self.names)
+        assigned = [0] * len(self.names)
+
+        num_machines = len(self.machines)
+        busy = FreeList()
+        unused = list(range(num_machines - 1, -1, -1))
+
+        for task in order.tolist():
+            task_start = ready[task]
+            key = busy.pop_floor(task_start * num_machines + num_machines - 1)
+            if key is None:
+                if unused:
+                    key = unused.pop()
+                else:
+                    key = busy.pop_min()
+                    task_start = key // num_machines
+            machine_index = key % num_machines
+
+            task_end = task_start + duration[task]
+            start[task] = task_start
+            assigned[task] = machine_index
+            busy.add(task_end * num_machines + machine_index)
+
+            for succ in successors[task]:
+                if ready[succ] < task_end:
+                    ready[succ] = task_end
+
+        return np.array(start, dtype=np.int64), np.array(assigned, dtype=np.int64)
+
+    def solve(self):
+        """
+        Calcule l'ordonnancement.
+
+        Avec priority='auto', les deux règles sont essayées: l'ordonnancement
+        retenu est celui qui a le moins de tâches en retard, puis le plus petit
+        objectif (somme des dates de début, comme Machine_Parallele).
+
+        Retour:
+            int: valeur de l'objectif (somme des dates de début)
+        """
+        started = time.perf_counter()
+
+        if not self.machines or not self.names:
+            self.rule = None
+            self.start = np.zeros(len(self.names), dtype=np.int64)
+            self.assigned = np.zeros(len(self.names), dtype=np.int64)
+        else:
+            release, due = self.propagate_windows()
+            rules = PRIORITIES if self.priority == 'auto' else (self.priority,)
+
+            best = None
+            for rule in rules:
+                start, assigned = self.dispatch(self.priority_order(rule, release, due), release)
+                late = int(np.count_nonzero(start + self.duration > self.due))
+                score = (late, int(start.sum()))
+                if best is None or score < best[0]:
+                    best = (score, rule, start, assigned)
+            _, self.rule, self.start, self.assigned = best
+
+        self.objective_value = int(self.start.sum())
+        self.wall_time = time.perf_counter() - started
+        return self.objective_value
+
+    def late_tasks(self):
+        """Nombre de tâches terminant après leur date d'échéance"""
+        if self.start is None:
+            return None
+        return int(np.count_nonzero(self.start + self.duration > self.due))
+
+    def is_feasible(self):
+        """Indique si l'ordonnancement respecte toutes les échéances"""
+        return self.late_tasks() == 0
+
+    def get_schedule(self):
+        """
+        Retourne l'ordonnancement complet sous forme de dictionnaire
+        (même format que Machine_Parallele.get_schedule).
+        """
+        if self.start is None or not self.machines:
+            return None
+
+        end = self.start + self.duration
+        slack = self.due - end
+        schedule = {}
+        for i, (task_name, task_info) in enumerate(self.tasks.items()):
+            schedule[task_name] = {
+                'start': int(self.start[i]),
+                'end': int(end[i]),
+                'duration': task_info.duration,
+                'machine': self.machines[self.assigned[i]],
+                'release_date': task_info.release_date,
+                'due_date': task_info.due_date,
+                'slack': int(slack[i]),
+                'successor': task_info.successors
+            }
+
+        return schedule
+
+    def get_makespan(self):
+        """Retourne le makespan (durée totale du projet)."""
+        if self.start is None or not self.names:
+            return None
+        return int((self.start + self.duration).max())
+
+    def get_hints(self):
+        """
+        Retourne l'ordonnancement au format des indices de Machine_Parallele
+        (démarrage à chaud): {nom: (start, machine)}
+        """
+        if self.start is None or not self.machines:
+            return {}
+        return {
+            task_name: (int(self.start[i]), self.machines[self.assigned[i]])
+            for i, task_name in enumerate(self.names)
+        }
@@ -0,0 +1,176 @@
+"""
+Ingest Service - Import en flux des fichiers CSV
+
+Le fichier est lu ligne à ligne et chaque ligne est validée au passage:
+les tâches sont insérées par lots (bulk_create) dans une seule transaction,
+sans jamais construire l'instance complète en mémoire. La première erreur
+interrompt l'import (rien n'est écrit) et indique la ligne fautive.
+
+Format attendu (plusieurs successeurs: noms séparés par des virgules, entre
+guillemets, ou par des points-virgules):
+    task_name,duration,successors,release_date,due_date
+    task_a_1,61,"task_a_2,task_b_2",243,398
+    ...
+    MACHINES,"M1,M2,M3",,,
+"""
+import csv
+import time
+
+from django.db import transaction
+
+from .precedence import parse_successors, format_successors
+
+
+# Nombre de tâches insérées par requête
+BATCH_SIZE = 2000
+
+# Colonnes obligatoires de l'en-tête
+COLUMNS = ('task_name', 'duration', 'successors', 'release_date', 'due_date')
+
+
+class CSVIngestError(ValueError):
+    """Erreur de format ou de contenu dans un fichier CSV (avec le numéro de ligne)"""
+
+    def __init__(self, line, message):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+        self.message = message
+
+
+class CSVStream:
+    """
+    Lecture validée d'un fichier CSV de planning, ligne par ligne.
+
+    L'itération produit (ligne, nom, durée, successeurs, disponibilité, échéance)
+    pour chaque tâche (successeurs sous forme normalisée "a,b" ou "none"); la liste des machines (ligne MACHINES, qui termine les
+    tâches) est disponible dans self.machines une fois l'itération terminée.
+    """
+
+    def __init__(self, csvfile):
+        self.reader = csv.reader(csvfile)
+        self.machines = []
+        self.rows = 0
+
+    def __iter__(self):
+        header = next(self.reader, None)
+        if header is None:
+            raise CSVIngestError(1, "empty file")
+        header = [column.strip() for column in header]
+        missing = [column for column in COLUMNS if column not in header]
+        if missing:
+            raise CSVIngestError(1, f"missing column(s): {', '.join(missing)}")
+        index = [header.index(column) for column in COLUMNS]
+        width = max(index) + 1
+
+        seen = set()
+        referenced = {}  # successeur référencé -> première ligne qui le référence
+        for row in self.reader:
+            line = self.reader.line_num
+            if not row or not row[0].strip():
+                continue  # Ignorer les lignes vides
+            if len(row) < width:
+                row = row + [''] * (width - len(row))
+            name, duration, successors, release_date, due_date = (row[i].strip() for i in index)
+
+            if name == 'MACHINES':
+                self.machines = self.parse_machines(line, duration)
+                break
+
+            self.rows += 1
+            duration = self.parse_int(line, 'duration', duration)
+            release_date = self.parse_int(line, 'release_date', release_date)
+            due_date = self.parse_int(line, 'due_date', due_date)
+            if duration <= 0:
+                raise CSVIngestError(line, f"task {name}: duration must be positive (got {duration})")
+            if release_date < 0:
+                raise CSVIngestError(line, f"task {name}: release_date must not be negative (got {release_date})")
+            if name in seen:
+                raise CSVIngestError(line, f"duplicate task name {name}")
+            seen.add(name)
+            successors = parse_successors(successors)
+            for successor in successors:
+                if successor == name:
+                    raise CSVIngestError(line, f"task {name} cannot be its own successor")
+                referenced.setdefault(successor, line)
+
+            yield line, name, duration, format_successors(successors), release_date, due_date
+
+        # Les successeurs peuvent être définis plus bas dans le fichier: vérification en fin de lecture
+        # (les cycles sont détectés à la résolution, cf. presolve.py)
+        for successor, line in referenced.items():
+            if successor not in seen:
+                raise CSVIngestError(line, f"unknown successor {successor}")
+
+    @staticmethod
+    def parse_int(line, column, value):
+        """Convertit une cellule en entier (erreur localisée sinon)"""
+        try:
+            return int(value)
+        except ValueError:
+            raise CSVIngestError(line, f"{column} must be an integer (got {value!r})") from None
+
+    @staticmethod
+    def parse_machines(line, value):
+        """Liste des machines de la ligne MACHINES (noms uniques, non vides)"""
+        machines = [name.strip() for name in value.split(',') if name.strip()]
+        if not machines:
+            raise CSVIngestError(line, "MACHINES row lists no machine")
+        duplicates = sorted({name for name in machines if machines.count(name) > 1})
+        if duplicates:
+            raise CSVIngestError(line, f"duplicate machine name(s): {', '.join(duplicates)}")
+        return machines
+
+
+def ingest_csv(schedule, file_path, batch_size=BATCH_SIZE):
+    """
+    Importe les tâches et machines d'un fichier CSV dans un planning
+
+    Args:
+        schedule: instance de Schedule (vide)
+        file_path: chemin du fichier CSV
+        batch_size: nombre de tâches par insertion groupée
+
+    Returns:
+        dict: {tasks, machines, elapsed, rows_per_second}
+
+    Raises:
+        CSVIngestError: première ligne invalide (aucune donnée n'est écrite)
+    """
+    # Import local: CSVStream reste utilisable sans configurer Django (cf. batch.py)
+    from .models import Machine, Task
+    
+    started = time.perf_counter()
+    tasks = 0
+
+    with transaction.atomic(), open(file_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+        stream = CSVStream(csvfile)
+        batch = []
+        try:
+            for _, name, duration, successors, release_date, due_date in stream:
+                batch.append(Task(
+                    schedule=schedule,
+                    name=name,
+                    duration=duration,
+                    successors=successors,
+                    release_date=release_date,
+                    due_date=due_date
+                ))
+                if len(batch) >= batch_size:
+                    Task.objects.bulk_create(batch)
+                    tasks += len(batch)
+                    batch = []
+        except UnicodeDecodeError:
+            raise CSVIngestError(stream.reader.line_num + 1, "file is not UTF-8 encoded") from None
+        if batch:
+            Task.objects.bulk_create(batch)
+            tasks += len(batch)
+
+        Machine.objects.bulk_create(Machine(schedule=schedule, name=name) for name in stream.machines)
+
+    elapsed = time.perf_counter() - started
+    return {
+        'tasks': tasks,
+        'machines': len(stream.machines),
+        'elapsed': elapsed,
+        'rows_per_second': stream.rows / elapsed if elapsed > 0 else 0.0,
+    }
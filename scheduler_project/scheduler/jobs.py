@@ -0,0 +1,258 @@
+"""
+Job Service - Exécute les résolutions CP-SAT en arrière-plan
+
+Les résolutions sont placées dans un pool de threads local au processus
+(CP-SAT libère le GIL pendant la recherche). La vue de résolution répond
+immédiatement; l'avancement est suivi via le modèle SolveJob.
+
+Chaque job porte l'identité du processus qui l'exécute (SolveJob.owner) et un
+signe de vie (heartbeat_at) rafraîchi par ce processus. Un job actif dont le
+processus a disparu (redémarrage, arrêt brutal) ne se terminerait jamais: il est
+marqué en échec (cf. recover_orphaned_jobs), sans toucher aux jobs des autres
+processus vivants du serveur (gunicorn -w N...).
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.utils import timezone
+from .models import Schedule, SolveJob
+from .solver import solve_schedule, available_cores
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+# Intervalles de signe de vie sans nouvelle d'un job actif avant de le considérer perdu
+HEARTBEAT_MISSES = 3
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Identité du processus courant (pid, "hôte:pid:jeton"), cf. process_owner
+_owner = None
+_last_recovery = None
+
+# Jobs dont l'utilisateur a accepté la meilleure solution courante
+_stop_requests = set()
+
+
+def heartbeat_interval():
+    """Intervalle (secondes) de rafraîchissement du signe de vie des jobs"""
+    return getattr(settings, 'SCHEDULER_JOB_HEARTBEAT', 30.0)
+
+
+def process_owner():
+    """
+    Identifiant du processus courant: "hôte:pid:jeton"
+    
+    Le jeton distingue deux processus ayant eu le même pid; l'identifiant est
+    recalculé après un fork (serveur qui importe l'application avant de créer ses workers).
+    """
+    global _owner
+    pid = os.getpid()
+    if _owner is None or _owner[0] != pid:
+        _owner = (pid, f"{socket.gethostname()}:{pid}:{uuid.uuid4().hex[:12]}")
+    return _owner[1]
+
+
+def owner_alive(owner):
+    """
+    Indique si le processus propriétaire d'un job peut encore être vivant
+    
+    Seul un processus de la même machine peut être vérifié (pid inexistant);
+    sinon seul le signe de vie fait foi.
+    """
+    if owner == process_owner():
+        return True
+    host, _, rest = owner.partition(':')
+    pid = rest.partition(':')[0]
+    if os.name != 'posix' or host != socket.gethostname() or not pid.isdigit():
+        return True
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # processus existant d'un autre utilisateur
+    return True
+
+
+def get_executor():
+    """Retourne le pool de workers (créé au premier appel, avec le thread de signe de vie)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'SCHEDULER_SOLVE_WORKERS', 2),
+                thread_name_prefix='solve'
+            )
+            threading.Thread(target=heartbeat_loop, name='solve-heartbeat', daemon=True).start()
+        return _executor
+
+
+def heartbeat_loop():
+    """Rafraîchit périodiquement le signe de vie des jobs actifs de ce processus (thread démon)"""
+    while True:
+        time.sleep(heartbeat_interval())
+        try:
+            SolveJob.objects.filter(owner=process_owner(), status__in=ACTIVE_STATUSES).update(
+                heartbeat_at=timezone.now()
+            )
+        except Exception:
+            logger.exception("Solve job heartbeat failed")
+        finally:
+            connection.close()
+
+
+def recover_orphaned_jobs():
+    """
+    Marque en échec les jobs actifs dont le processus propriétaire a disparu
+    
+    Le pool de workers et les demandes d'arrêt sont locaux au processus: ces jobs
+    ne se termineront jamais et la page de résolution les interrogerait sans fin.
+    Un job est perdu si son processus (même machine) n'existe plus, ou s'il n'a
+    pas donné signe de vie depuis HEARTBEAT_MISSES intervalles (jobs antérieurs
+    au signe de vie compris). Leur planning revient à 'pending'.
+    Exécuté au plus une fois par intervalle de signe de vie et par processus.
+    
+    Returns:
+        int: nombre de jobs marqués en échec
+    """
+    global _last_recovery
+    interval = heartbeat_interval()
+    with _executor_lock:
+        now = time.monotonic()
+        if _last_recovery is not None and now - _last_recovery < interval:
+            return 0
+        _last_recovery = now
+    
+    stale_before = timezone.now() - timedelta(seconds=HEARTBEAT_MISSES * interval)
+    candidates = SolveJob.objects.filter(status__in=ACTIVE_STATUSES).exclude(owner=process_owner())
+    orphans = {
+        job_id: schedule_id
+        for job_id, schedule_id, owner, heartbeat_at in candidates.values_list('id', 'schedule_id', 'owner', 'heartbeat_at')
+        if heartbeat_at is None or heartbeat_at < stale_before or not owner_alive(owner)
+    }
+    if not orphans:
+        return 0
+    count = SolveJob.objects.filter(id__in=list(orphans), status__in=ACTIVE_STATUSES).update(
+        status='failed',
+        message="Solve interrupted (server process stopped). Please solve the schedule again.",
+        finished_at=timezone.now()
+    )
+    Schedule.objects.filter(id__in=set(orphans.values()), status__in=ACTIVE_STATUSES).exclude(
+        jobs__status__in=ACTIVE_STATUSES
+    ).update(status='pending')
+    logger.warning("Marked %d orphaned solve job(s) as failed", count)
+    return count
+
+
+def solver_workers():
+    """
+    Nombre de threads CP-SAT à donner à une résolution qui démarre
+
+    Les cœurs disponibles sont partagés entre les résolutions actives (en cours
+    ou en attente, dans la limite de la taille du pool) pour éviter la
+    sur-souscription quand plusieurs résolutions tournent en même temps.
+    """
+    pool_size = getattr(settings, 'SCHEDULER_SOLVE_WORKERS', 2)
+    active = SolveJob.objects.filter(status__in=ACTIVE_STATUSES).count()
+    concurrent = min(pool_size, max(1, active))
+    return max(1, available_cores() // concurrent)
+
+
+def enqueue_solve(schedule, preset=None):
+    """
+    Place la résolution d'un planning dans la file d'attente
+
+    Si une résolution est déjà en attente ou en cours pour ce planning,
+    le job existant est retourné au lieu d'en créer un nouveau.
+
+    Args:
+        schedule: instance de Schedule
+        preset: préréglage CP-SAT pour ce job (None = celui du planning)
+
+    Returns:
+        SolveJob: le job créé (ou déjà actif)
+    """
+    recover_orphaned_jobs()
+    active_job = schedule.jobs.filter(status__in=ACTIVE_STATUSES).first()
+    if active_job is not None:
+        return active_job
+
+    job = SolveJob.objects.create(
+        schedule=schedule, solver_preset=preset or schedule.solver_preset,
+        owner=process_owner(), heartbeat_at=timezone.now()
+    )
+    Schedule.objects.filter(id=schedule.id).update(status='queued')
+
+    get_executor().submit(run_job, job.id)
+    return job
+
+
+def request_stop(job_id):
+    """
+    Demande l'arrêt d'un job en cours: la meilleure solution trouvée jusque-là est conservée
+
+    Args:
+        job_id: ID du SolveJob
+    """
+    _stop_requests.add(job_id)
+
+
+def run_job(job_id):
+    """
+    Exécute un job de résolution (appelé dans un thread du pool)
+
+    Args:
+        job_id: ID du SolveJob
+    """
+    close_old_connections()
+    try:
+        job = SolveJob.objects.select_related('schedule').get(id=job_id)
+        job.status = 'running'
+        job.started_at = job.heartbeat_at = timezone.now()
+        job.save(update_fields=['status', 'started_at', 'heartbeat_at'])
+        Schedule.objects.filter(id=job.schedule_id).update(status='running')
+
+        progress = []
+
+        def record_progress(entry):
+            """Publie l'avancement sur le job; retourne True si l'arrêt a été demandé"""
+            progress.append(entry)
+            SolveJob.objects.filter(id=job_id).update(progress=progress, heartbeat_at=timezone.now())
+            return job_id in _stop_requests
+
+        try:
+            success, message, _ = solve_schedule(
+                job.schedule_id,
+                on_progress=record_progress,
+                preset=job.solver_preset or None,
+                num_workers=solver_workers()
+            )
+        except Exception as e:
+            success, message = False, f"Error solving schedule: {str(e)}"
+        finally:
+            _stop_requests.discard(job_id)
+
+        # solve_schedule fixe le statut final; sinon (planning vide...) revenir à 'pending'
+        Schedule.objects.filter(
+            id=job.schedule_id, status__in=ACTIVE_STATUSES
+        ).update(status='pending')
+
+        job.status = 'done' if success else 'failed'
+        job.message = message
+        job.finished_at = timezone.now()
+        job.save(update_fields=['status', 'message', 'finished_at'])
+    except SolveJob.DoesNotExist:
+        pass
+    finally:
+        close_old_connections()
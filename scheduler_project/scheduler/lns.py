@@ -0,0 +1,407 @@
+"""
+LNS Service - Recherche à grand voisinage pour les instances de plusieurs milliers de tâches
+
+Un modèle CP-SAT unique sur toutes les tâches ne passe pas à l'échelle (n×m variables
+d'affectation). LNS_Machine_Parallele part d'une solution réalisable puis, tant que le
+budget de temps le permet:
+
+1. choisit un voisinage: les tâches d'une fenêtre de temps (toutes machines), ou les
+   tâches d'un sous-ensemble de machines autour d'une date;
+2. fige toutes les autres tâches à leur position courante: elles deviennent des
+   périodes d'indisponibilité des machines (cf. Machine_Parallele, unavailability)
+   et resserrent les fenêtres de temps des tâches libres liées par précédence;
+3. ré-optimise les tâches libres avec Machine_Parallele, la position courante
+   servant d'indice et son objectif de borne supérieure (jamais de dégradation).
+
+La taille du voisinage s'adapte: elle augmente quand le sous-problème est résolu à
+l'optimum dans son budget, diminue sinon.
+
+La solution de départ est, dans l'ordre: la solution précédente si elle est
+réalisable, l'heuristique par liste si elle respecte les échéances, sinon une
+construction par horizon glissant (fenêtres successives résolues avec CP-SAT).
+
+L'objectif est celui de Machine_Parallele (somme des dates de début): les deux
+moteurs sont directement comparables.
+"""
+from ortools.sat.python import cp_model
+from .heuristic import Ordonnancement_Liste
+from .precedence import PrecedenceGraph, format_successors
+from .solver import Machine_Parallele
+import random
+import time
+
+
+NEIGHBORHOODS = ('window', 'machines')
+
+# Taille initiale et bornes du voisinage (nombre de tâches libres)
+DEFAULT_NEIGHBORHOOD_SIZE = 50
+MIN_NEIGHBORHOOD_SIZE = 10
+
+# Budget de temps sans limite demandée: la recherche à grand voisinage ne prouve pas
+# l'optimalité et n'a pas d'autre critère d'arrêt
+DEFAULT_TIME_LIMIT = 60.0
+
+
+class LNS_Machine_Parallele:
+    """
+    Recherche à grand voisinage construite sur Machine_Parallele
+    (mêmes entrées et même format de sortie).
+    """
+
+    def __init__(self, taskInfo, tasks, machines, time_limit=DEFAULT_TIME_LIMIT, on_solution=None, parameters=None,
+                 hints=None, neighborhood='auto', neighborhood_size=None, sub_time_limit=None,
+                 seed=0, solve=True):
+        """
+        Initialise la recherche.
+
+        Paramètres:
+            taskInfo: namedtuple définissant la structure des tâches
+            tasks: dictionnaire des tâches {nom: taskInfo(duration, successors, release_date, due_date)}
+            machines: liste des machines disponibles
+            time_limit: budget de temps total en secondes (None = DEFAULT_TIME_LIMIT)
+            on_solution: fonction(entry, incumbent) appelée à chaque amélioration
+                         (cf. SolutionRecorder); retourner True arrête la recherche
+            parameters: paramètres CP-SAT des sous-problèmes (cf. preset_parameters)
+            hints: solution précédente {nom: (start, machine)}, utilisée comme
+                   solution de départ si elle est complète et réalisable
+            neighborhood: 'window', 'machines' ou 'auto' (tirage aléatoire à chaque itération)
+            neighborhood_size: nombre de tâches libres (None = automatique et adaptatif)
+            sub_time_limit: budget de chaque sous-problème (None = automatique)
+            seed: graine du tirage des voisinages
+            solve: lancer immédiatement la recherche (cf. solve())
+        """
+        if neighborhood != 'auto' and neighborhood not in NEIGHBORHOODS:
+            raise ValueError(f"Unknown neighborhood: {neighborhood}")
+
+        self.taskInfo = taskInfo
+        self.tasks = tasks
+        self.machines = machines
+        self.neighborhood = neighborhood
+        self.adaptive = neighborhood_size is None
+        self.neighborhood_size = min(len(tasks), neighborhood_size or DEFAULT_NEIGHBORHOOD_SIZE)
+        self.sub_time_limit = sub_time_limit
+        self.parameters = parameters or {}
+        self.random = random.Random(seed)
+
+        # Successeurs et prédécesseurs de chaque tâche. Graphe non réduit: une précédence
+        # impliquée par une tâche intermédiaire ni libre ni figée doit rester visible
+        graph = PrecedenceGraph(self.tasks, reduce=False)
+        self.successors = graph.successor_names()
+        self.predecessors = graph.predecessor_names()
+
+        self.incumbent = {}  # {tâche: (start, machine)}
+        self.lower_bound = None
+        self.status = cp_model.UNKNOWN
+        self.objective_value = None
+        self.progress = []
+        self.iterations = 0
+        self.improvements = 0
+        self.wall_time = 0.0
+
+        if solve:
+            self.solve(time_limit=time_limit, on_solution=on_solution, hints=hints)
+
+    def is_feasible(self, assignment):
+        """
+        Vérifie qu'une affectation complète {tâche: (start, machine)} respecte
+        toutes les contraintes du modèle (fenêtres, précédences, non-chevauchement).
+        """
+        if set(assignment) != set(self.tasks):
+            return False
+
+        per_machine = {machine: [] for machine in self.machines}
+        for task_name, (start, machine) in assignment.items():
+            task_info = self.tasks[task_name]
+            end = start + task_info.duration
+            if machine not in per_machine or start < task_info.release_date or end > task_info.due_date:
+                return False
+            if any(successor in assignment and end > assignment[successor][0]
+                   for successor in self.successors[task_name]):
+                return False
+            per_machine[machine].append((start, end))
+
+        for intervals in per_machine.values():
+            intervals.sort()
+            if any(start < end for (_, end), (start, _) in zip(intervals, intervals[1:])):
+                return False
+        return True
+
+    def objective(self, assignment):
+        """Objectif de Machine_Parallele: somme des dates de début"""
+        return sum(start for start, _ in assignment.values())
+
+    def accept(self, assignment, started, on_solution):
+        """
+        Adopte une nouvelle solution courante et publie l'avancement.
+
+        Retour:
+            bool: True si l'arrêt de la recherche a été demandé
+        """
+        self.incumbent = assignment
+        self.objective_value = self.objective(assignment)
+        if self.status == cp_model.UNKNOWN:
+            self.status = cp_model.FEASIBLE
+
+        entry = {
+            'objective': self.objective_value,
+            'bound': None,
+            'elapsed': round(time.perf_counter() - started, 3),
+        }
+        self.progress.append(entry)
+        if on_solution is not None:
+            return bool(on_solution(entry, self.get_schedule))
+        return False
+
+    def solve_subproblem(self, free, machines, fixed, time_limit, hints=None, upper_bound=None,
+                         first_solution=False):
+        """
+        Optimise les tâches libres, toutes les autres tâches placées restant figées.
+
+        Paramètres:
+            free: tâches à (re)placer
+            machines: machines autorisées pour les tâches libres
+            fixed: tâches figées {tâche: (start, machine)}
+            time_limit: budget du sous-problème
+            hints, upper_bound: position courante des tâches libres et son objectif
+            first_solution: s'arrêter à la première solution réalisable
+
+        Retour:
+            tuple: (statut CP-SAT, {tâche: (start, machine)} ou None)
+        """
+        free_set = set(free)
+        sub_tasks = {}
+        for task_name in free:
+            task_info = self.tasks[task_name]
+            release, due = task_info.release_date, task_info.due_date
+
+            # Précédences avec les tâches figées: resserrer la fenêtre de temps
+            for predecessor in self.predecessors[task_name]:
+                if predecessor in fixed:
+                    release = max(release, fixed[predecessor][0] + self.tasks[predecessor].duration)
+            for successor in self.successors[task_name]:
+                if successor in fixed:
+                    due = min(due, fixed[successor][0])
+                elif successor in self.windows:
+                    due = min(due, self.windows[successor][1] - self.tasks[successor].duration)
+
+            sub_tasks[task_name] = self.taskInfo(
+                duration=task_info.duration,
+                successors=format_successors(
+                    successor for successor in self.successors[task_name] if successor in free_set
+                ),
+                release_date=release,
+                due_date=due
+            )
+
+        if any(info.release_date + info.duration > info.due_date for info in sub_tasks.values()):
+            return cp_model.INFEASIBLE, None
+
+        # Les tâches figées deviennent des indisponibilités (limitées à l'horizon utile)
+        horizon_start = min(info.release_date for info in sub_tasks.values())
+        horizon_end = max(info.due_date for info in sub_tasks.values())
+        unavailability = {machine: [] for machine in machines}
+        for task_name, (start, machine) in fixed.items():
+            end = start + self.tasks[task_name].duration
+            if machine in unavailability and start < horizon_end and end > horizon_start:
+                unavailability[machine].append((start, end))
+
+        parameters = dict(self.parameters, stop_after_first_solution=True) if first_solution else self.parameters
+        model = Machine_Parallele(
+            self.taskInfo, sub_tasks, machines,
+            time_limit=time_limit, parameters=parameters,
+            hints=hints, upper_bound=upper_bound, unavailability=unavailability
+        )
+        schedule = model.get_schedule()
+        if schedule is None:
+            return model.status, None
+        return model.status, {task_name: (info['start'], info['machine']) for task_name, info in schedule.items()}
+
+    def choose_neighborhood(self):
+        """
+        Tire un voisinage dans la solution courante.
+
+        Retour:
+            tuple: (tâches libres, machines autorisées)
+        """
+        size = self.neighborhood_size
+        kind = self.neighborhood if self.neighborhood != 'auto' else self.random.choice(NEIGHBORHOODS)
+        by_start = sorted(self.incumbent, key=lambda task_name: self.incumbent[task_name][0])
+
+        if kind == 'machines' and len(self.machines) > 1:
+            # Sous-ensemble de machines, tâches les plus proches d'une date tirée au hasard
+            per_machine = max(1.0, len(self.tasks) / len(self.machines))
+            count = min(len(self.machines), max(2, round(size / per_machine)))
+            machines = self.random.sample(self.machines, count)
+            machine_set = set(machines)
+            candidates = [task_name for task_name in by_start if self.incumbent[task_name][1] in machine_set]
+            anchor = self.random.randrange(max(1, len(candidates) - size + 1))
+            return candidates[anchor:anchor + size], machines
+
+        # Fenêtre de temps: tâches consécutives par date de début, toutes machines
+        anchor = self.random.randrange(max(1, len(by_start) - size + 1))
+        return by_start[anchor:anchor + size], list(self.machines)
+
+    def adapt_size(self, status):
+        """Agrandit le voisinage si le sous-problème a été prouvé optimal, le réduit sinon"""
+        if not self.adaptive:
+            return
+        if status == cp_model.OPTIMAL:
+            self.neighborhood_size = min(len(self.tasks), int(self.neighborhood_size * 1.25) + 1)
+        else:
+            self.neighborhood_size = max(min(len(self.tasks), MIN_NEIGHBORHOOD_SIZE), int(self.neighborhood_size * 0.8))
+
+    def initial_solution(self, hints, deadline, sub_time_limit):
+        """
+        Construit la solution de départ (solution précédente, heuristique par liste,
+        puis horizon glissant).
+
+        Retour:
+            dict: {tâche: (start, machine)}, ou None si aucune solution n'a été trouvée
+        """
+        if hints and self.is_feasible(hints):
+            return dict(hints)
+
+        heuristic = Ordonnancement_Liste(self.taskInfo, self.tasks, self.machines)
+        if heuristic.is_feasible():
+            return heuristic.get_hints()
+
+        # Horizon glissant: fenêtres successives dans l'ordre de priorité de l'heuristique.
+        # Chaque fenêtre s'arrête à la première solution: les positions de l'heuristique,
+        # données en indice, restent ainsi compatibles d'une fenêtre à la suivante.
+        # Si une fenêtre échoue (impasse due aux fenêtres figées), elle est résolue à
+        # nouveau avec la fenêtre précédente, avec un budget plus large.
+        release, due = heuristic.propagate_windows()
+        order = [heuristic.names[i] for i in heuristic.priority_order(heuristic.rule, release, due)]
+        heuristic_hints = heuristic.get_hints()
+        windows = [order[i:i + self.neighborhood_size] for i in range(0, len(order), self.neighborhood_size)]
+
+        assignment = {}
+        previous = []
+        for index, window in enumerate(windows):
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+            share = remaining / (len(windows) - index)
+
+            status, placed = self.solve_subproblem(
+                window, list(self.machines), assignment,
+                time_limit=min(sub_time_limit, share),
+                hints={task_name: heuristic_hints[task_name] for task_name in window},
+                first_solution=True
+            )
+            if placed is None and previous:
+                for task_name in previous:
+                    del assignment[task_name]
+                merged = previous + window
+                status, placed = self.solve_subproblem(
+                    merged, list(self.machines), assignment,
+                    time_limit=min(deadline - time.perf_counter(), 2 * max(sub_time_limit, share)),
+                    hints={task_name: heuristic_hints[task_name] for task_name in merged},
+                    first_solution=True
+                )
+            if placed is None:
+                return None
+            assignment.update(placed)
+            previous = window
+        return assignment
+
+    def solve(self, time_limit=DEFAULT_TIME_LIMIT, on_solution=None, hints=None):
+        """
+        Lance la recherche jusqu'à épuisement du budget de temps (ou arrêt demandé).
+
+        Retour:
+            int: statut CP-SAT (FEASIBLE; OPTIMAL si l'objectif atteint la borne
+                 inférieure triviale ou si un voisinage couvrant toute l'instance a été
+                 résolu à l'optimum; UNKNOWN sans solution)
+        """
+        started = time.perf_counter()
+        time_limit = time_limit or DEFAULT_TIME_LIMIT
+        deadline = started + time_limit
+        sub_time_limit = self.sub_time_limit or max(0.5, min(5.0, time_limit / 20))
+
+        # Fenêtres propagées (échéances des successeurs encore non placés, horizon glissant)
+        heuristic = Ordonnancement_Liste(self.taskInfo, self.tasks, self.machines, solve=False)
+        release, due = heuristic.propagate_windows()
+        self.windows = {task_name: (int(release[i]), int(due[i])) for i, task_name in enumerate(heuristic.names)}
+
+        # Borne inférieure triviale: chaque tâche démarre au plus tôt à sa date de disponibilité propagée
+        self.lower_bound = int(release.sum())
+
+        initial = self.initial_solution(hints, deadline, sub_time_limit)
+        if initial is None:
+            self.wall_time = time.perf_counter() - started
+            return self.status
+        stop = self.accept(initial, started, on_solution)
+
+        while not stop and time.perf_counter() < deadline:
+            if self.objective_value == self.lower_bound:
+                self.status = cp_model.OPTIMAL
+                break
+
+            free, machines = self.choose_neighborhood()
+            if not free:
+                continue
+            free_set = set(free)
+            fixed = {task_name: position for task_name, position in self.incumbent.items() if task_name not in free_set}
+            hints = {task_name: self.incumbent[task_name] for task_name in free}
+
+            status, placed = self.solve_subproblem(
+                free, machines, fixed,
+                time_limit=min(sub_time_limit, max(0.1, deadline - time.perf_counter())),
+                hints=hints, upper_bound=self.objective(hints)
+            )
+            self.iterations += 1
+
+            if placed is not None and self.objective(placed) < self.objective(hints):
+                self.improvements += 1
+                stop = self.accept(dict(self.incumbent, **placed), started, on_solution)
+
+            # Voisinage couvrant toute l'instance résolu à l'optimum: la solution est optimale
+            if status == cp_model.OPTIMAL and len(free) == len(self.tasks):
+                if placed is not None and self.objective(placed) == self.objective_value:
+                    self.status = cp_model.OPTIMAL
+                break
+
+            self.adapt_size(status)
+
+        self.wall_time = time.perf_counter() - started
+        return self.status
+
+    def statistics(self):
+        """Résumé de la recherche (itérations, améliorations, taille finale du voisinage)"""
+        return {
+            'iterations': self.iterations,
+            'improvements': self.improvements,
+            'neighborhood_size': self.neighborhood_size,
+            'lower_bound': self.lower_bound,
+        }
+
+    def get_schedule(self):
+        """
+        Retourne l'ordonnancement complet sous forme de dictionnaire.
+        """
+        if not self.incumbent:
+            return None
+
+        schedule = {}
+        for task_name, task_info in self.tasks.items():
+            start, machine = self.incumbent[task_name]
+            end = start + task_info.duration
+            schedule[task_name] = {
+                'start': start,
+                'end': end,
+                'duration': task_info.duration,
+                'machine': machine,
+                'release_date': task_info.release_date,
+                'due_date': task_info.due_date,
+                'slack': task_info.due_date - end,
+                'successor': task_info.successors
+            }
+        return schedule
+
+    def get_makespan(self):
+        """Retourne le makespan (durée totale du projet)."""
+        schedule = self.get_schedule()
+        if not schedule:
+            return None
+        return max(info['end'] for info in schedule.values())
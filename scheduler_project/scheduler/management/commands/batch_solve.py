@@ -0,0 +1,22 @@
+"""
+Commande batch_solve - Résolution en lot de fichiers d'instances CSV (cf. batch.py)
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduler import batch
+
+
+class Command(BaseCommand):
+    help = ("Résout en parallèle des fichiers d'instances CSV (répertoires, motifs glob ou fichiers) "
+            "et écrit un résumé CSV/JSON. Rien n'est enregistré en base.")
+
+    def add_arguments(self, parser):
+        batch.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        try:
+            results = batch.run(options, write=self.stdout.write)
+        except FileNotFoundError as e:
+            raise CommandError(str(e))
+        if all(result['status'] == 'ERROR' for result in results):
+            raise CommandError("no instance could be solved")
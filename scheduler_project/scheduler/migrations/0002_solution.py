@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='schedule',
+            name='status',
+            field=models.CharField(choices=[('pending', 'En attente'), ('solved', 'Résolu'), ('no_solution', 'Aucune solution'), ('error', 'Erreur')], default='pending', max_length=20),
+        ),
+        migrations.CreateModel(
+            name='Solution',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('instance_fingerprint', models.CharField(max_length=64)),
+                ('solver_status', models.CharField(max_length=20)),
+                ('objective_value', models.FloatField(blank=True, null=True)),
+                ('makespan', models.IntegerField(blank=True, null=True)),
+                ('assignments', models.JSONField(default=dict)),
+                ('gantt_chart', models.TextField(blank=True, default='')),
+                ('solved_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('schedule', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='solution', to='scheduler.schedule')),
+            ],
+        ),
+    ]
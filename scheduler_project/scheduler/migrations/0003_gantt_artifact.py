@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0002_solution'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='solution',
+            name='gantt_chart',
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='gantt_image',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='solution_fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0003_gantt_artifact'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='schedule',
+            name='status',
+            field=models.CharField(choices=[('pending', 'En attente'), ('queued', "En file d'attente"), ('running', 'En cours de résolution'), ('solved', 'Résolu'), ('no_solution', 'Aucune solution'), ('error', 'Erreur')], default='pending', max_length=20),
+        ),
+        migrations.CreateModel(
+            name='SolveJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', "En file d'attente"), ('running', 'En cours'), ('done', 'Terminé'), ('failed', 'Échec')], default='queued', max_length=20)),
+                ('message', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('schedule', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='scheduler.schedule')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
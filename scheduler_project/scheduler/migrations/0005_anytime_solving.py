@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0004_solve_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='time_limit',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='best_bound',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='progress',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='time_limit',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='wall_time',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='solvejob',
+            name='progress',
+            field=models.JSONField(default=list),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0005_anytime_solving'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='random_seed',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='schedule',
+            name='solver_preset',
+            field=models.CharField(choices=[('fast_feasible', 'Rapide (solution réalisable)'), ('balanced', 'Équilibré'), ('prove_optimal', "Prouver l'optimalité")], default='balanced', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='parameters',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='solvejob',
+            name='solver_preset',
+            field=models.CharField(blank=True, choices=[('fast_feasible', 'Rapide (solution réalisable)'), ('balanced', 'Équilibré'), ('prove_optimal', "Prouver l'optimalité")], default='', max_length=30),
+        ),
+    ]
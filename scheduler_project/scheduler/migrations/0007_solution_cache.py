@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:16
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0006_solver_presets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CachedSolution',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fingerprint', models.CharField(max_length=64, unique=True)),
+                ('num_machines', models.IntegerField()),
+                ('solver_status', models.CharField(max_length=20)),
+                ('objective_value', models.FloatField(blank=True, null=True)),
+                ('best_bound', models.FloatField(blank=True, null=True)),
+                ('relative_gap', models.FloatField(default=0.0)),
+                ('assignments', models.JSONField(default=dict)),
+                ('size_bytes', models.IntegerField(default=0)),
+                ('hit_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_used_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-last_used_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0008_warm_start'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='formulation',
+            field=models.CharField(choices=[('disjunctive', 'Disjonctive (affectation explicite)'), ('cumulative', 'Cumulative (machines identiques)')], default='disjunctive', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='solution',
+            name='formulation',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0009_formulation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='engine',
+            field=models.CharField(choices=[('cpsat', 'CP-SAT (optimal)'), ('heuristic', 'Heuristique par liste (aperçu rapide)')], default='cpsat', max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0010_solve_engine'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='schedule',
+            name='engine',
+            field=models.CharField(choices=[('cpsat', 'CP-SAT (optimal)'), ('heuristic', 'Heuristique par liste (aperçu rapide)'), ('lns', 'Recherche à grand voisinage (grandes instances)')], default='cpsat', max_length=20),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0011_lns_engine'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='presolve',
+            field=models.JSONField(default=dict),
+        ),
+    ]
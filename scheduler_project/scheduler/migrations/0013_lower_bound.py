@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0012_presolve'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='schedule',
+            name='lower_bound',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0013_lower_bound'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='timings',
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0014_solution_timings'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='machine_stats',
+            field=models.JSONField(default=list),
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:01
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def rename_duplicate_tasks(apps, schema_editor):
+    """
+    Renomme les tâches homonymes d'un même planning avant la contrainte d'unicité
+
+    Le solveur indexait les tâches par nom: parmi des homonymes, seule la dernière
+    lue (en pratique la plus récente) était prise en compte. Elle garde son nom, si bien que les
+    successeurs des autres tâches qui la désignent restent inchangés; les autres
+    homonymes reçoivent le premier suffixe libre du planning (name_2, name_3...).
+    """
+    Task = apps.get_model('scheduler', 'Task')
+    max_length = Task._meta.get_field('name').max_length
+    duplicates = (
+        Task.objects.values('schedule_id', 'name')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+    )
+    for duplicate in duplicates:
+        taken = set(Task.objects.filter(schedule_id=duplicate['schedule_id']).values_list('name', flat=True))
+        tasks = Task.objects.filter(schedule_id=duplicate['schedule_id'], name=duplicate['name']).order_by('-id')
+        rank = 2
+        for task in tasks[1:]:
+            while True:
+                suffix = f"_{rank}"
+                name = f"{task.name[:max_length - len(suffix)]}{suffix}"
+                rank += 1
+                if name not in taken:
+                    break
+            taken.add(name)
+            task.name = name
+            task.save(update_fields=['name'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0015_machine_stats'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='schedule',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='machine',
+            index=models.Index(fields=['schedule', 'name'], name='machine_schedule_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['-created_at', '-id'], name='schedule_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['schedule', 'start_time'], name='task_schedule_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['schedule', 'assigned_machine'], name='task_schedule_machine_idx'),
+        ),
+        migrations.RunPython(rename_duplicate_tasks, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(fields=('schedule', 'name'), name='task_unique_name_per_schedule'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0016_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solution',
+            name='statistics',
+            field=models.JSONField(default=dict),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0017_solution_statistics'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='task',
+            old_name='successor_name',
+            new_name='successors',
+        ),
+        migrations.AlterField(
+            model_name='task',
+            name='successors',
+            field=models.CharField(blank=True, default='none', max_length=1000),
+        ),
+    ]
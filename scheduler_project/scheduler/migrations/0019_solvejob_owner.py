@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0018_task_successors'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solvejob',
+            name='heartbeat_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='solvejob',
+            name='owner',
+            field=models.CharField(blank=True, default='', max_length=150),
+        ),
+    ]
@@ -2,7 +2,9 @@
 Modèles de base de données pour le planificateur de tâches
 """
 from django.db import models
+from django.urls import reverse
 from django.utils import timezone
+from .presets import PRESET_CHOICES, DEFAULT_PRESET
 
 
 class Schedule(models.Model):
@@ -15,6 +17,8 @@ class Schedule(models.Model):
         max_length=20,
         choices=[
             ('pending', 'En attente'),
+            ('queued', "En file d'attente"),
+            ('running', 'En cours de résolution'),
             ('solved', 'Résolu'),
             ('no_solution', 'Aucune solution'),
             ('error', 'Erreur')
@@ -23,12 +27,45 @@ class Schedule(models.Model):
     )
     makespan = models.IntegerField(null=True, blank=True)  # Durée totale du projet
     objective_value = models.FloatField(null=True, blank=True)  # Valeur de la fonction objectif
+    lower_bound = models.FloatField(null=True, blank=True)  # Borne inférieure prouvée de l'objectif
+    time_limit = models.FloatField(null=True, blank=True)  # Budget de temps de résolution (secondes)
+    solver_preset = models.CharField(max_length=30, choices=PRESET_CHOICES, default=DEFAULT_PRESET)  # Préréglage CP-SAT
+    random_seed = models.IntegerField(null=True, blank=True)  # Graine de la recherche CP-SAT (reproductibilité)
+    formulation = models.CharField(
+        max_length=20,
+        choices=[
+            ('disjunctive', 'Disjonctive (affectation explicite)'),
+            ('cumulative', 'Cumulative (machines identiques)')
+        ],
+        default='disjunctive'
+    )  # Formulation du modèle CP-SAT
+    engine = models.CharField(
+        max_length=20,
+        choices=[
+            ('cpsat', 'CP-SAT (optimal)'),
+            ('heuristic', 'Heuristique par liste (aperçu rapide)'),
+            ('lns', 'Recherche à grand voisinage (grandes instances)')
+        ],
+        default='cpsat'
+    )  # Moteur de résolution
     
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='schedule_recent_idx'),  # Pagination de l'accueil
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.created_at.strftime('%Y-%m-%d %H:%M')}"
+    
+    @property
+    def optimality_gap(self):
+        """Écart relatif (en %) entre l'objectif et la borne inférieure, None si inconnu"""
+        if self.objective_value is None or self.lower_bound is None:
+            return None
+        if self.objective_value <= 0:
+            return 0.0
+        return max(0.0, 100.0 * (self.objective_value - self.lower_bound) / self.objective_value)
 
 
 class Machine(models.Model):
@@ -40,6 +77,9 @@ class Machine(models.Model):
     
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['schedule', 'name'], name='machine_schedule_name_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -52,7 +92,7 @@ class Task(models.Model):
     schedule = models.ForeignKey(Schedule, on_delete=models.CASCADE, related_name='tasks')
     name = models.CharField(max_length=100)
     duration = models.IntegerField()  # Durée d'exécution
-    successor_name = models.CharField(max_length=100, blank=True, default='none')  # Nom du successeur
+    successors = models.CharField(max_length=1000, blank=True, default='none')  # Successeurs: noms séparés par des virgules, ou "none"
     release_date = models.IntegerField(default=0)  # Date de disponibilité
     due_date = models.IntegerField()  # Date d'échéance
     
@@ -70,11 +110,121 @@ class Task(models.Model):
     
     class Meta:
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['schedule', 'start_time'], name='task_schedule_start_idx'),  # Résultats, PDF
+            models.Index(fields=['schedule', 'assigned_machine'], name='task_schedule_machine_idx'),
+        ]
+        constraints = [
+            # Le nom identifie la tâche (successeurs, solutions): unique dans un planning
+            models.UniqueConstraint(fields=['schedule', 'name'], name='task_unique_name_per_schedule'),
+        ]
     
     def __str__(self):
         return f"{self.name} (Durée: {self.duration})"
 
 
+class Solution(models.Model):
+    """
+    Instantané persistant de la solution d'un planning (écrit une seule fois à la fin de la résolution)
+    """
+    schedule = models.OneToOneField(Schedule, on_delete=models.CASCADE, related_name='solution')
+    instance_fingerprint = models.CharField(max_length=64)  # Empreinte des tâches/machines résolues
+    solver_status = models.CharField(max_length=20)  # Statut CP-SAT (OPTIMAL, FEASIBLE, INFEASIBLE...)
+    objective_value = models.FloatField(null=True, blank=True)
+    best_bound = models.FloatField(null=True, blank=True)  # Meilleure borne inférieure prouvée par CP-SAT
+    makespan = models.IntegerField(null=True, blank=True)
+    progress = models.JSONField(default=list)  # Solutions améliorantes [{objective, bound, elapsed}]
+    time_limit = models.FloatField(null=True, blank=True)  # Budget de temps utilisé (secondes)
+    wall_time = models.FloatField(null=True, blank=True)  # Temps de résolution CP-SAT (secondes)
+    parameters = models.JSONField(default=dict)  # Paramètres CP-SAT effectivement utilisés
+    formulation = models.CharField(max_length=20, blank=True)  # Formulation effectivement utilisée
+    warm_start = models.JSONField(default=dict)  # Démarrage à chaud {total, hinted, kept}
+    presolve = models.JSONField(default=dict)  # Présolve {domain_before, domain_after, shrink, scale, infeasible}
+    timings = models.JSONField(default=dict)  # Durée des phases (secondes) {load, screening, build, solve, extract, write_back, gantt...}
+    statistics = models.JSONField(default=dict)  # Taille du modèle et statistiques CP-SAT {variables, constraints, conflicts, branches, gap...}
+    assignments = models.JSONField(default=dict)  # {tâche: {start, end, machine, slack}}
+    machine_stats = models.JSONField(default=list)  # [{machine, tasks, load, utilization, idle}]
+    solution_fingerprint = models.CharField(max_length=64, blank=True, default='')  # Version de la solution
+    gantt_image = models.CharField(max_length=255, blank=True, default='')  # Diagramme PNG rendu à la demande (chemin relatif à MEDIA_ROOT)
+    solved_at = models.DateTimeField(default=timezone.now)
+    
+    def __str__(self):
+        return f"Solution de {self.schedule.name} ({self.solver_status})"
+    
+    @property
+    def gantt_url(self):
+        """URL cacheable du diagramme de Gantt (change à chaque nouvelle solution)"""
+        if not self.solution_fingerprint:
+            return ''
+        return reverse('gantt_chart', args=[self.schedule_id, self.solution_fingerprint])
+    
+    @property
+    def gantt_svg_url(self):
+        """URL de la version vectorielle du diagramme (rendue à la première demande)"""
+        if not self.solution_fingerprint:
+            return ''
+        return reverse('gantt_chart_svg', args=[self.schedule_id, self.solution_fingerprint])
+
+
+class SolveJob(models.Model):
+    """
+    Résolution exécutée en arrière-plan par le pool de workers local
+    """
+    schedule = models.ForeignKey(Schedule, on_delete=models.CASCADE, related_name='jobs')
+    status = models.CharField(
+        max_length=20,
+        choices=[
+            ('queued', "En file d'attente"),
+            ('running', 'En cours'),
+            ('done', 'Terminé'),
+            ('failed', 'Échec')
+        ],
+        default='queued'
+    )
+    solver_preset = models.CharField(max_length=30, choices=PRESET_CHOICES, blank=True, default='')  # Vide = préréglage du planning
+    message = models.TextField(blank=True, default='')  # Message retourné par solve_schedule
+    progress = models.JSONField(default=list)  # Solutions améliorantes [{objective, bound, elapsed}]
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    owner = models.CharField(max_length=150, blank=True, default='')  # Processus exécutant le job (hôte:pid:jeton)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)  # Dernier signe de vie du processus propriétaire
+    
+    class Meta:
+        ordering = ['-created_at']
+    
+    def __str__(self):
+        return f"Job #{self.id} - {self.schedule.name} ({self.status})"
+    
+    @property
+    def is_active(self):
+        return self.status in ('queued', 'running')
+
+
+class CachedSolution(models.Model):
+    """
+    Solution prouvée d'une instance, partagée entre les plannings identiques
+    (adressée par l'empreinte canonique des tâches et du nombre de machines)
+    """
+    fingerprint = models.CharField(max_length=64, unique=True)  # Empreinte canonique de l'instance
+    num_machines = models.IntegerField()
+    solver_status = models.CharField(max_length=20)  # OPTIMAL ou INFEASIBLE
+    objective_value = models.FloatField(null=True, blank=True)
+    best_bound = models.FloatField(null=True, blank=True)
+    relative_gap = models.FloatField(default=0.0)  # Tolérance relative de la résolution d'origine
+    assignments = models.JSONField(default=dict)  # {tâche: [start, indice_machine]}
+    size_bytes = models.IntegerField(default=0)  # Taille des affectations (éviction par taille)
+    hit_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+    last_used_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        ordering = ['-last_used_at']
+    
+    def __str__(self):
+        return f"{self.fingerprint[:12]} ({self.solver_status}, {self.hit_count} hits)"
+
+
 class UploadedFile(models.Model):
     """
     Stocke les fichiers CSV téléchargés
@@ -1,33 +1,105 @@
 """
 PDF Export Module - Generates PDF reports for schedules
+
+The report is written straight to a file: the task table is read from the
+database in chunks and emitted as page-sized tables, which ReportLab pulls
+one at a time (see FlowableStream), so memory stays flat as the task count
+grows. Finished reports are stored per solution version (see artifacts.py).
 """
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
-import io
-import base64
 from datetime import datetime
+from .artifacts import store_report, gantt_path
+from .reports import machine_statistics
+
+
+# Rows per table chunk (one chunk fits on a letter page)
+TASK_ROWS_PER_TABLE = 30
+MACHINE_ROWS_PER_TABLE = 25
 
+# Tasks fetched from the database per query while writing the task table
+TASK_FETCH_SIZE = 2000
 
-def generate_pdf_report(schedule, gantt_chart_base64):
+
+class FlowableStream(list):
     """
-    Generate a PDF report for a schedule
+    Flowable list filled on demand from an iterator.
+
+    ReportLab consumes flowables from the front of the list it is given;
+    keeping only a short look-ahead in memory lets the document be built
+    from a generator.
+    """
+    
+    LOOKAHEAD = 4
+    _END = object()
+    
+    def __init__(self, flowables):
+        super().__init__()
+        self.source = iter(flowables)
+    
+    def refill(self):
+        while list.__len__(self) < self.LOOKAHEAD:
+            flowable = next(self.source, self._END)
+            if flowable is self._END:
+                break
+            self.append(flowable)
+    
+    def __len__(self):
+        self.refill()
+        return list.__len__(self)
+    
+    def __getitem__(self, index):
+        self.refill()
+        return list.__getitem__(self, index)
+
+
+def ensure_pdf_report(schedule, solution, gantt_image):
+    """
+    Return the stored PDF report of a solution, writing it on first request
     
     Args:
         schedule: Schedule model instance
-        gantt_chart_base64: Base64 encoded Gantt chart image
+        solution: Solution snapshot
+        gantt_image: Gantt chart path relative to MEDIA_ROOT (or '')
         
     Returns:
-        io.BytesIO: PDF file buffer
+        pathlib.Path: absolute path of the PDF file
+    """
+    relative_path = store_report(
+        schedule.id, solution.solution_fingerprint,
+        lambda output: generate_pdf_report(schedule, solution, gantt_path(gantt_image) if gantt_image else None, output)
+    )
+    return gantt_path(relative_path)
+
+
+def generate_pdf_report(schedule, solution, gantt_chart_path, output):
     """
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch)
+    Generate a PDF report for a schedule
     
-    # Container for PDF elements
-    elements = []
+    Args:
+        schedule: Schedule model instance
+        solution: Solution snapshot (stored per-machine statistics)
+        gantt_chart_path: Path to the rendered Gantt chart PNG (or None)
+        output: binary file object (or file name) the PDF is written to
+    """
+    doc = SimpleDocTemplate(output, pagesize=letter, topMargin=0.75*inch, bottomMargin=0.75*inch, pageCompression=1)
+    doc.build(FlowableStream(report_flowables(schedule, solution, gantt_chart_path)))
+
+
+def report_flowables(schedule, solution, gantt_chart_path):
+    """Generate the report content, one flowable at a time"""
+    machine_rows = solution.machine_stats
+    if not machine_rows:
+        # Snapshot stored before per-machine statistics: compute them from the assignments
+        machine_rows = machine_statistics(
+            solution.assignments, [machine.name for machine in schedule.machines.all()], solution.makespan
+        )
+    task_count = schedule.tasks.count()
     
     # Styles
     styles = getSampleStyleSheet()
@@ -50,12 +122,12 @@ def generate_pdf_report(schedule, gantt_chart_base64):
     
     # Title
     title = Paragraph(f"<b>Schedule Report: {schedule.name}</b>", title_style)
-    elements.append(title)
-    elements.append(Spacer(1, 0.2*inch))
+    yield title
+    yield Spacer(1, 0.2*inch)
     
     # Summary Information
     summary_heading = Paragraph("<b>Summary</b>", heading_style)
-    elements.append(summary_heading)
+    yield summary_heading
     
     summary_data = [
         ['Schedule Name:', schedule.name],
@@ -63,8 +135,8 @@ def generate_pdf_report(schedule, gantt_chart_base64):
         ['Status:', schedule.get_status_display()],
         ['Makespan:', f"{schedule.makespan} time units" if schedule.makespan else 'N/A'],
         ['Objective Value:', f"{schedule.objective_value:.2f}" if schedule.objective_value else 'N/A'],
-        ['Number of Tasks:', str(schedule.tasks.count())],
-        ['Number of Machines:', str(schedule.machines.count())],
+        ['Number of Tasks:', str(task_count)],
+        ['Number of Machines:', str(len(machine_rows))],
     ]
     
     summary_table = Table(summary_data, colWidths=[2*inch, 4*inch])
@@ -79,29 +151,15 @@ def generate_pdf_report(schedule, gantt_chart_base64):
         ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
     ]))
     
-    elements.append(summary_table)
-    elements.append(Spacer(1, 0.3*inch))
+    yield summary_table
+    yield Spacer(1, 0.3*inch)
     
-    # Machine Assignments
+    # Machine Assignments (task names are listed in the task table)
     machines_heading = Paragraph("<b>Machine Assignments</b>", heading_style)
-    elements.append(machines_heading)
+    yield machines_heading
     
-    machine_data = [['Machine', 'Assigned Tasks', 'Utilization']]
-    
-    for machine in schedule.machines.all():
-        assigned_tasks = machine.assigned_tasks.all()
-        task_names = ', '.join([task.name for task in assigned_tasks])
-        total_work = sum([task.duration for task in assigned_tasks])
-        utilization = f"{(total_work / schedule.makespan * 100):.1f}%" if schedule.makespan else 'N/A'
-        
-        machine_data.append([
-            machine.name,
-            task_names if task_names else 'None',
-            utilization
-        ])
-    
-    machine_table = Table(machine_data, colWidths=[1.5*inch, 3.5*inch, 1.5*inch])
-    machine_table.setStyle(TableStyle([
+    machine_header = ['Machine', 'Assigned Tasks', 'Load', 'Utilization', 'Idle']
+    machine_style = TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3498db')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
         ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
@@ -111,29 +169,30 @@ def generate_pdf_report(schedule, gantt_chart_base64):
         ('TOPPADDING', (0, 0), (-1, -1), 6),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
         ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ecf0f1')]),
-    ]))
+    ])
+    
+    for chunk in chunked(machine_rows, MACHINE_ROWS_PER_TABLE):
+        machine_data = [machine_header]
+        for row in chunk:
+            machine_data.append([
+                row['machine'],
+                str(row['tasks']),
+                str(row['load']),
+                f"{row['utilization']:.1f}%" if schedule.makespan else 'N/A',
+                str(row['idle']),
+            ])
+        machine_table = Table(machine_data, colWidths=[1.5*inch, 1.3*inch, 1.2*inch, 1.3*inch, 1.2*inch])
+        machine_table.setStyle(machine_style)
+        yield machine_table
     
-    elements.append(machine_table)
-    elements.append(Spacer(1, 0.3*inch))
+    yield Spacer(1, 0.3*inch)
     
     # Task Details
     tasks_heading = Paragraph("<b>Task Details</b>", heading_style)
-    elements.append(tasks_heading)
-    
-    task_data = [['Task', 'Duration', 'Start', 'End', 'Machine', 'Slack']]
-    
-    for task in schedule.tasks.all().order_by('start_time'):
-        task_data.append([
-            task.name,
-            str(task.duration),
-            str(task.start_time) if task.start_time is not None else 'N/A',
-            str(task.end_time) if task.end_time is not None else 'N/A',
-            task.assigned_machine.name if task.assigned_machine else 'N/A',
-            str(task.slack) if task.slack is not None else 'N/A',
-        ])
-    
-    task_table = Table(task_data, colWidths=[1.3*inch, 0.9*inch, 0.9*inch, 0.9*inch, 1.3*inch, 0.9*inch])
-    task_table.setStyle(TableStyle([
+    yield tasks_heading
+    
+    task_header = ['Task', 'Duration', 'Start', 'End', 'Machine', 'Slack']
+    task_style = TableStyle([
         ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2ecc71')),
         ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
         ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
@@ -143,35 +202,57 @@ def generate_pdf_report(schedule, gantt_chart_base64):
         ('TOPPADDING', (0, 0), (-1, -1), 5),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
         ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ecf0f1')]),
-    ]))
+    ])
     
-    elements.append(task_table)
+    # Tasks are read in chunks (no model instances) and emitted as page-sized tables
+    rows = schedule.tasks.order_by('start_time', 'name').values_list(
+        'name', 'duration', 'start_time', 'end_time', 'assigned_machine__name', 'slack'
+    ).iterator(chunk_size=TASK_FETCH_SIZE)
+    for chunk in chunked(rows, TASK_ROWS_PER_TABLE):
+        task_data = [task_header]
+        for name, duration, start_time, end_time, machine_name, slack in chunk:
+            task_data.append([
+                name,
+                str(duration),
+                str(start_time) if start_time is not None else 'N/A',
+                str(end_time) if end_time is not None else 'N/A',
+                machine_name or 'N/A',
+                str(slack) if slack is not None else 'N/A',
+            ])
+        task_table = Table(task_data, colWidths=[1.3*inch, 0.9*inch, 0.9*inch, 0.9*inch, 1.3*inch, 0.9*inch])
+        task_table.setStyle(task_style)
+        yield task_table
     
     # Add page break before Gantt chart
-    elements.append(PageBreak())
+    yield PageBreak()
     
     # Gantt Chart
-    if gantt_chart_base64:
+    if gantt_chart_path:
         gantt_heading = Paragraph("<b>Gantt Chart</b>", heading_style)
-        elements.append(gantt_heading)
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Decode base64 image
-        image_data = base64.b64decode(gantt_chart_base64)
-        image_buffer = io.BytesIO(image_data)
+        yield gantt_heading
+        yield Spacer(1, 0.2*inch)
         
-        # Add image to PDF
-        img = Image(image_buffer, width=6.5*inch, height=4*inch)
-        elements.append(img)
+        # Add image to PDF (read straight from the artifact store), keeping its
+        # aspect ratio: the figure height grows with the number of machines
+        pixel_width, pixel_height = ImageReader(str(gantt_chart_path)).getSize()
+        scale = min(6.5*inch / pixel_width, 8*inch / pixel_height)
+        img = Image(str(gantt_chart_path), width=pixel_width * scale, height=pixel_height * scale)
+        yield img
     
     # Footer
-    elements.append(Spacer(1, 0.5*inch))
+    yield Spacer(1, 0.5*inch)
     footer_text = f"<i>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</i>"
     footer = Paragraph(footer_text, styles['Normal'])
-    elements.append(footer)
-    
-    # Build PDF
-    doc.build(elements)
-    
-    buffer.seek(0)
-    return buffer
+    yield footer
+
+
+def chunked(iterable, size):
+    """Split an iterable into lists of at most size items"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
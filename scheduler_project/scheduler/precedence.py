@@ -0,0 +1,235 @@
+"""
+Precedence Service - Graphe de précédences indexé (successeurs multiples)
+
+Une tâche peut avoir plusieurs successeurs (et plusieurs prédécesseurs): la
+colonne successors contient un nom, plusieurs noms séparés par des virgules ou
+des points-virgules ("task_b,task_c"), ou "none". taskInfo.successors garde
+cette forme texte (CSV, base, empreintes); PrecedenceGraph l'indexe une fois:
+
+- tâches numérotées dans l'ordre du dictionnaire (self.names, self.index);
+- arcs en tableaux compressés (CSR): les successeurs de i sont
+  targets[offsets[i]:offsets[i + 1]];
+- ordre topologique (Kahn) et recherche d'un cycle en O(n + e);
+- réduction transitive: un arc u -> v impliqué par un chemin u -> w -> ... -> v
+  est retiré, le solveur ne reçoit que les précédences nécessaires.
+
+Pour la réduction, seuls les sommets ayant au moins deux successeurs sont
+examinés, et chaque parcours s'arrête aux tâches placées après le dernier de
+ces successeurs dans l'ordre topologique: le coût reste linéaire sur les
+chaînes et les arbres, et borné par la taille de ces fenêtres sinon.
+"""
+import numpy as np
+
+
+# Valeurs de la colonne successors signifiant « pas de successeur »
+NO_SUCCESSOR = ('', 'none')
+
+
+def parse_successors(value):
+    """
+    Noms des successeurs d'une tâche
+
+    Args:
+        value: texte de la colonne successors ("none", "task_b", "task_b,task_c"...)
+               ou séquence de noms
+
+    Returns:
+        tuple: noms des successeurs (sans doublons, dans l'ordre donné)
+    """
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        if ',' not in value and ';' not in value:
+            value = value.strip()
+            return () if value in NO_SUCCESSOR else (value,)
+        value = value.replace(';', ',').split(',')
+    names = (name.strip() for name in value)
+    return tuple(dict.fromkeys(name for name in names if name not in NO_SUCCESSOR))
+
+
+def format_successors(names):
+    """Forme texte d'une liste de successeurs (inverse de parse_successors)"""
+    return ','.join(names) or 'none'
+
+
+class PrecedenceGraph:
+    """
+    Graphe orienté des précédences d'une instance, indexé par numéro de tâche.
+    """
+
+    def __init__(self, tasks, reduce=True, strict=True):
+        """
+        Paramètres:
+            tasks: dictionnaire des tâches {nom: taskInfo(duration, successors, release_date, due_date)}
+            reduce: retirer les arcs redondants (réduction transitive, graphe acyclique uniquement)
+            strict: lever ValueError si un successeur n'est pas une tâche de l'instance
+                    (sinon l'arc est ignoré et signalé dans self.unknown)
+        """
+        self.names = list(tasks)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.unknown = []  # [(tâche, successeur inconnu)]
+
+        sources, targets = [], []
+        for i, (task_name, task_info) in enumerate(tasks.items()):
+            for successor in parse_successors(task_info.successors):
+                j = self.index.get(successor)
+                if j is None:
+                    self.unknown.append((task_name, successor))
+                else:
+                    sources.append(i)
+                    targets.append(j)
+
+        if strict and self.unknown:
+            task_name, successor = self.unknown[0]
+            more = f" (+{len(self.unknown) - 1} more)" if len(self.unknown) > 1 else ""
+            raise ValueError(f"Task {task_name}: unknown successor {successor}{more}")
+
+        self.set_edges(np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64))
+        self.edge_count = len(self.sources)
+        self.order = self.topological_order()
+
+        self.redundant = 0
+        if reduce and self.order is not None:
+            keep = self.transitive_reduction()
+            self.redundant = int(len(keep) - np.count_nonzero(keep))
+            if self.redundant:
+                self.set_edges(self.sources[keep], self.targets[keep])
+
+    def set_edges(self, sources, targets):
+        """Arcs (sources[k] -> targets[k]) triés par origine, avec leurs index CSR"""
+        count = len(self.names)
+        by_source = np.argsort(sources, kind='stable')
+        self.sources = sources[by_source]
+        self.targets = targets[by_source]
+        self.offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.sources, minlength=count), out=self.offsets[1:])
+
+    def __len__(self):
+        return len(self.names)
+
+    def successor_lists(self):
+        """Successeurs de chaque tâche (listes d'indices)"""
+        targets = self.targets.tolist()
+        offsets = self.offsets.tolist()
+        return [targets[offsets[i]:offsets[i + 1]] for i in range(len(self.names))]
+
+    def predecessor_lists(self):
+        """Prédécesseurs de chaque tâche (listes d'indices)"""
+        predecessors = [[] for _ in self.names]
+        for source, target in zip(self.sources.tolist(), self.targets.tolist()):
+            predecessors[target].append(source)
+        return predecessors
+
+    def successor_names(self):
+        """Successeurs de chaque tâche {nom: [noms]}"""
+        names = self.names
+        return {names[i]: [names[j] for j in successors] for i, successors in enumerate(self.successor_lists())}
+
+    def predecessor_names(self):
+        """Prédécesseurs de chaque tâche {nom: [noms]}"""
+        names = self.names
+        return {names[i]: [names[j] for j in predecessors] for i, predecessors in enumerate(self.predecessor_lists())}
+
+    def kahn(self):
+        """
+        Algorithme de Kahn (O(n + e)): tâches dont tous les prédécesseurs sont ordonnés.
+
+        Retour:
+            list: indices des tâches ordonnées (toutes si le graphe est acyclique)
+        """
+        in_degree = np.bincount(self.targets, minlength=len(self.names)).tolist()
+        targets = self.targets.tolist()
+        offsets = self.offsets.tolist()
+
+        order = [i for i, degree in enumerate(in_degree) if degree == 0]
+        for i in order:  # la liste s'allonge pendant le parcours
+            for j in targets[offsets[i]:offsets[i + 1]]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    order.append(j)
+        return order
+
+    def topological_order(self):
+        """
+        Ordre topologique des tâches.
+
+        Retour:
+            list: indices des tâches, ou None si les précédences forment un cycle
+        """
+        order = self.kahn()
+        return order if len(order) == len(self.names) else None
+
+    def is_acyclic(self):
+        return self.order is not None
+
+    def find_cycle(self):
+        """
+        Un cycle de précédences (O(n + e)).
+
+        Les tâches écartées par l'algorithme de Kahn ont toutes un prédécesseur
+        lui-même écarté: en remontant les prédécesseurs depuis l'une d'elles, on
+        retombe forcément sur une tâche déjà visitée.
+
+        Retour:
+            list: noms des tâches du cycle dans l'ordre des précédences (vide si acyclique)
+        """
+        if self.order is not None:
+            return []
+
+        remaining = np.ones(len(self.names), dtype=bool)
+        remaining[self.kahn()] = False
+        predecessors = self.predecessor_lists()
+
+        position = {}
+        path = []
+        task = int(np.flatnonzero(remaining)[0])
+        while task not in position:
+            position[task] = len(path)
+            path.append(task)
+            task = next(p for p in predecessors[task] if remaining[p])
+
+        cycle = path[position[task]:]
+        return [self.names[i] for i in reversed(cycle)]
+
+    def transitive_reduction(self):
+        """
+        Arcs nécessaires d'un graphe acyclique.
+
+        L'arc u -> v est redondant si v est atteint depuis un autre successeur w
+        de u. Pour chaque u ayant au moins deux successeurs, un parcours depuis
+        les successeurs de ses successeurs marque les tâches atteintes; il ne
+        dépasse pas la position topologique du dernier successeur de u (aucune
+        tâche placée après ne peut mener à un successeur de u).
+
+        Retour:
+            numpy.ndarray: masque booléen des arcs conservés (dans l'ordre de self.sources)
+        """
+        keep = np.ones(len(self.sources), dtype=bool)
+        out_degree = np.diff(self.offsets)
+        if not len(out_degree) or out_degree.max() < 2:
+            return keep
+
+        position = np.empty(len(self.names), dtype=np.int64)
+        position[self.order] = np.arange(len(self.names))
+        position = position.tolist()
+        targets = self.targets.tolist()
+        offsets = self.offsets.tolist()
+
+        for u in np.flatnonzero(out_degree >= 2).tolist():
+            first, last = offsets[u], offsets[u + 1]
+            direct = targets[first:last]
+            limit = max(position[v] for v in direct)
+
+            reached = set()
+            stack = [x for w in direct for x in targets[offsets[w]:offsets[w + 1]] if position[x] <= limit]
+            while stack:
+                x = stack.pop()
+                if x in reached:
+                    continue
+                reached.add(x)
+                stack.extend(y for y in targets[offsets[x]:offsets[x + 1]] if position[y] <= limit)
+
+            for k in range(first, last):
+                if targets[k] in reached:
+                    keep[k] = False
+        return keep
@@ -0,0 +1,72 @@
+"""
+Solver Presets - Préréglages de paramètres CP-SAT
+"""
+
+
+# Préréglages de paramètres CP-SAT (sélectionnables par planning et par job).
+# Le nombre de workers n'en fait pas partie: il dépend des résolutions en cours (cf. jobs.solver_workers).
+# La stratégie de recherche non plus: imposer search_branching (FIXED_SEARCH,
+# PORTFOLIO_WITH_QUICK_RESTART_SEARCH...) empêche CP-SAT de prouver l'infaisabilité dans le
+# budget, là où AUTOMATIC_SEARCH (défaut) y parvient. Un préréglage peut la donner par son nom
+# (cf. apply_parameters).
+SOLVER_PRESETS = {
+    'fast_feasible': {
+        'label': 'Rapide (solution réalisable)',
+        'parameters': {
+            'linearization_level': 0,        # Pas de relaxation LP: recherche plus légère
+            'max_presolve_iterations': 1,    # Presolve minimal
+            'relative_gap_limit': 0.05,      # S'arrêter à 5% de la borne
+        },
+    },
+    'balanced': {
+        'label': 'Équilibré',
+        'parameters': {
+            'relative_gap_limit': 0.01,      # S'arrêter à 1% de la borne
+        },
+    },
+    'prove_optimal': {
+        'label': "Prouver l'optimalité",
+        'parameters': {
+            'linearization_level': 2,        # Relaxation LP complète: meilleures bornes
+            'relative_gap_limit': 0.0,
+        },
+    },
+}
+
+DEFAULT_PRESET = 'balanced'
+
+
+def preset_parameters(preset=None, random_seed=None, num_workers=None):
+    """
+    Construit le dictionnaire de paramètres CP-SAT d'un préréglage
+    
+    Args:
+        preset: nom du préréglage (None = DEFAULT_PRESET)
+        random_seed: graine aléatoire de la recherche (None = celle de CP-SAT)
+        num_workers: nombre de threads de recherche (None = celui de CP-SAT)
+        
+    Returns:
+        dict: {nom_paramètre: valeur}
+    """
+    parameters = dict(SOLVER_PRESETS[preset or DEFAULT_PRESET]['parameters'])
+    if random_seed is not None:
+        parameters['random_seed'] = random_seed
+    if num_workers:
+        parameters['num_workers'] = num_workers
+    return parameters
+
+
+def apply_parameters(solver_parameters, parameters):
+    """
+    Applique un dictionnaire de paramètres à CpSolver.parameters
+    
+    Les paramètres énumérés (ex: search_branching) peuvent être donnés par leur nom.
+    """
+    for name, value in parameters.items():
+        current = getattr(solver_parameters, name)
+        if isinstance(value, str) and not isinstance(current, str):
+            value = getattr(type(current), value)
+        setattr(solver_parameters, name, value)
+
+
+PRESET_CHOICES = [(name, preset['label']) for name, preset in SOLVER_PRESETS.items()]
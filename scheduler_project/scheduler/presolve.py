@@ -0,0 +1,140 @@
+"""
+Presolve Service - Resserrement des domaines avant la construction du modèle CP-SAT
+
+Machine_Parallele crée chaque variable de début sur [release_date, due_date - duration]
+et laisse CP-SAT raisonner sur les précédences. Le présolve calcule en amont, dans
+l'ordre topologique du graphe de précédences (cf. precedence.py):
+
+- passe avant: date de début au plus tôt
+      es[t] = max(release[t], max(es[p] + duration[p]) pour p prédécesseur de t)
+- passe arrière: date de fin au plus tard
+      lf[t] = min(due[t], min(lf[s] - duration[s]) pour s successeur de t)
+
+puis:
+- détecte les tâches trivialement infaisables (es + duration > lf, ou précédences
+  cycliques) avant toute construction de modèle;
+- met le temps à l'échelle par le PGCD des durées, dates et périodes
+  d'indisponibilité lorsqu'il est supérieur à 1 (domaines plus petits);
+- mesure le resserrement des domaines.
+"""
+from math import gcd
+
+from .precedence import PrecedenceGraph
+
+
+class Presolve:
+    """
+    Présolve d'une instance (tâches + indisponibilités éventuelles).
+    """
+
+    def __init__(self, taskInfo, tasks, unavailability=None):
+        """
+        Paramètres:
+            taskInfo: namedtuple définissant la structure des tâches
+            tasks: dictionnaire des tâches {nom: taskInfo(duration, successors, release_date, due_date)}
+            unavailability: périodes d'indisponibilité par machine {machine: [(début, fin), ...]}
+        """
+        self.taskInfo = taskInfo
+        self.original = tasks
+        unavailability = unavailability or {}
+
+        self.earliest_start = {}
+        self.latest_end = {}
+        self.infeasible = []  # [(tâche, raison)]
+
+        # Graphe indexé, réduit aux précédences nécessaires (réutilisé par Machine_Parallele)
+        self.graph = PrecedenceGraph(tasks)
+        if self.graph.is_acyclic():
+            self.propagate()
+        else:
+            cycle = self.graph.find_cycle()
+            self.infeasible.append((cycle[0], "precedence cycle " + " -> ".join(cycle + cycle[:1])))
+
+        # Mise à l'échelle: PGCD de toutes les grandeurs temporelles
+        scale = 0
+        for task_info in tasks.values():
+            scale = gcd(scale, task_info.duration, task_info.release_date, task_info.due_date)
+        for periods in unavailability.values():
+            for start, end in periods:
+                scale = gcd(scale, start, end)
+        self.scale = scale if scale > 1 else 1
+
+        # Instance resserrée et mise à l'échelle, utilisée pour construire le modèle
+        self.tasks = {
+            task_name: self.taskInfo(
+                duration=task_info.duration // self.scale,
+                successors=task_info.successors,
+                release_date=self.earliest_start.get(task_name, task_info.release_date) // self.scale,
+                due_date=self.latest_end.get(task_name, task_info.due_date) // self.scale
+            )
+            for task_name, task_info in tasks.items()
+        }
+        self.unavailability = {
+            machine: [(start // self.scale, end // self.scale) for start, end in periods]
+            for machine, periods in unavailability.items()
+        }
+
+    def propagate(self):
+        """Passes avant et arrière le long des précédences, puis détection des tâches infaisables"""
+        names = self.graph.names
+        tasks = [self.original[task_name] for task_name in names]
+        successors = self.graph.successor_lists()
+        order = self.graph.order
+
+        earliest_start = [task_info.release_date for task_info in tasks]
+        for i in order:
+            end = earliest_start[i] + tasks[i].duration
+            for j in successors[i]:
+                if earliest_start[j] < end:
+                    earliest_start[j] = end
+
+        latest_end = [task_info.due_date for task_info in tasks]
+        for i in reversed(order):
+            for j in successors[i]:
+                latest_start = latest_end[j] - tasks[j].duration
+                if latest_end[i] > latest_start:
+                    latest_end[i] = latest_start
+
+        self.earliest_start = dict(zip(names, earliest_start))
+        self.latest_end = dict(zip(names, latest_end))
+        for i in order:
+            if earliest_start[i] + tasks[i].duration > latest_end[i]:
+                self.infeasible.append((
+                    names[i],
+                    f"cannot fit between {earliest_start[i]} and {latest_end[i]}"
+                    f" (duration {tasks[i].duration})"
+                ))
+
+    def is_infeasible(self):
+        """Indique si l'instance est trivialement infaisable"""
+        return bool(self.infeasible)
+
+    def statistics(self):
+        """
+        Resserrement des domaines de début (dans les unités d'origine).
+
+        Retour:
+            dict: {domain_before, domain_after, shrink, tightened_tasks, scale, infeasible,
+                   precedences, redundant_precedences}
+                  domain_* = somme des tailles des domaines de début, shrink = part supprimée,
+                  redundant_precedences = arcs retirés par la réduction transitive
+        """
+        domain_before = domain_after = tightened = 0
+        for task_name, task_info in self.original.items():
+            before = max(0, task_info.due_date - task_info.duration - task_info.release_date + 1)
+            after = max(0, self.latest_end.get(task_name, task_info.due_date) - task_info.duration
+                        - self.earliest_start.get(task_name, task_info.release_date) + 1)
+            domain_before += before
+            domain_after += after
+            tightened += after < before
+
+        return {
+            'domain_before': domain_before,
+            'domain_after': domain_after,
+            'shrink': round(1 - domain_after / domain_before, 4) if domain_before else 0.0,
+            'tightened_tasks': tightened,
+            'scale': self.scale,
+            'infeasible': [task_name for task_name, _ in self.infeasible],
+            'precedences': self.graph.edge_count,
+            'redundant_precedences': self.graph.redundant,
+        }
@@ -0,0 +1,115 @@
+"""
+Reports Service - Données de la page de résultats et du rapport PDF
+
+Les statistiques par machine (nombre de tâches, charge, taux d'utilisation,
+temps mort) sont calculées une seule fois à la résolution et stockées dans
+Solution.machine_stats. La page de résultats et le rapport PDF lisent toutes
+les tâches en une seule requête (machine jointe) et les regroupent en Python.
+Le diagramme de Gantt de la page de résultats est dessiné par le navigateur à
+partir des colonnes de schedule_columns (lues dans l'instantané, sans requête
+sur les tâches).
+"""
+from .gantt import project_name
+
+
+def machine_statistics(assignments, machines_list, makespan):
+    """
+    Statistiques par machine d'un ordonnancement
+
+    Args:
+        assignments: {tâche: {start, end, machine, ...}} (cf. snapshot_assignments)
+        machines_list: liste des machines (ordre d'affichage)
+        makespan: durée totale du planning
+
+    Returns:
+        list: [{machine, tasks, load, utilization, idle}] dans l'ordre de machines_list
+              (utilization en %, idle = temps sans tâche entre 0 et le makespan)
+    """
+    statistics = {machine: {'machine': machine, 'tasks': 0, 'load': 0} for machine in machines_list}
+    for info in assignments.values():
+        entry = statistics.get(info['machine'])
+        if entry is not None:
+            entry['tasks'] += 1
+            entry['load'] += info['end'] - info['start']
+
+    for entry in statistics.values():
+        entry['utilization'] = round(100.0 * entry['load'] / makespan, 1) if makespan else 0.0
+        entry['idle'] = max(0, (makespan or 0) - entry['load'])
+    return list(statistics.values())
+
+
+def schedule_results(schedule, solution):
+    """
+    Tâches d'un planning résolu, groupées par machine
+
+    Args:
+        schedule: instance de Schedule
+        solution: instantané Solution du planning
+
+    Returns:
+        tuple: (tasks, machine_rows)
+            tasks: tâches triées par date de début (machine assignée jointe)
+            machine_rows: [{machine, tasks, load, utilization, idle, task_list}]
+    """
+    tasks = list(schedule.tasks.select_related('assigned_machine').order_by('start_time', 'name'))
+
+    statistics = solution.machine_stats
+    if not statistics:
+        # Instantané antérieur aux statistiques stockées: calcul depuis les affectations
+        machines_list = [machine.name for machine in schedule.machines.all()]
+        statistics = machine_statistics(solution.assignments, machines_list, solution.makespan)
+
+    task_lists = {entry['machine']: [] for entry in statistics}
+    for task in tasks:
+        if task.assigned_machine is not None and task.assigned_machine.name in task_lists:
+            task_lists[task.assigned_machine.name].append(task)
+
+    machine_rows = [dict(entry, task_list=task_lists[entry['machine']]) for entry in statistics]
+    return tasks, machine_rows
+
+
+def schedule_columns(schedule_id, solution):
+    """
+    Ordonnancement d'un instantané sous forme de colonnes (données du Gantt interactif)
+
+    Les tâches sont triées par machine puis par date de début; machine et projet
+    sont des indices dans les listes machines et projects.
+
+    Args:
+        schedule_id: ID du Schedule
+        solution: instantané Solution du planning
+
+    Returns:
+        dict: {schedule, fingerprint, makespan, objective, machines, projects,
+               tasks: {name, machine, start, end, project}}
+    """
+    if solution.machine_stats:
+        machines = [entry['machine'] for entry in solution.machine_stats]
+    else:
+        # Instantané antérieur aux statistiques stockées
+        machines = sorted({info['machine'] for info in solution.assignments.values()})
+    machine_index = {machine: i for i, machine in enumerate(machines)}
+
+    rows = sorted(
+        (machine_index[info['machine']], info['start'], info['end'], task_name)
+        for task_name, info in solution.assignments.items()
+        if info['machine'] in machine_index
+    )
+    projects = sorted({project_name(task_name) for _, _, _, task_name in rows})
+    project_index = {project: i for i, project in enumerate(projects)}
+
+    return {
+        'schedule': schedule_id,
+        'fingerprint': solution.solution_fingerprint,
+        'makespan': solution.makespan,
+        'objective': solution.objective_value,
+        'machines': machines,
+        'projects': projects,
+        'tasks': {
+            'name': [row[3] for row in rows],
+            'machine': [row[0] for row in rows],
+            'start': [row[1] for row in rows],
+            'end': [row[2] for row in rows],
+            'project': [project_index[project_name(row[3])] for row in rows],
+        },
+    }
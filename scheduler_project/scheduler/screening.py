@@ -0,0 +1,167 @@
+"""
+Screening Service - Filtrage rapide des instances avant l'appel à CP-SAT
+
+Raisonnements classiques d'ordonnancement cumulatif, en O(n log n) ou O(n·k)
+vectorisé NumPy, sur les fenêtres propagées par le présolve (cf. presolve.py):
+
+- parties obligatoires: une tâche dont la fenêtre est plus courte que deux fois
+  sa durée occupe forcément une machine sur [lf - p, es + p). Si plus de m
+  parties obligatoires se chevauchent, l'instance est infaisable;
+- raisonnement énergétique: sur un intervalle [a, b], chaque tâche dont la
+  fenêtre finit avant b consomme au moins min(p, es + p - a) unités d'énergie
+  dans [a, b]. Si la demande dépasse m·(b - a), l'instance est infaisable;
+- borne inférieure de l'objectif (somme des dates de début):
+      max(somme des dates de début au plus tôt, relaxation SPT sans dates de disponibilité)
+
+Une instance rejetée ici n'est pas envoyée au solveur: le diagnostic indique
+la fenêtre de temps en cause.
+"""
+import time
+import numpy as np
+
+from .presolve import Presolve
+
+
+# Nombre maximal de débuts d'intervalle examinés par le raisonnement énergétique
+# (réduit sur les très grandes instances pour rester de l'ordre de la seconde)
+MAX_ENERGY_WINDOWS = 2000
+ENERGY_BUDGET = 20_000_000  # tâches × intervalles
+
+
+class Screening:
+    """
+    Filtrage d'une instance: infaisabilités évidentes et borne inférieure.
+    """
+
+    def __init__(self, taskInfo, tasks, machines, presolve=None):
+        """
+        Paramètres:
+            taskInfo: namedtuple définissant la structure des tâches
+            tasks: dictionnaire des tâches {nom: taskInfo(duration, successors, release_date, due_date)}
+            machines: liste des machines disponibles
+            presolve: présolve déjà calculé (cf. presolve.py), recalculé sinon
+        """
+        started = time.perf_counter()
+        self.tasks = tasks
+        self.machines = machines
+        self.presolve = presolve or Presolve(taskInfo, tasks)
+        self.diagnoses = []  # raisons d'infaisabilité, par ordre de découverte
+        self.lower_bound = None
+
+        self.names = list(tasks)
+        count = len(self.names)
+        self.duration = np.fromiter((info.duration for info in tasks.values()), dtype=np.int64, count=count)
+        self.earliest_start = np.fromiter(
+            (self.presolve.earliest_start.get(name, info.release_date) for name, info in tasks.items()),
+            dtype=np.int64, count=count
+        )
+        self.latest_end = np.fromiter(
+            (self.presolve.latest_end.get(name, info.due_date) for name, info in tasks.items()),
+            dtype=np.int64, count=count
+        )
+
+        if self.presolve.is_infeasible():
+            self.diagnoses.extend(f"task {task}: {reason}" for task, reason in self.presolve.infeasible)
+        elif count and not machines:
+            self.diagnoses.append("no machine available")
+        elif count:
+            self.check_compulsory_parts()
+            if not self.diagnoses:
+                self.check_energy()
+            self.lower_bound = self.compute_lower_bound()
+
+        self.wall_time = time.perf_counter() - started
+
+    def check_compulsory_parts(self):
+        """
+        Profil des parties obligatoires: nombre de tâches forcément en cours à chaque instant.
+        """
+        latest_start = self.latest_end - self.duration
+        earliest_end = self.earliest_start + self.duration
+        compulsory = latest_start < earliest_end
+        if not compulsory.any():
+            return
+
+        # Événements +1 au début et -1 à la fin de chaque partie obligatoire
+        # (à date égale, les fins passent avant les débuts)
+        times = np.concatenate((latest_start[compulsory], earliest_end[compulsory]))
+        deltas = np.concatenate((np.ones(compulsory.sum(), dtype=np.int64), -np.ones(compulsory.sum(), dtype=np.int64)))
+        order = np.lexsort((deltas, times))
+        running = np.cumsum(deltas[order])
+
+        peak = int(np.argmax(running))
+        if running[peak] > len(self.machines):
+            start = int(times[order][peak])
+            end = int(times[order][peak + 1])
+            self.diagnoses.append(
+                f"between t={start} and t={end}, {int(running[peak])} tasks must run simultaneously"
+                f" but only {len(self.machines)} machine(s) are available"
+            )
+
+    def check_energy(self):
+        """
+        Raisonnement énergétique sur les intervalles [a, b], a = date de début au plus
+        tôt d'une tâche, b = date de fin au plus tard d'une tâche.
+
+        Pour a fixé, l'énergie minimale d'une tâche dans [a, b] (fenêtre terminée
+        avant b) ne dépend pas de b: une somme cumulée dans l'ordre des fins au plus
+        tard donne la demande de tous les intervalles [a, ·] en une passe.
+        """
+        capacity = len(self.machines)
+        by_end = np.argsort(self.latest_end, kind='stable')
+        latest_end = self.latest_end[by_end]
+        duration = self.duration[by_end]
+        earliest_end = (self.earliest_start + self.duration)[by_end]
+
+        starts = np.unique(self.earliest_start)
+        budget = max(1, min(MAX_ENERGY_WINDOWS, ENERGY_BUDGET // len(self.names)))
+        if len(starts) > budget:
+            starts = starts[np.linspace(0, len(starts) - 1, budget).astype(np.int64)]
+
+        worst = None
+        for a in starts.tolist():
+            # Les tâches finissant avant a ne consomment rien dans [a, b]
+            first = int(np.searchsorted(latest_end, a, side='right'))
+            if first == len(latest_end):
+                continue
+            demand = np.cumsum(np.clip(np.minimum(duration[first:], earliest_end[first:] - a), 0, None))
+            supply = capacity * (latest_end[first:] - a)
+            overload = demand - supply
+            j = int(np.argmax(overload))
+            if overload[j] > 0 and (worst is None or overload[j] > worst[0]):
+                worst = (int(overload[j]), a, int(latest_end[first + j]), int(demand[j]), int(supply[j]))
+
+        if worst is not None:
+            _, a, b, demand, supply = worst
+            self.diagnoses.append(
+                f"between t={a} and t={b}, tasks need at least {demand} time units of processing"
+                f" but {len(self.machines)} machine(s) only provide {supply}"
+            )
+
+    def compute_lower_bound(self):
+        """
+        Borne inférieure de la somme des dates de début.
+
+        - chaque tâche démarre au plus tôt à sa date de début propagée;
+        - sur m machines, la k-ième tâche d'une machine attend au moins les k - 1
+          précédentes: la somme des débuts est minimale en plaçant les tâches les
+          plus courtes en premier (SPT), tâche d'indice i dans l'ordre décroissant
+          des durées suivie de i // m tâches sur sa machine.
+        """
+        release_bound = int(self.earliest_start.sum())
+        descending = np.sort(self.duration)[::-1]
+        spt_bound = int((descending * (np.arange(len(descending)) // len(self.machines))).sum())
+        return max(release_bound, spt_bound)
+
+    def is_infeasible(self):
+        """Indique si l'instance est prouvée infaisable sans recherche"""
+        return bool(self.diagnoses)
+
+    def diagnosis(self):
+        """Diagnostic lisible (premières raisons d'infaisabilité)"""
+        if not self.diagnoses:
+            return ''
+        text = "; ".join(self.diagnoses[:3])
+        if len(self.diagnoses) > 3:
+            text += f" (+{len(self.diagnoses) - 3} more)"
+        return text
@@ -0,0 +1,13 @@
+"""
+Signaux de l'application Scheduler
+"""
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from .models import Schedule
+from .artifacts import evict_artifacts
+
+
+@receiver(post_delete, sender=Schedule)
+def evict_schedule_artifacts(sender, instance, **kwargs):
+    """Supprime les diagrammes de Gantt et rapports PDF d'un planning supprimé"""
+    evict_artifacts(instance.id)
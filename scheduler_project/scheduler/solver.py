@@ -1,59 +1,214 @@
 """
 Solver Service - Integrates OR-Tools solver with Django models
+
+Les modèles Django (et le cache de solutions qui en dépend) ne sont importés
+que par les fonctions de persistance: Machine_Parallele et les fonctions de
+calcul restent utilisables sans configurer Django (cf. batch.py).
 """
 from ortools.sat.python import cp_model
 from collections import namedtuple
-from .models import Schedule, Task, Machine
-import io
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from .presets import preset_parameters, apply_parameters
+from .artifacts import solution_fingerprint, store_gantt, evict_artifacts, gantt_path
+from .heuristic import Ordonnancement_Liste
+from .precedence import PrecedenceGraph
+from .presolve import Presolve
+from .screening import Screening
+from .reports import machine_statistics
+from .telemetry import SolveTrace
+from .gantt import render_gantt, render_gantt_png
 import base64
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import hashlib
+import heapq
+import json
+import logging
+import os
+import time
+
 
+logger = logging.getLogger(__name__)
 
 # Define taskInfo structure
 taskInfo = namedtuple("taskInfo", ["duration", "successors", "release_date", "due_date"])
 
 
+# Modes d'élimination des symétries entre machines identiques (cf. Machine_Parallele)
+SYMMETRY_MODES = ('loads', 'first_tasks', None)
+DEFAULT_SYMMETRY_MODE = 'first_tasks'
+
+# Formulations du modèle (cf. Machine_Parallele)
+FORMULATIONS = ('disjunctive', 'cumulative')
+DEFAULT_FORMULATION = 'disjunctive'
+
+
+class SolutionRecorder(cp_model.CpSolverSolutionCallback):
+    """
+    Callback CP-SAT enregistrant chaque solution améliorante (mode anytime).
+    """
+    
+    def __init__(self, scheduler, on_solution=None):
+        super().__init__()
+        self.scheduler = scheduler
+        self.on_solution = on_solution
+        self.progress = []
+    
+    def on_solution_callback(self):
+        entry = {
+            'objective': self.objective_value,
+            'bound': self.best_objective_bound,
+            'elapsed': round(self.wall_time, 3),
+        }
+        self.progress.append(entry)
+        
+        if self.on_solution is not None:
+            incumbent = lambda: self.scheduler.extract_schedule(self.value)
+            if self.on_solution(entry, incumbent):
+                self.stop_search()
+
+
 class Machine_Parallele:
     """
     Classe pour résoudre le problème d'ordonnancement sur machines parallèles non-reliées.
     Utilise le solveur CP-SAT de OR-Tools pour optimiser l'affectation des tâches aux machines.
     """
     
-    def __init__(self, taskInfo, tasks, machines):
+    def __init__(self, taskInfo, tasks, machines, time_limit=None, on_solution=None, parameters=None,
+                 hints=None, upper_bound=None, unavailability=None, symmetry_breaking='auto',
+                 formulation=DEFAULT_FORMULATION, presolve=True, solve=True):
         """
         Initialise le modèle d'ordonnancement.
         
         Paramètres:
             taskInfo: namedtuple définissant la structure des tâches
             tasks: dictionnaire des tâches {nom: taskInfo(duration, successors, release_date, due_date)}
+                   (successors: un nom, plusieurs noms séparés par des virgules, ou "none")
             machines: liste des machines disponibles
+            time_limit: budget de temps en secondes (None = jusqu'à l'optimalité)
+            on_solution: fonction appelée à chaque solution améliorante (cf. SolutionRecorder)
+            parameters: paramètres CP-SAT supplémentaires (cf. preset_parameters)
+            hints: solution précédente {nom: (start, machine)} utilisée comme point de départ
+                   (démarrage à chaud); les tâches absentes ou inconnues sont ignorées
+            upper_bound: objectif d'une solution réalisable connue (ex: heuristique par liste);
+                         CP-SAT ne cherche alors que des solutions au moins aussi bonnes
+            unavailability: périodes d'indisponibilité par machine {machine: [(début, fin), ...]}
+            symmetry_breaking: élimination des symétries entre machines identiques
+                               ('auto', 'loads', 'first_tasks' ou None, cf. SYMMETRY_MODES)
+            formulation: 'disjunctive' (une variable d'affectation et un intervalle par couple
+                         tâche/machine, n×m) ou 'cumulative' (un intervalle par tâche et une
+                         contrainte cumulative de capacité m; machines identiques uniquement,
+                         les affectations sont reconstruites par coloration d'intervalles)
+            presolve: resserrer les domaines le long des précédences et réduire l'échelle
+                      de temps avant de construire le modèle (cf. presolve.py)
+            solve: résoudre immédiatement (False = construire le modèle seulement, cf. solve())
         """
         self.taskInfo = taskInfo
         self.tasks = tasks 
         self.machines = machines
+        self.unavailability = {
+            machine: list(periods) for machine, periods in (unavailability or {}).items() if periods
+        }
+
+        # PRÉSOLVE: fenêtres resserrées le long des précédences, échelle de temps réduite
+        self.presolve = Presolve(taskInfo, tasks, self.unavailability) if presolve else None
+        self.scale = self.presolve.scale if presolve else 1
+        self.model_tasks = self.presolve.tasks if presolve else tasks
+        self.model_unavailability = self.presolve.unavailability if presolve else self.unavailability
+        self.graph = self.presolve.graph if presolve else PrecedenceGraph(tasks)
 
         # Créer le modèle CP-SAT
         self.model = cp_model.CpModel()
-
+        self.formulation = self.resolve_formulation(formulation)
+        self.hints = {}
+        
+        if self.presolve is not None and self.presolve.is_infeasible():
+            # Instance trivialement infaisable: le modèle complet n'est pas construit,
+            # CP-SAT conclut immédiatement sur un modèle vide contradictoire
+            self.start_time_vars, self.machine_vars, self.interval_vars = {}, {}, {}
+            self.symmetry_breaking = None
+            self.model.add_bool_or([])
+        else:
+            self.build_model(symmetry_breaking, upper_bound, hints)
+        
+        self.solver = cp_model.CpSolver()
+        self.status = cp_model.UNKNOWN
+        self.progress = []
+        
+        # Résoudre le modèle
+        if solve:
+            self.solve(time_limit=time_limit, on_solution=on_solution, parameters=parameters)
+    
+    def build_model(self, symmetry_breaking, upper_bound, hints):
+        """
+        Construit les variables, les contraintes et l'objectif sur l'instance présolvée
+        (self.model_tasks, à l'échelle self.scale).
+        """
         # Variables de décision: temps de début de chaque tâche
         self.start_time_vars = {
             task_name: self.model.new_int_var_from_domain(
                 cp_model.Domain.from_intervals([[task_info.release_date, task_info.due_date - task_info.duration]]),
                 f"start_{task_name}"
             )
-            for task_name, task_info in self.tasks.items()
+            for task_name, task_info in self.model_tasks.items()
         }
 
+        if self.formulation == 'cumulative':
+            self.build_cumulative()
+        else:
+            self.build_disjunctive()
+
+        # Contraintes de précédence: une tâche doit se terminer avant chacun de ses successeurs
+        # (arcs du graphe réduit: les précédences impliquées par transitivité ne sont pas posées)
+        names = self.graph.names
+        for source, target in zip(self.graph.sources.tolist(), self.graph.targets.tolist()):
+            task_name = names[source]
+            task_end = self.start_time_vars[task_name] + self.model_tasks[task_name].duration
+            self.model.Add(task_end <= self.start_time_vars[names[target]])
+
+        # Élimination des symétries entre machines identiques
+        self.symmetry_breaking = self.resolve_symmetry_mode(symmetry_breaking)
+        if self.symmetry_breaking == 'loads':
+            self.add_load_ordering()
+        elif self.symmetry_breaking == 'first_tasks':
+            self.add_first_task_ordering()
+
+        # FONCTION OBJECTIF (dans les unités d'origine: le coefficient compense la mise à l'échelle)
+        objective = self.scale * sum(self.start_time_vars[task_name] for task_name in self.model_tasks)
+        self.model.Minimize(objective)
+        
+        # BORNE SUPÉRIEURE: objectif d'une solution réalisable déjà connue
+        if upper_bound is not None:
+            self.model.Add(objective <= upper_bound)
+        
+        # DÉMARRAGE À CHAUD: la solution précédente sert d'indice à CP-SAT
+        if hints:
+            self.add_hints(hints)
+    
+    def resolve_formulation(self, formulation):
+        """
+        Détermine la formulation effectivement utilisée.
+        
+        La formulation cumulative suppose des machines interchangeables: avec des
+        périodes d'indisponibilité, le modèle disjonctif est utilisé.
+        """
+        if formulation not in FORMULATIONS:
+            raise ValueError(f"Unknown formulation: {formulation}")
+        if formulation == 'cumulative' and not self.machines_identical():
+            return 'disjunctive'
+        return formulation
+    
+    def build_disjunctive(self):
+        """
+        Formulation disjonctive: affectation explicite de chaque tâche à une machine.
+        """
         # Variables booléennes: affectation des tâches aux machines
         self.machine_vars = {
             task_name: {
                 machine: self.model.new_bool_var(f"{task_name}_on_{machine}") 
                 for machine in self.machines
             }
-            for task_name in self.tasks
+            for task_name in self.model_tasks
         }
 
         # Variables d'intervalle pour la contrainte de non-chevauchement
@@ -67,37 +222,196 @@ class Machine_Parallele:
                 )
                 for machine in self.machines
             }
-            for task_name, task_info in self.tasks.items()
+            for task_name, task_info in self.model_tasks.items()
         }
 
-        # CONTRAINTES
-        
         # 1. Chaque tâche doit être affectée à exactement une machine
         for task_name, machine_dict in self.machine_vars.items():
             self.model.add_exactly_one(machine_dict.values())
 
         # 2. Non-chevauchement: les tâches sur la même machine ne peuvent pas se chevaucher
+        #    (ni chevaucher une période d'indisponibilité de la machine)
         for machine in self.machines:
+            blocked_intervals = [
+                self.model.new_fixed_size_interval_var(start, end - start, f"blocked_{machine}_{i}")
+                for i, (start, end) in enumerate(self.model_unavailability.get(machine, []))
+            ]
             self.model.add_no_overlap([
                 self.interval_vars[task_name][machine] 
-                for task_name in self.tasks
-            ])
-
-        # 3. Contraintes de précédence: une tâche doit se terminer avant son successeur
-        for task_name, task_info in self.tasks.items():
-            if task_info.successors != "none":
-                successor_name = task_info.successors
-                task_end = self.start_time_vars[task_name] + task_info.duration
-                self.model.Add(task_end <= self.start_time_vars[successor_name])
-
-        # FONCTION OBJECTIF
-        self.model.Minimize(
-            sum(self.start_time_vars[task_name] for task_name in self.tasks)
+                for task_name in self.model_tasks
+            ] + blocked_intervals)
+    
+    def build_cumulative(self):
+        """
+        Formulation cumulative: au plus m tâches en cours à chaque instant.
+        
+        Sur machines identiques, tout profil respectant la capacité m peut être
+        réparti sur les m machines (cf. assign_machines): les n×m variables
+        d'affectation et les m contraintes de non-chevauchement sont inutiles.
+        """
+        self.machine_vars = {}
+        self.interval_vars = {
+            task_name: self.model.new_fixed_size_interval_var(
+                self.start_time_vars[task_name], task_info.duration, f"interval_{task_name}"
+            )
+            for task_name, task_info in self.model_tasks.items()
+        }
+        self.model.add_cumulative(
+            list(self.interval_vars.values()), [1] * len(self.model_tasks), len(self.machines)
         )
+    
+    def machines_identical(self):
+        """
+        Indique si les machines sont interchangeables.
         
-        # Résoudre le modèle
-        self.solver = cp_model.CpSolver()
-        self.status = self.solver.solve(self.model)
+        Les durées ne dépendent pas de la machine; les machines ne sont donc
+        distinguables que par leurs périodes d'indisponibilité.
+        """
+        return not self.unavailability
+    
+    def resolve_symmetry_mode(self, mode):
+        """
+        Détermine le mode d'élimination des symétries effectivement appliqué.
+        
+        'auto' choisit le mode par défaut; tout mode est désactivé (None) si les
+        machines ne sont pas identiques ou s'il n'y a qu'une machine.
+        """
+        if mode == 'auto':
+            mode = DEFAULT_SYMMETRY_MODE
+        if mode not in SYMMETRY_MODES:
+            raise ValueError(f"Unknown symmetry breaking mode: {mode}")
+        if len(self.machines) < 2 or not self.machines_identical() or self.formulation == 'cumulative':
+            return None
+        return mode
+    
+    def symmetry_order(self):
+        """Ordre déterministe des tâches utilisé pour l'ordre lexicographique (date de disponibilité, nom)."""
+        return sorted(self.model_tasks, key=lambda name: (self.model_tasks[name].release_date, name))
+    
+    def add_load_ordering(self):
+        """
+        Charges ordonnées: charge(m_1) >= charge(m_2) >= ... >= charge(m_k).
+        
+        Toute solution peut être ré-étiquetée en triant les machines par charge
+        décroissante: seule une permutation par classe d'équivalence subsiste
+        (aux égalités de charge près).
+        """
+        loads = [
+            sum(
+                task_info.duration * self.machine_vars[task_name][machine]
+                for task_name, task_info in self.model_tasks.items()
+            )
+            for machine in self.machines
+        ]
+        for heavier, lighter in zip(loads, loads[1:]):
+            self.model.Add(heavier >= lighter)
+    
+    def add_first_task_ordering(self):
+        """
+        Affectation lexicographique des premières tâches: la k-ième tâche
+        (cf. symmetry_order) ne peut utiliser que les machines m_1 ... m_k.
+        
+        Toute solution peut être ré-étiquetée en numérotant les machines dans
+        l'ordre de leur première tâche.
+        """
+        for k, task_name in enumerate(self.symmetry_order()[:len(self.machines) - 1]):
+            for machine in self.machines[k + 1:]:
+                self.model.Add(self.machine_vars[task_name][machine] == 0)
+    
+    def canonical_machine_labels(self, assignment):
+        """
+        Ré-étiquette les machines d'une affectation {tâche: machine} pour respecter
+        l'élimination des symétries (machines identiques: la solution reste équivalente).
+        
+        Retour:
+            dict: {ancienne_machine: nouvelle_machine}
+        """
+        if self.symmetry_breaking == 'loads':
+            loads = {machine: 0 for machine in self.machines}
+            for task_name, machine in assignment.items():
+                loads[machine] += self.tasks[task_name].duration
+            ordered = sorted(self.machines, key=lambda machine: -loads[machine])
+        elif self.symmetry_breaking == 'first_tasks':
+            ordered = []
+            for task_name in self.symmetry_order():
+                machine = assignment.get(task_name)
+                if machine is not None and machine not in ordered:
+                    ordered.append(machine)
+            ordered += [machine for machine in self.machines if machine not in ordered]
+        else:
+            return {machine: machine for machine in self.machines}
+        
+        return dict(zip(ordered, self.machines))
+    
+    def add_hints(self, hints):
+        """
+        Fournit une solution (partielle) à CP-SAT comme point de départ de la recherche.
+        
+        Paramètres:
+            hints: {nom: (start, machine)}; seules les tâches et machines existantes sont utilisées
+        """
+        hints = {
+            task_name: (start, machine) for task_name, (start, machine) in hints.items()
+            if task_name in self.tasks and machine in self.machines
+        }
+        
+        # Les machines de la solution précédente sont ré-étiquetées pour que
+        # l'indice reste compatible avec l'élimination des symétries
+        relabel = self.canonical_machine_labels(
+            {task_name: machine for task_name, (start, machine) in hints.items()}
+        )
+        
+        for task_name, (start, machine) in hints.items():
+            machine = relabel[machine]
+            
+            self.model.add_hint(self.start_time_vars[task_name], start // self.scale)
+            for other_machine, machine_var in self.machine_vars.get(task_name, {}).items():
+                self.model.add_hint(machine_var, other_machine == machine)
+            self.hints[task_name] = (start, machine)
+    
+    def hint_report(self):
+        """
+        Mesure la part de la solution précédente conservée par la nouvelle solution.
+        
+        Retour:
+            dict: {total, hinted, kept} - nombre de tâches, de tâches avec indice,
+                  et de tâches dont la date de début et la machine sont inchangées
+        """
+        schedule = self.get_schedule() or {}
+        kept = sum(
+            1 for task_name, (start, machine) in self.hints.items()
+            if task_name in schedule
+            and schedule[task_name]['start'] == start
+            and schedule[task_name]['machine'] == machine
+        )
+        return {'total': len(self.tasks), 'hinted': len(self.hints), 'kept': kept}
+    
+    def solve(self, time_limit=None, on_solution=None, parameters=None):
+        """
+        Résout le modèle en mode anytime.
+        
+        Chaque solution améliorante (objectif, borne, temps écoulé) est enregistrée
+        dans self.progress. Si time_limit est atteint, la meilleure solution trouvée
+        est conservée (statut FEASIBLE).
+        
+        Paramètres:
+            time_limit: budget de temps en secondes (None = jusqu'à l'optimalité)
+            on_solution: fonction(entry, incumbent) appelée à chaque solution améliorante;
+                         retourner True arrête la recherche
+            parameters: paramètres CP-SAT supplémentaires {nom: valeur}
+        
+        Retour:
+            int: statut CP-SAT
+        """
+        if parameters:
+            apply_parameters(self.solver.parameters, parameters)
+        if time_limit:
+            self.solver.parameters.max_time_in_seconds = float(time_limit)
+        
+        recorder = SolutionRecorder(self, on_solution)
+        self.status = self.solver.solve(self.model, recorder)
+        self.progress = recorder.progress
+        return self.status
     
     def get_schedule(self):
         """
@@ -106,17 +420,34 @@ class Machine_Parallele:
         if self.status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             return None
         
+        return self.extract_schedule(self.solver.value)
+    
+    def extract_schedule(self, value):
+        """
+        Construit l'ordonnancement à partir d'une fonction d'évaluation des variables
+        (solver.value pour la solution finale, callback.value pour une solution intermédiaire).
+        """
+        starts = {task_name: value(self.start_time_vars[task_name]) * self.scale for task_name in self.tasks}
+        
+        # Formulation cumulative: les machines sont attribuées après coup
+        if self.formulation == 'cumulative':
+            preferred = {task_name: machine for task_name, (start, machine) in self.hints.items()}
+            assignment = assign_machines(starts, self.tasks, self.machines, preferred)
+        
         schedule = {}
         for task_name, task_info in self.tasks.items():
-            start = self.solver.value(self.start_time_vars[task_name])
+            start = starts[task_name]
             end = start + task_info.duration
             
             # Trouver la machine affectée
-            assigned_machine = None
-            for machine in self.machines:
-                if self.solver.value(self.machine_vars[task_name][machine]):
-                    assigned_machine = machine
-                    break
+            if self.formulation == 'cumulative':
+                assigned_machine = assignment[task_name]
+            else:
+                assigned_machine = None
+                for machine in self.machines:
+                    if value(self.machine_vars[task_name][machine]):
+                        assigned_machine = machine
+                        break
             
             slack = task_info.due_date - end
             
@@ -148,6 +479,16 @@ class Machine_Parallele:
         """
         Génère un diagramme de Gantt et retourne l'image en base64
         """
+        image = self.render_gantt_chart()
+        if image is None:
+            return None
+        
+        return base64.b64encode(image).decode()
+    
+    def render_gantt_chart(self):
+        """
+        Génère un diagramme de Gantt et retourne les octets de l'image PNG
+        """
         if self.status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
             return None
         
@@ -155,153 +496,454 @@ class Machine_Parallele:
         if not schedule:
             return None
         
-        # Palette de couleurs
-        colors = plt.cm.tab20(range(20))
-        
-        def get_project_name(task_name):
-            parts = task_name.rsplit('_', 1)
-            if len(parts) == 2 and parts[1].isdigit():
-                return parts[0]
-            return task_name
-        
-        # Assigner couleurs aux projets
-        projects = list(set(get_project_name(task) for task in schedule.keys()))
-        project_colors = {project: colors[i % 20] for i, project in enumerate(sorted(projects))}
-        
-        # Créer la figure
-        fig, ax = plt.subplots(figsize=(14, max(6, len(self.machines) * 1.5)))
+        return render_gantt_png(schedule, self.machines)
+
+
+def assign_machines(starts, tasks, machines, preferred=None):
+    """
+    Attribue une machine à chaque tâche par coloration d'intervalles
+    
+    Les tâches sont parcourues par date de début croissante et placées sur une
+    machine libre. Le graphe d'intervalles étant parfait, m machines suffisent dès
+    que le profil respecte la capacité m (contrainte cumulative).
+    
+    Args:
+        starts: dictionnaire {tâche: date de début}
+        tasks: dictionnaire {tâche: taskInfo}
+        machines: liste des machines
+        preferred: machine préférée par tâche {tâche: machine}, utilisée si elle est libre
+                   (stabilité des affectations lors d'un démarrage à chaud)
         
-        # Grouper par machine
-        machine_tasks = {machine: [] for machine in self.machines}
-        for task_name, info in schedule.items():
-            machine_tasks[info['machine']].append((task_name, info))
+    Returns:
+        dict: {tâche: machine}
+    """
+    preferred = preferred or {}
+    machine_index = {machine: i for i, machine in enumerate(machines)}
+    free_at = [None] * len(machines)  # None = machine encore inutilisée
+    
+    # Tas des machines par date de libération; les entrées périmées sont ignorées
+    available = [(-1, i) for i in range(len(machines))]
+    
+    assignment = {}
+    for task_name in sorted(starts, key=lambda name: (starts[name], name)):
+        start = starts[task_name]
         
-        # Dessiner le diagramme
-        yticks = []
-        yticklabels = []
+        index = machine_index.get(preferred.get(task_name))
+        if index is None or (free_at[index] is not None and free_at[index] > start):
+            while True:
+                ready, index = heapq.heappop(available)
+                if ready == (-1 if free_at[index] is None else free_at[index]):
+                    break
+            if ready > start:
+                raise ValueError(f"Capacity exceeded at t={start}: no machine available for {task_name}")
         
-        for machine_idx, machine in enumerate(self.machines):
-            y_pos = machine_idx
-            tasks = sorted(machine_tasks[machine], key=lambda x: x[1]['start'])
-            
-            for task_name, info in tasks:
-                project = get_project_name(task_name)
-                task_color = project_colors[project]
-                
-                ax.barh(y_pos, info['duration'], left=info['start'], 
-                       height=0.6, color=task_color, 
-                       edgecolor='black', linewidth=1.5, alpha=0.85)
-                
-                ax.text(info['start'] + info['duration']/2, y_pos, task_name, 
-                       ha='center', va='center', fontsize=9, fontweight='bold',
-                       color='white', bbox=dict(boxstyle='round,pad=0.3', 
-                       facecolor='black', alpha=0.3, edgecolor='none'))
-            
-            yticks.append(y_pos)
-            yticklabels.append(machine)
-        
-        ax.set_yticks(yticks)
-        ax.set_yticklabels(yticklabels, fontsize=11, fontweight='bold')
-        ax.set_ylabel('Machines', fontsize=12, fontweight='bold')
-        ax.set_xlabel('Time', fontsize=12, fontweight='bold')
-        ax.set_title('Gantt Chart - Parallel Machine Scheduling', 
-                    fontsize=14, fontweight='bold')
-        
-        ax.grid(axis='x', alpha=0.4, linestyle='--')
-        ax.set_axisbelow(True)
-        
-        max_time = max(info['end'] for info in schedule.values())
-        ax.set_xlim(0, max_time * 1.05)
-        
-        # Légende
-        legend_patches = [
-            mpatches.Patch(color=project_colors[proj], label=proj, alpha=0.85) 
-            for proj in sorted(projects)
-        ]
-        ax.legend(handles=legend_patches, loc='upper right', fontsize=9, title='Projects')
+        free_at[index] = start + tasks[task_name].duration
+        heapq.heappush(available, (free_at[index], index))
+        assignment[task_name] = machines[index]
+    
+    return assignment
+
+
+# Statuts pour lesquels une solution persistée reste valable tant que l'instance ne change pas
+REUSABLE_STATUSES = ('OPTIMAL', 'INFEASIBLE')
+
+# Nombre de tâches par lot lors de l'écriture des affectations
+WRITE_BACK_BATCH_SIZE = 2000
+
+
+def solve_configuration(schedule, relative_gap):
+    """
+    Configuration de résolution dont dépend la validité d'un instantané
+    
+    Enregistrée dans Solution.statistics['configuration'] (cf. snapshot_reusable).
+    
+    Args:
+        schedule: instance de Schedule
+        relative_gap: écart relatif toléré par le préréglage (relative_gap_limit)
         
-        plt.tight_layout()
+    Returns:
+        dict: {engine, formulation, symmetry_breaking, relative_gap_limit}
+    """
+    return {
+        'engine': schedule.engine,
+        'formulation': schedule.formulation,
+        'symmetry_breaking': DEFAULT_SYMMETRY_MODE,
+        'relative_gap_limit': relative_gap,
+    }
+
+
+def snapshot_reusable(snapshot, fingerprint, configuration):
+    """
+    Indique si l'instantané persisté répond à une nouvelle demande de résolution
+    
+    L'instance doit être identique, le statut prouvé (REUSABLE_STATUSES) et la
+    résolution faite avec le même moteur, la même formulation et le même mode
+    d'élimination des symétries. Comme pour le cache (cf. cache.lookup), une
+    solution OPTIMAL obtenue avec un écart toléré plus large que celui demandé
+    n'est pas réutilisée; l'infaisabilité ne dépend pas de l'écart.
+    Les instantanés sans configuration enregistrée ne sont jamais réutilisés.
+    
+    Args:
+        snapshot: Solution persistée (ou None)
+        fingerprint: empreinte de l'instance à résoudre
+        configuration: configuration demandée (cf. solve_configuration)
         
-        # Convertir en base64
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight')
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.read()).decode()
-        plt.close(fig)
+    Returns:
+        bool
+    """
+    if (snapshot is None or snapshot.instance_fingerprint != fingerprint
+            or snapshot.solver_status not in REUSABLE_STATUSES):
+        return False
+    stored = snapshot.statistics.get('configuration')
+    if not stored or any(stored.get(key) != configuration[key]
+                         for key in ('engine', 'formulation', 'symmetry_breaking')):
+        return False
+    if snapshot.solver_status == 'INFEASIBLE':
+        return True
+    return stored.get('relative_gap_limit', 0.0) <= configuration['relative_gap_limit']
+
+
+def instance_fingerprint(tasks_dict, machines_list):
+    """
+    Calcule une empreinte stable d'une instance (tâches + machines)
+    
+    Args:
+        tasks_dict: dictionnaire {nom: taskInfo}
+        machines_list: liste des noms de machines
         
-        return image_base64
+    Returns:
+        str: empreinte SHA-256 hexadécimale
+    """
+    payload = {
+        'tasks': sorted(
+            [name, info.duration, info.successors, info.release_date, info.due_date]
+            for name, info in tasks_dict.items()
+        ),
+        'machines': list(machines_list),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
 
 
-def solve_schedule(schedule_id):
+def search_limit_text(time_limit):
+    """
+    Fin des messages de recherche interrompue sans (meilleure) solution
+    
+    Args:
+        time_limit: budget de temps en secondes (None = jusqu'à l'optimum:
+                    la recherche n'a pu être arrêtée qu'à la demande de l'utilisateur)
+    """
+    if time_limit is None:
+        return "before the search was stopped"
+    return f"within the time limit ({time_limit:g} s)"
+
+
+def available_cores():
+    """Nombre de cœurs utilisables par CP-SAT (SCHEDULER_SOLVER_CORES ou tous les cœurs)"""
+    return getattr(settings, 'SCHEDULER_SOLVER_CORES', None) or os.cpu_count() or 1
+
+
+def load_instance(schedule):
+    """
+    Convertit les tâches et machines d'un Schedule au format attendu par le solver
+    
+    Returns:
+        tuple: (tasks_dict, machines_list)
+    """
+    tasks_dict = {}
+    for task in schedule.tasks.all():
+        tasks_dict[task.name] = taskInfo(
+            duration=task.duration,
+            successors=task.successors,
+            release_date=task.release_date,
+            due_date=task.due_date
+        )
+    
+    machines_list = [m.name for m in schedule.machines.all()]
+    return tasks_dict, machines_list
+
+
+def snapshot_assignments(solution):
+    """Réduit un ordonnancement (cf. get_schedule) aux champs persistés dans l'instantané"""
+    return {
+        task_name: {
+            'start': info['start'],
+            'end': info['end'],
+            'machine': info['machine'],
+            'slack': info['slack'],
+        }
+        for task_name, info in solution.items()
+    }
+
+
+def load_hints(schedule):
+    """
+    Récupère la solution précédemment écrite sur les tâches (démarrage à chaud)
+    
+    Returns:
+        dict: {nom: (start, machine)} pour les tâches déjà planifiées
+    """
+    return {
+        name: (start_time, machine_name)
+        for name, start_time, machine_name in schedule.tasks.filter(
+            start_time__isnull=False, assigned_machine__isnull=False
+        ).values_list('name', 'start_time', 'assigned_machine__name')
+    }
+
+
+def solve_schedule(schedule_id, force=False, on_progress=None, preset=None, num_workers=None):
     """
     Résout un schedule Django et met à jour la base de données
     
+    La solution est persistée dans un instantané (Solution). Si l'instance n'a pas
+    changé depuis la dernière résolution, l'instantané est réutilisé sans relancer CP-SAT.
+    Une instance identique déjà résolue par un autre planning est servie depuis le
+    cache de solutions (cf. cache.py).
+    
+    La résolution est bornée par Schedule.time_limit (ou SCHEDULER_DEFAULT_TIME_LIMIT):
+    chaque solution améliorante est enregistrée et la meilleure solution courante est
+    persistée au fil de l'eau, de sorte qu'une résolution interrompue par le budget
+    de temps retourne quand même un ordonnancement réalisable.
+    
+    Chaque phase est chronométrée (cf. telemetry.py): les durées, la taille du modèle
+    et les statistiques CP-SAT sont stockées dans l'instantané et une ligne de
+    métriques JSON est émise sur le logger 'scheduler.solve'.
+    
     Args:
         schedule_id: ID du Schedule à résoudre
+        force: relancer le solveur même si l'instantané ou le cache sont à jour
+        on_progress: fonction(entry) appelée à chaque solution améliorante
+                     ({objective, bound, elapsed}); retourner True arrête la recherche
+        preset: préréglage CP-SAT (None = Schedule.solver_preset)
+        num_workers: nombre de threads CP-SAT (None = tous les cœurs disponibles)
         
     Returns:
-        tuple: (success: bool, message: str, gantt_chart: str or None)
+        tuple: (success: bool, message: str, solution: Solution or None)
+    """
+    trace = SolveTrace(schedule_id)
+    success, message, snapshot = solve_traced(trace, schedule_id, force, on_progress, preset, num_workers)
+    trace.log(success, message, snapshot)
+    return success, message, snapshot
+
+
+def solve_traced(trace, schedule_id, force=False, on_progress=None, preset=None, num_workers=None):
+    """
+    Corps de solve_schedule, chaque phase étant chronométrée dans trace (cf. SolveTrace)
     """
+    from .models import Schedule, Solution
+    from . import cache as solution_cache
+    
     try:
-        schedule = Schedule.objects.get(id=schedule_id)
-        
         # Récupérer les tâches et machines
-        tasks_qs = schedule.tasks.all()
-        machines_qs = schedule.machines.all()
+        with trace.phase('load'):
+            schedule = Schedule.objects.get(id=schedule_id)
+            tasks_dict, machines_list = load_instance(schedule)
+            fingerprint = instance_fingerprint(tasks_dict, machines_list)
         
-        if not tasks_qs.exists():
+        if not tasks_dict:
             return False, "No tasks found in schedule", None
         
-        if not machines_qs.exists():
+        if not machines_list:
             return False, "No machines found in schedule", None
         
-        # Convertir en format attendu par le solver
-        tasks_dict = {}
-        for task in tasks_qs:
-            tasks_dict[task.name] = taskInfo(
-                duration=task.duration,
-                successors=task.successor_name,
-                release_date=task.release_date,
-                due_date=task.due_date
-            )
+        time_limit = schedule.time_limit or getattr(settings, 'SCHEDULER_DEFAULT_TIME_LIMIT', None)
+        parameters = preset_parameters(
+            preset or schedule.solver_preset,
+            random_seed=schedule.random_seed,
+            num_workers=num_workers or available_cores()
+        )
+        relative_gap = parameters.get('relative_gap_limit', 0.0)
+        configuration = solve_configuration(schedule, relative_gap)
+        
+        # Réutiliser l'instantané si l'instance et la configuration de résolution n'ont pas changé
+        snapshot = Solution.objects.filter(schedule=schedule).first()
+        if not force and snapshot_reusable(snapshot, fingerprint, configuration):
+            trace.statistics['reused'] = True
+            if snapshot.solver_status == 'INFEASIBLE':
+                schedule.status = 'no_solution'
+                schedule.save(update_fields=['status'])
+                if snapshot.presolve.get('diagnosis'):
+                    return False, f"Infeasible instance: {snapshot.presolve['diagnosis']}.", None
+                return False, "No feasible solution found. Try adding more machines or relaxing constraints.", None
+            schedule.status = 'solved'
+            schedule.save(update_fields=['status'])
+            return True, "Schedule already solved (stored solution reused).", snapshot
+        trace.statistics['configuration'] = configuration
+        
+        canonical = solution_cache.canonical_fingerprint(tasks_dict, machines_list)
+        
+        # Filtrage sans CP-SAT: infaisabilités évidentes (raisonnement énergétique) et borne inférieure.
+        # L'heuristique reste disponible pour visualiser les retards d'une instance infaisable.
+        with trace.phase('screening'):
+            screening = Screening(taskInfo, tasks_dict, machines_list)
+        trace.statistics['engine'] = schedule.engine
+        if screening.is_infeasible() and schedule.engine != 'heuristic':
+            schedule.lower_bound = None
+            persist_no_solution(schedule, fingerprint, 'INFEASIBLE', time_limit, parameters, screening.wall_time,
+                                presolve=dict(screening.presolve.statistics(), diagnosis=screening.diagnosis()),
+                                trace=trace)
+            solution_cache.store(canonical, machines_list, None, 'INFEASIBLE', None, None, 0.0)
+            return False, f"Infeasible instance: {screening.diagnosis()}.", None
+        schedule.lower_bound = screening.lower_bound
+        
+        # Réutiliser une solution prouvée d'une instance identique (autre planning);
+        # le moteur heuristique produit toujours son propre ordonnancement
+        if not force and schedule.engine != 'heuristic':
+            with trace.phase('cache'):
+                cached, solution = solution_cache.lookup(canonical, tasks_dict, machines_list, max_gap=relative_gap)
+            if cached is not None:
+                trace.statistics['cache_hit'] = True
+                if solution is None:
+                    persist_no_solution(schedule, fingerprint, cached.solver_status, time_limit, parameters, 0.0,
+                                        trace=trace)
+                    return False, "No feasible solution found (identical instance already proven infeasible).", None
+                if cached.best_bound is not None:
+                    schedule.lower_bound = max(schedule.lower_bound, cached.best_bound)
+                snapshot = persist_solution(
+                    schedule, fingerprint, machines_list, solution,
+                    solver_status=cached.solver_status,
+                    objective_value=cached.objective_value,
+                    best_bound=cached.best_bound,
+                    progress=[],
+                    time_limit=time_limit,
+                    parameters=parameters,
+                    wall_time=0.0,
+                    trace=trace,
+                )
+                return True, "Identical instance found in the solution cache - solution reused.", snapshot
+        
+        persist_interval = getattr(settings, 'SCHEDULER_PROGRESS_INTERVAL', 1.0)
+        progress = []
+        last_persisted = [None]
+        
+        def record_solution(entry, incumbent):
+            """Enregistre une solution améliorante et persiste la meilleure solution courante"""
+            progress.append(entry)
+            try:
+                if last_persisted[0] is None or entry['elapsed'] - last_persisted[0] >= persist_interval:
+                    last_persisted[0] = entry['elapsed']
+                    current = incumbent()
+                    Solution.objects.update_or_create(schedule=schedule, defaults={
+                        'instance_fingerprint': fingerprint,
+                        'solution_fingerprint': '',
+                        'solver_status': 'FEASIBLE',
+                        'objective_value': entry['objective'],
+                        'best_bound': entry['bound'],
+                        'makespan': max(info['end'] for info in current.values()),
+                        'assignments': snapshot_assignments(current),
+                        'progress': progress,
+                        'time_limit': time_limit,
+                        'parameters': parameters,
+                        'wall_time': entry['elapsed'],
+                        'gantt_image': '',
+                        'solved_at': timezone.now(),
+                    })
+                return bool(on_progress(entry)) if on_progress is not None else False
+            except Exception:
+                # Une erreur de persistance intermédiaire ne doit pas interrompre la recherche
+                return False
+            finally:
+                # Le callback est appelé depuis un thread de CP-SAT: ne pas y laisser de connexion ouverte
+                connection.close()
         
-        machines_list = [m.name for m in machines_qs]
+        # Moteur heuristique: aperçu rapide, sans CP-SAT
+        if schedule.engine == 'heuristic':
+            return solve_heuristic(schedule, fingerprint, tasks_dict, machines_list, trace)
         
-        # Résoudre
-        solver = Machine_Parallele(taskInfo, tasks_dict, machines_list)
+        # Recherche à grand voisinage: instances trop grandes pour un modèle unique
+        if schedule.engine == 'lns':
+            return solve_lns(schedule, fingerprint, tasks_dict, machines_list,
+                             time_limit, parameters, record_solution, trace)
+        
+        # Point de départ: solution précédente, sinon ordonnancement par liste
+        hints, hint_source, upper_bound, heuristic = load_hints(schedule), 'previous', None, None
+        if not hints:
+            try:
+                with trace.phase('heuristic'):
+                    heuristic = Ordonnancement_Liste(taskInfo, tasks_dict, machines_list)
+            except ValueError:
+                heuristic = None  # précédences cycliques: CP-SAT conclura à l'infaisabilité
+            if heuristic is not None:
+                hints, hint_source = heuristic.get_hints(), 'heuristic'
+                if heuristic.is_feasible():
+                    upper_bound = heuristic.objective_value
+        
+        # Construire puis résoudre (à chaud à partir du point de départ)
+        with trace.phase('build'):
+            solver = Machine_Parallele(
+                taskInfo, tasks_dict, machines_list,
+                hints=hints, upper_bound=upper_bound, formulation=schedule.formulation, solve=False
+            )
+        with trace.phase('solve'):
+            solver.solve(time_limit=time_limit, on_solution=record_solution, parameters=parameters)
+        trace.record_solver(solver)
+        solver_status = solver.solver.status_name(solver.status)
+        presolve = solver.presolve.statistics()
+        
+        # Budget épuisé sans solution CP-SAT: la solution heuristique réalisable est conservée
+        if solver.status == cp_model.UNKNOWN and upper_bound is not None:
+            snapshot = persist_solution(
+                schedule, fingerprint, machines_list, heuristic.get_schedule(),
+                solver_status='FEASIBLE',
+                objective_value=heuristic.objective_value,
+                best_bound=None,
+                progress=[],
+                time_limit=time_limit,
+                parameters=dict(parameters, priority=heuristic.rule),
+                wall_time=solver.solver.wall_time,
+                warm_start={'total': len(tasks_dict), 'hinted': len(hints), 'kept': len(hints),
+                            'source': hint_source, 'upper_bound': upper_bound},
+                formulation=solver.formulation,
+                presolve=presolve,
+                trace=trace,
+            )
+            return True, (f"CP-SAT found no better solution {search_limit_text(time_limit)}:"
+                          f" the list-scheduling solution (objective {upper_bound}) is kept."), snapshot
         
         if solver.status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-            schedule.status = 'no_solution'
-            schedule.save()
+            persist_no_solution(schedule, fingerprint, solver_status, time_limit, parameters, solver.solver.wall_time,
+                                formulation=solver.formulation, presolve=presolve, trace=trace)
+            if solver.status == cp_model.INFEASIBLE:
+                solution_cache.store(canonical, machines_list, None, solver_status, None, None, 0.0)
+            if solver.status == cp_model.UNKNOWN:
+                return False, f"No solution found {search_limit_text(time_limit)}. Increase the time budget.", None
             return False, "No feasible solution found. Try adding more machines or relaxing constraints.", None
         
         # Récupérer la solution
-        solution = solver.get_schedule()
-        makespan = solver.get_makespan()
+        with trace.phase('extract'):
+            solution = solver.get_schedule()
+        schedule.lower_bound = max(schedule.lower_bound, solver.solver.best_objective_bound)
         
-        # Mettre à jour la base de données
-        schedule.status = 'solved'
-        schedule.makespan = makespan
-        schedule.objective_value = solver.solver.objective_value
-        schedule.save()
-        
-        # Mettre à jour les tâches avec la solution
-        for task in tasks_qs:
-            if task.name in solution:
-                info = solution[task.name]
-                task.start_time = info['start']
-                task.end_time = info['end']
-                task.slack = info['slack']
-                
-                # Trouver la machine assignée
-                machine_obj = machines_qs.get(name=info['machine'])
-                task.assigned_machine = machine_obj
-                task.save()
+        snapshot = persist_solution(
+            schedule, fingerprint, machines_list, solution,
+            solver_status=solver_status,
+            objective_value=solver.solver.objective_value,
+            best_bound=solver.solver.best_objective_bound,
+            progress=solver.progress,
+            time_limit=time_limit,
+            parameters=parameters,
+            wall_time=solver.solver.wall_time,
+            warm_start=dict(solver.hint_report(), source=hint_source, upper_bound=upper_bound),
+            formulation=solver.formulation,
+            presolve=presolve,
+            trace=trace,
+        )
         
-        # Générer le Gantt chart
-        gantt_chart = solver.generate_gantt_chart()
+        if solver.status == cp_model.OPTIMAL:
+            solution_cache.store(
+                canonical, machines_list, solution, solver_status,
+                snapshot.objective_value, snapshot.best_bound, relative_gap
+            )
         
-        return True, "Schedule solved successfully!", gantt_chart
+        if solver.status == cp_model.FEASIBLE:
+            message = f"Best solution found after {solver.solver.wall_time:.1f} s - search stopped before proving optimality."
+        else:
+            message = "Schedule solved successfully!"
+        if hint_source == 'heuristic' and upper_bound is not None:
+            message += f" Search seeded with a list-scheduling solution (objective {upper_bound})."
+        elif hint_source == 'previous' and snapshot.warm_start.get('hinted'):
+            message += (f" Warm start: {snapshot.warm_start['kept']}/{snapshot.warm_start['hinted']}"
+                        f" previously scheduled tasks kept unchanged.")
+        return True, message, snapshot
         
     except Schedule.DoesNotExist:
         return False, "Schedule not found", None
@@ -314,6 +956,281 @@ def solve_schedule(schedule_id):
         return False, f"Error solving schedule: {str(e)}", None
 
 
+def solve_heuristic(schedule, fingerprint, tasks_dict, machines_list, trace=None):
+    """
+    Résout un schedule avec l'heuristique par liste (aperçu rapide, sans CP-SAT)
+    
+    Les échéances ne sont pas garanties: les tâches en retard sont signalées
+    dans le message (marge négative).
+    
+    Args:
+        schedule: instance de Schedule
+        fingerprint: empreinte de l'instance
+        tasks_dict: dictionnaire {nom: taskInfo}
+        machines_list: liste des machines
+        trace: SolveTrace de la résolution (durées des phases, cf. telemetry.py)
+        
+    Returns:
+        tuple: (success: bool, message: str, solution: Solution)
+    """
+    trace = trace or SolveTrace(schedule.id)
+    with trace.phase('heuristic'):
+        heuristic = Ordonnancement_Liste(taskInfo, tasks_dict, machines_list)
+    
+    snapshot = persist_solution(
+        schedule, fingerprint, machines_list, heuristic.get_schedule(),
+        solver_status='HEURISTIC',
+        objective_value=heuristic.objective_value,
+        best_bound=None,
+        progress=[],
+        time_limit=None,
+        parameters={'priority': heuristic.rule},
+        wall_time=heuristic.wall_time,
+        trace=trace,
+    )
+    
+    message = f"Heuristic schedule computed in {heuristic.wall_time * 1000:.0f} ms (priority rule: {heuristic.rule})."
+    late = heuristic.late_tasks()
+    if late:
+        message += f" {late} task(s) finish after their due date - solve with CP-SAT for a feasible schedule."
+    return True, message, snapshot
+
+
+def solve_lns(schedule, fingerprint, tasks_dict, machines_list, time_limit, parameters, on_solution, trace=None):
+    """
+    Résout un schedule par recherche à grand voisinage (cf. lns.py)
+    
+    Args:
+        schedule: instance de Schedule
+        fingerprint: empreinte de l'instance
+        tasks_dict: dictionnaire {nom: taskInfo}
+        machines_list: liste des machines
+        time_limit: budget de temps total (secondes); None = lns.DEFAULT_TIME_LIMIT,
+                    la recherche à grand voisinage n'ayant pas d'autre critère d'arrêt
+        parameters: paramètres CP-SAT des sous-problèmes
+        on_solution: fonction(entry, incumbent) appelée à chaque amélioration
+        trace: SolveTrace de la résolution (durées des phases, cf. telemetry.py)
+        
+    Returns:
+        tuple: (success: bool, message: str, solution: Solution or None)
+    """
+    from .lns import LNS_Machine_Parallele, DEFAULT_TIME_LIMIT  # import local: lns.py dépend de ce module
+    
+    time_limit = time_limit or DEFAULT_TIME_LIMIT
+    trace = trace or SolveTrace(schedule.id)
+    with trace.phase('solve'):
+        lns = LNS_Machine_Parallele(
+            taskInfo, tasks_dict, machines_list,
+            time_limit=time_limit, on_solution=on_solution, parameters=parameters,
+            hints=load_hints(schedule), seed=schedule.random_seed or 0
+        )
+    solver_status = cp_model.CpSolver().status_name(lns.status)
+    statistics = lns.statistics()
+    trace.statistics.update(wall_time=round(lns.wall_time, 4), lns=statistics)
+    
+    if lns.status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        persist_no_solution(schedule, fingerprint, solver_status, time_limit, parameters, lns.wall_time,
+                            trace=trace)
+        return False, f"No solution found {search_limit_text(time_limit)}. Increase the time budget.", None
+    
+    snapshot = persist_solution(
+        schedule, fingerprint, machines_list, lns.get_schedule(),
+        solver_status=solver_status,
+        objective_value=lns.objective_value,
+        best_bound=None,
+        progress=lns.progress,
+        time_limit=time_limit,
+        parameters=dict(parameters, lns=statistics),
+        wall_time=lns.wall_time,
+        trace=trace,
+    )
+    
+    message = (f"Large neighborhood search: objective {lns.objective_value} after {statistics['iterations']}"
+               f" iteration(s), {statistics['improvements']} improvement(s).")
+    return True, message, snapshot
+
+
+def persist_solution(schedule, fingerprint, machines_list, solution, solver_status,
+                     objective_value, best_bound, progress, time_limit, parameters, wall_time,
+                     warm_start=None, formulation='', presolve=None, trace=None):
+    """
+    Écrit une solution dans la base: planning, tâches et instantané
+    
+    Le planning, les affectations des tâches (cf. write_assignments) et l'instantané
+    sont écrits dans une seule transaction; la durée de l'écriture des affectations
+    est enregistrée dans Solution.timings['write_back'], avec les durées des phases
+    précédentes de trace.
+    
+    Args:
+        schedule: instance de Schedule
+        fingerprint: empreinte de l'instance résolue
+        machines_list: liste des machines (ordre des lignes du Gantt)
+        solution: ordonnancement {tâche: {start, end, duration, machine, slack, ...}}
+        solver_status, objective_value, best_bound, progress, time_limit, parameters, wall_time:
+            informations de résolution stockées dans l'instantané
+        warm_start: bilan du démarrage à chaud {total, hinted, kept, source, upper_bound}
+                    (cf. hint_report; source = 'previous' ou 'heuristic')
+        formulation: formulation du modèle utilisée ('' = solution issue du cache)
+        presolve: bilan du présolve (cf. Presolve.statistics)
+        trace: SolveTrace de la résolution (durées des phases et statistiques du solveur)
+        
+    Returns:
+        Solution: l'instantané persisté
+    """
+    from .models import Solution
+    
+    makespan = max(info['end'] for info in solution.values())
+    
+    assignments = snapshot_assignments(solution)
+    solution_fp = solution_fingerprint(fingerprint, assignments)
+    
+    # Le Gantt est dessiné par le navigateur (cf. schedule_columns): l'image n'est rendue
+    # qu'à la demande (rapport PDF, téléchargement); les versions précédentes sont évincées
+    evict_artifacts(schedule.id, keep=solution_fp)
+    
+    # Mettre à jour la base de données en une seule transaction
+    with transaction.atomic():
+        schedule.status = 'solved'
+        schedule.makespan = makespan
+        schedule.objective_value = objective_value
+        schedule.save()
+        
+        # Écriture des affectations: une requête pour les machines, une pour les tâches,
+        # puis une seule requête UPDATE préparée exécutée par lots
+        started = time.perf_counter()
+        machine_ids = dict(schedule.machines.values_list('name', 'id'))
+        rows = []
+        for task_id, task_name in schedule.tasks.values_list('id', 'name'):
+            info = solution.get(task_name)
+            if info is not None:
+                rows.append((info['start'], info['end'], info['slack'], machine_ids[info['machine']], task_id))
+        write_assignments(rows)
+        write_back = round(time.perf_counter() - started, 4)
+        if trace is not None:
+            trace.timings['write_back'] = write_back
+        
+        # Persister l'instantané de la solution
+        snapshot, _ = Solution.objects.update_or_create(schedule=schedule, defaults={
+            'instance_fingerprint': fingerprint,
+            'solution_fingerprint': solution_fp,
+            'solver_status': solver_status,
+            'objective_value': objective_value,
+            'best_bound': best_bound,
+            'makespan': makespan,
+            'assignments': assignments,
+            'progress': progress,
+            'time_limit': time_limit,
+            'parameters': parameters,
+            'wall_time': wall_time,
+            'warm_start': warm_start or {},
+            'formulation': formulation,
+            'presolve': presolve or {},
+            'timings': dict(trace.timings if trace else {}, write_back=write_back),
+            'statistics': trace.statistics if trace else {},
+            'machine_stats': machine_statistics(assignments, machines_list, makespan),
+            'gantt_image': '',
+            'solved_at': timezone.now(),
+        })
+    return snapshot
+
+
+def write_assignments(rows):
+    """
+    Écrit les affectations des tâches par lots de WRITE_BACK_BATCH_SIZE
+    
+    Task.objects.bulk_update construit une expression CASE par champ et par lot:
+    sur de grands plannings ce coût dépasse celui des sauvegardes individuelles.
+    Une requête UPDATE paramétrée exécutée avec executemany évite ce surcoût.
+    
+    Args:
+        rows: liste de tuples (start_time, end_time, slack, assigned_machine_id, task_id)
+    """
+    from .models import Task
+    
+    quote = connection.ops.quote_name
+    meta = Task._meta
+    columns = [meta.get_field(name).column for name in ('start_time', 'end_time', 'slack', 'assigned_machine')]
+    sql = (f"UPDATE {quote(meta.db_table)} SET "
+           + ", ".join(f"{quote(column)} = %s" for column in columns)
+           + f" WHERE {quote(meta.pk.column)} = %s")
+    with connection.cursor() as cursor:
+        for i in range(0, len(rows), WRITE_BACK_BATCH_SIZE):
+            cursor.executemany(sql, rows[i:i + WRITE_BACK_BATCH_SIZE])
+
+
+def persist_no_solution(schedule, fingerprint, solver_status, time_limit, parameters, wall_time,
+                        formulation='', presolve=None, trace=None):
+    """Enregistre l'absence de solution (infaisable ou budget de temps épuisé)"""
+    from .models import Solution
+    
+    schedule.status = 'no_solution'
+    schedule.save()
+    Solution.objects.update_or_create(schedule=schedule, defaults={
+        'instance_fingerprint': fingerprint,
+        'solution_fingerprint': '',
+        'solver_status': solver_status,
+        'objective_value': None,
+        'best_bound': None,
+        'makespan': None,
+        'assignments': {},
+        'machine_stats': [],
+        'progress': [],
+        'time_limit': time_limit,
+        'parameters': parameters,
+        'formulation': formulation,
+        'presolve': presolve or {},
+        'wall_time': wall_time,
+        'timings': dict(trace.timings) if trace else {},
+        'statistics': trace.statistics if trace else {},
+        'gantt_image': '',
+        'solved_at': timezone.now(),
+    })
+    evict_artifacts(schedule.id)
+
+
+def ensure_gantt_chart(snapshot, image_format='png'):
+    """
+    Garantit que le diagramme de Gantt d'un instantané existe sur disque
+    
+    Le diagramme est rendu depuis les affectations persistées (sans CP-SAT) à la
+    première demande (rapport PDF, téléchargement de l'image), puis à nouveau
+    seulement si le fichier a disparu (MEDIA_ROOT purgé, restauration de base...).
+    
+    Args:
+        snapshot: instance de Solution
+        image_format: 'png' (diagramme de référence, enregistré dans l'instantané) ou 'svg'
+        
+    Returns:
+        str: chemin du fichier relatif à MEDIA_ROOT, ou '' si aucune solution
+    """
+    # Diagramme déjà rendu: les affectations (éventuellement différées) ne sont pas lues
+    if image_format == 'png' and snapshot.gantt_image and gantt_path(snapshot.gantt_image).exists():
+        return snapshot.gantt_image
+    
+    if not snapshot.assignments:
+        return ''
+    
+    if not snapshot.solution_fingerprint:
+        snapshot.solution_fingerprint = solution_fingerprint(
+            snapshot.instance_fingerprint, snapshot.assignments
+        )
+        snapshot.save(update_fields=['solution_fingerprint'])
+    
+    machines_list = [m.name for m in snapshot.schedule.machines.all()]
+    started = time.perf_counter()
+    gantt_image = store_gantt(
+        snapshot.schedule_id, snapshot.solution_fingerprint,
+        lambda: render_gantt(snapshot.assignments, machines_list, image_format),
+        extension=image_format
+    )
+    if image_format == 'png':
+        # Durée du rendu (ou de la lecture du fichier déjà présent), cf. telemetry.py
+        snapshot.gantt_image = gantt_image
+        snapshot.timings = dict(snapshot.timings, gantt=round(time.perf_counter() - started, 4))
+        snapshot.save(update_fields=['gantt_image', 'timings'])
+    return gantt_image
+
+
 def parse_csv_file(file_path):
     """
     Parse un fichier CSV et retourne les tâches et machines
@@ -324,30 +1241,23 @@ def parse_csv_file(file_path):
     Returns:
         tuple: (tasks_dict, machines_list) or (None, None) si erreur
     """
-    import csv
+    from .ingest import CSVStream, CSVIngestError
     
     try:
-        tasks_dict = {}
-        machines_list = []
-        
-        with open(file_path, 'r', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            for row in reader:
-                if row['task_name'] == 'MACHINES':
-                    machines_list = row['duration'].split(',')
-                    break
-                
-                if row['task_name']:  # Ignorer les lignes vides
-                    tasks_dict[row['task_name']] = {
-                        'duration': int(row['duration']),
-                        'successor_name': row['successors'],
-                        'release_date': int(row['release_date']),
-                        'due_date': int(row['due_date'])
-                    }
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            stream = CSVStream(csvfile)
+            tasks_dict = {
+                name: {
+                    'duration': duration,
+                    'successors': successors,
+                    'release_date': release_date,
+                    'due_date': due_date
+                }
+                for _, name, duration, successors, release_date, due_date in stream
+            }
         
-        return tasks_dict, machines_list
+        return tasks_dict, stream.machines
         
-    except Exception as e:
-        print(f"Error parsing CSV: {e}")
+    except (OSError, UnicodeDecodeError, CSVIngestError) as e:
+        logger.warning("Error parsing CSV %s: %s", file_path, e)
         return None, None
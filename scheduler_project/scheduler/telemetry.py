@@ -0,0 +1,102 @@
+"""
+Telemetry Service - Durées des phases et statistiques des résolutions
+
+Chaque résolution (solve_schedule) est chronométrée phase par phase:
+
+    load        lecture des tâches et machines (ORM) et empreinte de l'instance
+    screening   présolve et filtrage (cf. screening.py)
+    cache       recherche dans le cache de solutions
+    heuristic   ordonnancement par liste (point de départ de CP-SAT ou moteur seul)
+    build       construction du modèle CP-SAT
+    solve       recherche CP-SAT (ou LNS)
+    extract     reconstruction de l'ordonnancement (get_schedule)
+    write_back  écriture des affectations en base (cf. persist_solution)
+    gantt       rendu du diagramme PNG (à la première demande, cf. ensure_gantt_chart)
+
+Les durées sont stockées dans Solution.timings, la taille du modèle et les
+statistiques CP-SAT dans Solution.statistics. Une ligne JSON par résolution
+est émise sur le logger 'scheduler.solve' pour la collecte de métriques.
+"""
+from contextlib import contextmanager
+import json
+import logging
+import time
+
+
+logger = logging.getLogger('scheduler.solve')
+
+
+class SolveTrace:
+    """
+    Durées des phases et statistiques d'une résolution
+    """
+
+    def __init__(self, schedule_id):
+        self.schedule_id = schedule_id
+        self.started = time.perf_counter()
+        self.timings = {}     # {phase: secondes}
+        self.statistics = {}  # taille du modèle et statistiques du solveur
+
+    @contextmanager
+    def phase(self, name):
+        """Chronomètre un bloc (les durées d'une même phase s'additionnent)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(self.timings.get(name, 0.0) + time.perf_counter() - started, 4)
+
+    def record_solver(self, solver):
+        """Taille du modèle et statistiques CP-SAT d'une résolution Machine_Parallele"""
+        self.statistics.update(solver_statistics(solver))
+
+    def log(self, success, message, snapshot=None):
+        """
+        Émet la ligne de métriques de la résolution (JSON sur une ligne)
+
+        Args:
+            success, message: résultat de solve_schedule
+            snapshot: instantané Solution persisté (None si aucune solution)
+        """
+        record = {
+            'event': 'solve',
+            'schedule': self.schedule_id,
+            'success': success,
+            'status': snapshot.solver_status if snapshot is not None else None,
+            'objective': snapshot.objective_value if snapshot is not None else None,
+            'total': round(time.perf_counter() - self.started, 4),
+            'timings': self.timings,
+            'statistics': self.statistics,
+        }
+        if not success:
+            record['message'] = message
+        logger.info(json.dumps(record, sort_keys=True), extra={'solve': record})
+
+
+def solver_statistics(solver):
+    """
+    Taille du modèle et statistiques de recherche CP-SAT
+
+    Args:
+        solver: instance de Machine_Parallele (résolue)
+
+    Returns:
+        dict: {variables, constraints, conflicts, branches, wall_time, best_bound, gap}
+              (gap = écart relatif entre l'objectif et la meilleure borne, None sans solution)
+    """
+    proto = solver.model.proto
+    cp_solver = solver.solver
+    statistics = {
+        'variables': len(proto.variables),
+        'constraints': len(proto.constraints),
+        'conflicts': cp_solver.num_conflicts,
+        'branches': cp_solver.num_branches,
+        'wall_time': round(cp_solver.wall_time, 4),
+        'best_bound': None,
+        'gap': None,
+    }
+    if cp_solver.status_name(solver.status) in ('OPTIMAL', 'FEASIBLE'):
+        objective, bound = cp_solver.objective_value, cp_solver.best_objective_bound
+        statistics['best_bound'] = bound
+        statistics['gap'] = round(abs(objective - bound) / max(1.0, abs(objective)), 6)
+    return statistics
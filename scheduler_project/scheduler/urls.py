@@ -16,6 +16,12 @@ urlpatterns = [
     path('schedule/<int:schedule_id>/task/<int:task_id>/delete/', views.delete_task, name='delete_task'),
     path('schedule/<int:schedule_id>/solve/', views.solve, name='solve'),
     path('schedule/<int:schedule_id>/results/', views.results, name='results'),
+    path('schedule/<int:schedule_id>/gantt/<str:fingerprint>.png', views.gantt_chart, name='gantt_chart'),
+    path('schedule/<int:schedule_id>/gantt/<str:fingerprint>.svg', views.gantt_chart,
+         {'image_format': 'svg'}, name='gantt_chart_svg'),
+    path('schedule/<int:schedule_id>/schedule.json', views.schedule_data, name='schedule_data'),
     path('schedule/<int:schedule_id>/export-pdf/', views.export_pdf, name='export_pdf'),
+    path('job/<int:job_id>/status/', views.job_status, name='job_status'),
+    path('job/<int:job_id>/stop/', views.stop_job, name='stop_job'),
     path('schedule/<int:schedule_id>/delete/', views.delete_schedule, name='delete_schedule'),
 ]
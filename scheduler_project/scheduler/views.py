@@ -3,20 +3,74 @@ Vues pour l'application de planification de tâches
 """
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.http import HttpResponse, FileResponse
-from .models import Schedule, Task, Machine, UploadedFile
-from .forms import CSVUploadForm, TaskForm, MachineForm, ScheduleNameForm
-from .solver import solve_schedule, parse_csv_file
-from .pdf_export import generate_pdf_report
+from django.http import HttpResponseNotModified, FileResponse, Http404, JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_POST
+from django.db import transaction
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.conf import settings
+from .models import Schedule, Task, Machine, Solution, SolveJob, UploadedFile
+from .forms import CSVUploadForm, TaskForm, MachineForm, ScheduleNameForm, SolveOptionsForm
+from .solver import ensure_gantt_chart
+from .ingest import ingest_csv, CSVIngestError
+from .artifacts import gantt_path
+from .jobs import enqueue_solve, request_stop, recover_orphaned_jobs
+from .pdf_export import ensure_pdf_report
+from .reports import schedule_results, schedule_columns
 import os
 
 
+# Type MIME des diagrammes de Gantt servis
+GANTT_CONTENT_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+
 def index(request):
     """
     Page d'accueil - affiche la liste des plannings
+    
+    Pagination par clé (created_at, id): ?after=<id> affiche les plannings plus
+    anciens que celui-ci, en une requête indexée quelle que soit la profondeur.
+    Les nombres de tâches et de machines sont calculés dans la même requête.
     """
-    schedules = Schedule.objects.all()
-    return render(request, 'scheduler/index.html', {'schedules': schedules})
+    page_size = getattr(settings, 'SCHEDULER_INDEX_PAGE_SIZE', 50)
+    schedules = Schedule.objects.annotate(
+        task_count=count_subquery(Task),
+        machine_count=count_subquery(Machine),
+    ).order_by('-created_at', '-id')
+    
+    after = request.GET.get('after', '')
+    cursor = Schedule.objects.filter(id=after).values('created_at', 'id').first() if after.isdigit() else None
+    if cursor is not None:
+        schedules = schedules.filter(
+            Q(created_at__lt=cursor['created_at']) | Q(created_at=cursor['created_at'], id__lt=cursor['id'])
+        )
+    
+    # Un élément de plus que la page pour savoir s'il existe une page suivante
+    schedules = list(schedules[:page_size + 1])
+    next_after = schedules[page_size - 1].id if len(schedules) > page_size else None
+    schedules = schedules[:page_size]
+    
+    summary = Schedule.objects.aggregate(
+        total=Count('id'),
+        solved=Count('id', filter=Q(status='solved')),
+    )
+    summary['average_tasks'] = round(Task.objects.count() / summary['total']) if summary['total'] else 0
+    
+    return render(request, 'scheduler/index.html', {
+        'schedules': schedules,
+        'summary': summary,
+        'next_after': next_after,
+        'paginated': cursor is not None,
+    })
+
+
+def count_subquery(model):
+    """Sous-requête comptant les lignes de model rattachées au planning courant"""
+    return Coalesce(Subquery(
+        model.objects.filter(schedule=OuterRef('pk')).order_by().values('schedule')
+        .annotate(count=Count('id')).values('count')
+    ), 0)
 
 
 def create_schedule_choice(request):
@@ -33,40 +87,29 @@ def upload_csv(request):
     if request.method == 'POST':
         form = CSVUploadForm(request.POST, request.FILES)
         if form.is_valid():
-            # Créer le planning
+            # Créer le planning et importer le CSV en une seule transaction
             schedule_name = form.cleaned_data.get('schedule_name') or f"Planning {Schedule.objects.count() + 1}"
-            schedule = Schedule.objects.create(name=schedule_name)
-            
-            # Sauvegarder le fichier téléchargé
             uploaded_file = form.save(commit=False)
-            uploaded_file.schedule = schedule
-            uploaded_file.save()
-            
-            # Parser le CSV
-            file_path = uploaded_file.file.path
-            tasks_dict, machines_list = parse_csv_file(file_path)
-            
-            if tasks_dict is None or machines_list is None:
-                messages.error(request, "Erreur lors de l'analyse du fichier CSV. Veuillez vérifier le format.")
-                schedule.delete()
+            try:
+                with transaction.atomic():
+                    schedule = Schedule.objects.create(name=schedule_name)
+                    
+                    # Sauvegarder le fichier téléchargé
+                    uploaded_file.schedule = schedule
+                    uploaded_file.save()
+                    
+                    # Importer les tâches et machines (lecture en flux, insertions groupées)
+                    report = ingest_csv(schedule, uploaded_file.file.path)
+            except CSVIngestError as e:
+                uploaded_file.file.delete(save=False)
+                messages.error(request, f"Erreur dans le fichier CSV, ligne {e.line} : {e.message}")
                 return redirect('upload_csv')
             
-            # Créer les machines
-            for machine_name in machines_list:
-                Machine.objects.create(schedule=schedule, name=machine_name.strip())
-            
-            # Créer les tâches
-            for task_name, task_data in tasks_dict.items():
-                Task.objects.create(
-                    schedule=schedule,
-                    name=task_name,
-                    duration=task_data['duration'],
-                    successor_name=task_data['successor_name'],
-                    release_date=task_data['release_date'],
-                    due_date=task_data['due_date']
-                )
-            
-            messages.success(request, f"CSV téléchargé avec succès ! {len(tasks_dict)} tâches et {len(machines_list)} machines chargées.")
+            messages.success(
+                request,
+                f"CSV téléchargé avec succès ! {report['tasks']} tâches et {report['machines']} machines chargées"
+                f" en {report['elapsed']:.2f} s ({report['rows_per_second']:.0f} lignes/s)."
+            )
             return redirect('schedule_detail', schedule_id=schedule.id)
     else:
         form = CSVUploadForm()
@@ -138,10 +181,13 @@ def add_tasks(request, schedule_id):
     Ajouter des tâches à un planning
     """
     schedule = get_object_or_404(Schedule, id=schedule_id)
+    form = TaskForm()
     
     if request.method == 'POST':
         if 'add_task' in request.POST:
             form = TaskForm(request.POST)
+            if form.is_valid() and schedule.tasks.filter(name=form.cleaned_data['name']).exists():
+                form.add_error('name', "Une tâche porte déjà ce nom dans ce planning.")
             if form.is_valid():
                 task = form.save(commit=False)
                 task.schedule = schedule
@@ -155,7 +201,6 @@ def add_tasks(request, schedule_id):
             else:
                 return redirect('schedule_detail', schedule_id=schedule.id)
     
-    form = TaskForm()
     tasks = schedule.tasks.all()
     
     return render(request, 'scheduler/add_tasks.html', {
@@ -186,7 +231,8 @@ def schedule_detail(request, schedule_id):
     return render(request, 'scheduler/schedule_detail.html', {
         'schedule': schedule,
         'tasks': tasks,
-        'machines': machines
+        'machines': machines,
+        'solve_form': SolveOptionsForm(instance=schedule)
     })
 
 
@@ -196,65 +242,161 @@ def solve(request, schedule_id):
     """
     schedule = get_object_or_404(Schedule, id=schedule_id)
     
-    success, message, gantt_chart = solve_schedule(schedule_id)
+    if request.method == 'POST':
+        form = SolveOptionsForm(request.POST, instance=schedule)
+        if not form.is_valid():
+            messages.error(request, "Options de résolution invalides.")
+            return redirect('schedule_detail', schedule_id=schedule_id)
+        form.save()
     
-    if success:
-        messages.success(request, message)
-        return redirect('results', schedule_id=schedule_id)
-    else:
-        messages.error(request, message)
-        return redirect('schedule_detail', schedule_id=schedule_id)
+    # La résolution est exécutée en arrière-plan: la requête rend la main immédiatement
+    enqueue_solve(schedule)
+    messages.info(request, "Résolution lancée en arrière-plan.")
+    return redirect('results', schedule_id=schedule_id)
 
 
 def results(request, schedule_id):
     """
     Afficher les résultats de l'ordonnancement avec le diagramme de Gantt
     """
+    recover_orphaned_jobs()
     schedule = get_object_or_404(Schedule, id=schedule_id)
+    job = schedule.jobs.first()
     
-    if schedule.status != 'solved':
-        messages.warning(request, "Ce planning n'a pas encore été résolu.")
-        return redirect('schedule_detail', schedule_id=schedule_id)
-    
-    # Re-résoudre pour obtenir le diagramme de Gantt
-    success, message, gantt_chart = solve_schedule(schedule_id)
+    # Résolution en cours: la page interroge job_status et se recharge à la fin
+    if schedule.status in ('queued', 'running') and job is not None and job.is_active:
+        return render(request, 'scheduler/solving.html', {
+            'schedule': schedule,
+            'job': job
+        })
     
-    tasks = schedule.tasks.all().order_by('start_time')
-    machines = schedule.machines.all()
+    solution = Solution.objects.filter(schedule=schedule).first()
+    if schedule.status != 'solved' or solution is None:
+        if job is not None and job.status == 'failed':
+            messages.error(request, job.message)
+        else:
+            messages.warning(request, "Ce planning n'a pas encore été résolu.")
+        return redirect('schedule_detail', schedule_id=schedule_id)
     
-    # Grouper les tâches par machine
-    machine_assignments = {}
-    for machine in machines:
-        machine_assignments[machine.name] = tasks.filter(assigned_machine=machine).order_by('start_time')
+    # Le diagramme de Gantt est dessiné par le navigateur (cf. schedule_data): aucun rendu ici
+    # Toutes les tâches en une requête, groupées par machine avec les statistiques stockées
+    tasks, machine_rows = schedule_results(schedule, solution)
     
     return render(request, 'scheduler/results.html', {
         'schedule': schedule,
         'tasks': tasks,
-        'machines': machines,
-        'machine_assignments': machine_assignments,
-        'gantt_chart': gantt_chart
+        'machine_rows': machine_rows,
+        'solution': solution,
+        'gantt_url': solution.gantt_url,
+        'gantt_svg_url': solution.gantt_svg_url,
+        'schedule_data_url': reverse('schedule_data', args=[schedule.id]) if solution.solution_fingerprint else ''
+    })
+
+
+def job_status(request, job_id):
+    """
+    Statut d'un job de résolution (JSON, interrogé par la page de résultats)
+    """
+    recover_orphaned_jobs()
+    job = get_object_or_404(SolveJob.objects.select_related('schedule'), id=job_id)
+    
+    return JsonResponse({
+        'id': job.id,
+        'schedule_id': job.schedule_id,
+        'status': job.status,
+        'schedule_status': job.schedule.status,
+        'message': job.message,
+        'created_at': job.created_at.isoformat(),
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'solutions_found': len(job.progress),
+        'best': job.progress[-1] if job.progress else None,
+        'results_url': reverse('results', args=[job.schedule_id]),
     })
 
 
+@require_POST
+def stop_job(request, job_id):
+    """
+    Accepter la meilleure solution trouvée jusqu'ici et arrêter la recherche
+    """
+    job = get_object_or_404(SolveJob, id=job_id)
+    if job.is_active:
+        request_stop(job.id)
+    return JsonResponse({'id': job.id, 'status': job.status, 'stop_requested': job.is_active})
+
+
 def export_pdf(request, schedule_id):
     """
     Exporter les résultats du planning en PDF
     """
     schedule = get_object_or_404(Schedule, id=schedule_id)
     
-    if schedule.status != 'solved':
+    # Les affectations (volumineuses) ne sont lues que si le diagramme doit être re-rendu
+    solution = Solution.objects.filter(schedule=schedule).defer('assignments', 'progress').first()
+    if schedule.status != 'solved' or solution is None:
         messages.error(request, "Impossible d'exporter un planning non résolu.")
         return redirect('schedule_detail', schedule_id=schedule_id)
     
-    # Générer le diagramme de Gantt
-    success, message, gantt_chart = solve_schedule(schedule_id)
+    # Rapport généré une fois par version de la solution, puis servi depuis le disque
+    gantt_image = ensure_gantt_chart(solution)
+    report = ensure_pdf_report(schedule, solution, gantt_image)
+    
+    return FileResponse(
+        open(report, 'rb'), as_attachment=True,
+        filename=f"planning_{schedule.id}_{schedule.name}.pdf", content_type='application/pdf'
+    )
+
+
+def gantt_chart(request, schedule_id, fingerprint, image_format='png'):
+    """
+    Servir le diagramme de Gantt d'une solution
+    
+    L'URL contient l'empreinte de la solution: son contenu ne change jamais,
+    le navigateur peut donc la garder en cache indéfiniment. La version SVG
+    (vectorielle, pour les grandes instances) est rendue à la première demande.
+    """
+    solution = get_object_or_404(
+        Solution, schedule_id=schedule_id, solution_fingerprint=fingerprint
+    )
     
-    # Générer le PDF
-    pdf_buffer = generate_pdf_report(schedule, gantt_chart)
+    etag = f'"{fingerprint}"' if image_format == 'png' else f'"{fingerprint}-{image_format}"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        gantt_image = ensure_gantt_chart(solution, image_format)
+        if not gantt_image:
+            raise Http404("Aucun diagramme de Gantt pour cette solution")
+        response = FileResponse(open(gantt_path(gantt_image), 'rb'), content_type=GANTT_CONTENT_TYPES[image_format])
     
-    response = HttpResponse(pdf_buffer.getvalue(), content_type='application/pdf')
-    response['Content-Disposition'] = f'attachment; filename="planning_{schedule.id}_{schedule.name}.pdf"'
+    response['ETag'] = etag
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+
+def schedule_data(request, schedule_id):
+    """
+    Ordonnancement résolu en colonnes JSON (diagramme de Gantt interactif)
+    
+    L'ETag est l'empreinte de la solution: une requête conditionnelle reçoit
+    un 304 sans que les affectations ne soient lues.
+    """
+    solution = get_object_or_404(
+        Solution.objects.only('id', 'schedule_id', 'solution_fingerprint'), schedule_id=schedule_id
+    )
+    if not solution.solution_fingerprint:
+        raise Http404("Aucune solution pour ce planning")
+    
+    etag = f'"{solution.solution_fingerprint}-json"'
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        solution = Solution.objects.defer('progress').get(id=solution.id)
+        response = JsonResponse(schedule_columns(schedule_id, solution), json_dumps_params={'separators': (',', ':')})
     
+    # L'URL ne change pas entre deux résolutions: le navigateur revalide à chaque affichage
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'
     return response
 
 